@@ -0,0 +1,5 @@
+"""
+Benchmark scripts for the Personal Digital Library.
+
+Run each module directly, e.g. python -m benchmarks.memory_footprint
+"""
@@ -0,0 +1,58 @@
+"""
+Load benchmark: publications per second for strict and trusted deserialization.
+
+Snapshot records are generated once with to_dict(), then rebuilt into a
+Collection with Collection.from_dict in both modes.
+
+Usage:
+    python -m benchmarks.load_throughput [count]
+"""
+
+import sys
+import time
+from datetime import date, timedelta
+from src.models import Book, Magazine, Annotation, Collection
+
+
+def build_records(count: int):
+    """Create snapshot records for a mix of read, reading and unread publications."""
+    records = []
+    first_day = date(2020, 1, 1)
+    for pub_id in range(1, count + 1):
+        if pub_id % 5 == 0:
+            pub = Magazine(pub_id, f"Revista {pub_id}", "Vários", "Abril", 2015, "Ciência", 80, issue_number=pub_id)
+        else:
+            pub = Book(pub_id, f"Livro {pub_id}", f"Autor {pub_id % 500}", "Rocco", 2000 + pub_id % 25, "Ficção", 300)
+        if pub_id % 3:
+            pub.start_reading()
+            pub._start_read_date = first_day + timedelta(days=pub_id % 1500)
+        if pub_id % 3 == 1:
+            pub.finish_reading()
+            pub.rate_publication(pub_id % 11)
+            pub.add_annotation(Annotation(f"ann_{pub_id}_1", "Trecho marcante"))
+        records.append(pub.to_dict())
+    return records
+
+
+def throughput(records, trusted: bool) -> float:
+    """Return publications loaded per second."""
+    start = time.perf_counter()
+    Collection.from_dict({"publications": records}, trusted=trusted)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main(count: int = 100_000) -> None:
+    """Print load throughput for both modes."""
+    records = build_records(count)
+
+    strict = throughput(records, trusted=False)
+    trusted = throughput(records, trusted=True)
+
+    print(f"Publications loaded: {count:,}")
+    print(f"Strict:  {strict:12,.0f} publications/s")
+    print(f"Trusted: {trusted:12,.0f} publications/s")
+    print(f"Speedup: {trusted / strict:12.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
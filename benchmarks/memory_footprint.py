@@ -0,0 +1,79 @@
+"""
+Memory benchmark: bytes per publication with and without __slots__.
+
+Each publication (and its annotations) is copied twice, sharing the original
+field values: once into its real, slot-based class, and once into a plain
+object holding the same attributes in an instance __dict__, which is how
+Publication, Book, Magazine and Annotation were laid out before they declared
+__slots__. Only the per-instance containers are therefore compared.
+
+Usage:
+    python -m benchmarks.memory_footprint [count]
+"""
+
+import sys
+import tracemalloc
+from src.models import Book, Annotation
+
+
+class DictLayout:
+    """Plain object storing its attributes in an instance __dict__."""
+
+
+def slot_names(cls):
+    """Yield the (mangled) slot names declared along the class hierarchy."""
+    for klass in cls.__mro__:
+        for name in getattr(klass, "__slots__", ()):
+            yield f"_{klass.__name__}{name}" if name.startswith("__") else name
+
+
+def copy_layout(source, dict_layout: bool):
+    """Copy an object attribute by attribute into the chosen layout."""
+    target = DictLayout() if dict_layout else object.__new__(type(source))
+    for name in slot_names(type(source)):
+        value = getattr(source, name)
+        if isinstance(value, dict):
+            value = {key: copy_layout(item, dict_layout) for key, item in value.items()}
+        setattr(target, name, value)
+    return target
+
+
+def build_books(count: int):
+    """Create read, rated and annotated books."""
+    books = []
+    for pub_id in range(1, count + 1):
+        book = Book(pub_id, f"Livro {pub_id}", "Autor", "Editora", 2000, "Ficção", 300, isbn="978-0")
+        book.start_reading()
+        book.finish_reading()
+        book.rate_publication(8.0)
+        book.add_annotation(Annotation(f"ann_{pub_id}_1", "Nota"))
+        books.append(book)
+    return books
+
+
+def measure(books, dict_layout: bool) -> int:
+    """Return the bytes allocated by copying the books into a layout."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    copies = [copy_layout(book, dict_layout) for book in books]
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del copies
+    return allocated
+
+
+def main(count: int = 100_000) -> None:
+    """Print bytes per publication for both layouts."""
+    books = build_books(count)
+
+    legacy = measure(books, dict_layout=True)
+    slotted = measure(books, dict_layout=False)
+
+    print(f"Publications measured: {count:,}")
+    print(f"Dict layout (before): {legacy / count:8.1f} bytes/publication")
+    print(f"Slot layout (after):  {slotted / count:8.1f} bytes/publication")
+    print(f"Saving:               {(1 - slotted / legacy) * 100:8.1f}%")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
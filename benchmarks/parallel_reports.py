@@ -0,0 +1,48 @@
+"""
+Report benchmark: sequential strategies vs. the process-pool runner.
+
+The records of benchmarks.load_throughput are loaded into one PublicationTable,
+then every report strategy runs on it in this process and through
+ParallelRunner over columnar chunks.
+
+Usage:
+    python -m benchmarks.parallel_reports [count] [workers]
+"""
+
+import sys
+import time
+from src.models import Configuration, PublicationTable
+from src.strategies import EvaluationReportStrategy, ProgressReportStrategy, TopRatedReportStrategy, ParallelRunner
+from benchmarks.load_throughput import build_records
+
+
+def timed(function) -> float:
+    """Return the seconds taken by a call."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main(count: int = 1_000_000, workers: int = 4) -> None:
+    """Print sequential and parallel timings of each strategy."""
+    table = PublicationTable.from_records(build_records(count))
+    runner = ParallelRunner(workers=workers, threshold=0)
+    config = Configuration(annual_goal=12, simultaneous_reading_limit=3)
+    runs = [
+        ("Avaliações", EvaluationReportStrategy(), {}),
+        ("Top 10", TopRatedReportStrategy(), {"limit": 10}),
+        ("Progresso", ProgressReportStrategy(), {"config": config}),
+    ]
+
+    print(f"Publications: {count:,}  Workers: {workers}")
+    for label, strategy, kwargs in runs:
+        sequential = timed(lambda: strategy.generate(table, **kwargs))
+        parallel = timed(lambda: runner.run(strategy, table, **kwargs))
+        print(f"{label:12} sequential {sequential:8.3f}s  parallel {parallel:8.3f}s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+    )
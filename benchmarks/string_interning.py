@@ -0,0 +1,58 @@
+"""
+Memory benchmark: retained bytes per publication with and without interning
+author, publisher and genre through a SymbolTable, plus snapshot sizes in the
+plain and dictionary-encoded formats.
+
+Both runs parse the same JSON text, so every record starts with its own str
+objects, and then build publications with the trusted loader. The interned run
+additionally passes each publication through a SymbolTable, as Collection does
+when publications are attached.
+
+Usage:
+    python -m benchmarks.string_interning [count]
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from src.models import Publication
+from src.models.symbols import SymbolTable, encode_records
+from .load_throughput import build_records
+
+
+def retained(text: str, interned: bool) -> int:
+    """Return the bytes still held after loading the snapshot text."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    publications = [Publication.from_dict(record, trusted=True) for record in json.loads(text)]
+    symbols = SymbolTable()
+    if interned:
+        for pub in publications:
+            pub._intern_fields(symbols)
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del publications, symbols
+    return held
+
+
+def main(count: int = 100_000) -> None:
+    """Print retained memory and snapshot sizes."""
+    records = build_records(count)
+    text = json.dumps(records, ensure_ascii=False)
+    encoded = json.dumps(encode_records(records), ensure_ascii=False)
+
+    plain = retained(text, interned=False)
+    interned = retained(text, interned=True)
+
+    print(f"Publications measured: {count:,}")
+    print(f"Without interning: {plain / count:8.1f} bytes/publication")
+    print(f"With interning:    {interned / count:8.1f} bytes/publication")
+    print(f"Saving:            {(1 - interned / plain) * 100:8.1f}%")
+    print(f"Snapshot size:     {len(text.encode()):,} bytes plain, {len(encoded.encode()):,} bytes encoded")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
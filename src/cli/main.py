@@ -3,10 +3,30 @@ Command-line interface for the Personal Digital Library.
 """
 
 import click
+import io
+from contextlib import redirect_stdout
 from datetime import date
 from src.models import User, Book, Magazine, Report, Annotation
+from src.models.rollups import PeriodTotals
+from src.models.groupby import AggregateSpec, Condition, parse_condition
 from src.data import repository
 
+def _cached_report(name: str, params: dict, render) -> str:
+    """
+    Get a report output from the cache next to the library, rendering it on a miss.
+
+    The cache is keyed by report name and parameters, for the current content
+    hash of the library, so any saved change invalidates it.
+    """
+    version = repository.snapshot_version()
+    cache = repository.load_report_cache()
+    output = cache.get(name, params, version)
+    if output is None:
+        output = render()
+        cache.put(name, params, version, output)
+        repository.save_report_cache(cache)
+    return output
+
 @click.group()
 @click.pass_context
 def cli(ctx):
@@ -33,7 +53,7 @@ def cli(ctx):
 def cadastrar(user: User, titulo, autor, editora, ano, genero, numero_paginas, tipo, isbn, issn, edicao, numero):
     """Cadastra uma nova publicação"""
     try:
-        pub_id = len(user.collection.list_publications()) + 1
+        pub_id = repository.allocate_id(floor=user.collection.max_id)
 
         if tipo == "livro":
             pub = Book(
@@ -66,16 +86,23 @@ def cadastrar(user: User, titulo, autor, editora, ano, genero, numero_paginas, t
 
     except ValueError as e:
         click.echo(f"Erro: {e}", err=True)
+    except TimeoutError:
+        click.echo("Erro: outro processo está cadastrando publicações; tente novamente em instantes.", err=True)
     except Exception as e:
         click.echo(f"Erro inesperado: {e}", err=True)
 
 
 
 @cli.command()
+@click.option('--nota-min', type=float, help='Somente publicações com nota maior ou igual')
+@click.option('--nota-max', type=float, help='Somente publicações com nota menor ou igual')
 @click.pass_obj
-def listar(user: User):
+def listar(user: User, nota_min, nota_max):
     """Lista todas as publicações"""
-    pubs = user.collection.list_publications()
+    if nota_min is None and nota_max is None:
+        pubs = user.collection.list_publications()
+    else:
+        pubs = user.collection.query().rating_between(nota_min, nota_max).all()
 
     if not pubs:
         click.echo("Nenhuma publicação encontrada")
@@ -129,7 +156,7 @@ def finalizar(user: User, pub_id):
 @click.argument('nota', type=float)
 @click.pass_obj
 def avaliar(user: User, pub_id, nota):
-    """Avalia uma publicação (0-10)"""
+    """Avalia uma publicação (0-10, com até uma casa decimal)"""
     try:
         pubs = user.collection.list_publications()
         pub = next((p for p in pubs if p.id == pub_id), None)
@@ -146,22 +173,60 @@ def avaliar(user: User, pub_id, nota):
     except (ValueError, TypeError) as e:
         click.echo(f"Erro: {e}", err=True)
 
+@cli.command()
+@click.argument('pub_id', type=int)
+@click.argument('pagina', type=int)
+@click.pass_obj
+def progresso(user: User, pub_id, pagina):
+    """Registra a página atual de uma publicação em leitura"""
+    try:
+        pubs = user.collection.list_publications()
+        pub = next((p for p in pubs if p.id == pub_id), None)
+
+        if not pub:
+            click.echo(f"Publicação com o ID {pub_id} não encontrada.", err=True)
+            return
+
+        pub.record_progress(pagina)
+        repository.save_progress(pubs)
+
+        percentage = pagina / pub.number_of_pages * 100
+        click.echo(f"'{pub.title}': página {pagina}/{pub.number_of_pages} ({percentage:.1f}%)")
+
+        pace = pub.progress.pages_per_day(since=pub.start_read_date)
+        if pace:
+            click.echo(f"   Ritmo: {pace:.1f} páginas/dia")
+            eta = pub.progress.eta(pub.number_of_pages, pub.start_read_date, date.today())
+            click.echo(f"   Previsão de término: {eta.strftime('%d/%m/%Y')}")
+    except (ValueError, TypeError) as e:
+        click.echo(f"Erro: {e}", err=True)
+
 @cli.command()
 @click.pass_obj
 def relatorio(user: User):
     """Exibe relatório da biblioteca"""
-    Report.print_full_report(user.collection)
+    def render():
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            Report.print_full_report(user.collection)
+        return buffer.getvalue()
+
+    click.echo(_cached_report('relatorio', {}, render), nl=False)
 
 @cli.command()
 @click.argument('termo')
 @click.option('--por', type=click.Choice(['titulo', 'autor']), default='titulo')
+@click.option('--nota-min', type=float, help='Somente publicações com nota maior ou igual')
+@click.option('--nota-max', type=float, help='Somente publicações com nota menor ou igual')
 @click.pass_obj
-def buscar(user: User, termo, por):
+def buscar(user: User, termo, por, nota_min, nota_max):
     """Busca publicações por autor ou título"""
+    query = user.collection.query()
     if por == "autor":
-        results = user.collection.search_by_author(termo)                
+        query = query.author_contains(termo)
     else:
-        results = user.collection.search_by_title(termo)
+        query = query.title_contains(termo)
+    results = query.rating_between(nota_min, nota_max).all()
 
     if not results:
         click.echo(f"Nenhuma publicação encontrada para: {termo}")
@@ -172,6 +237,57 @@ def buscar(user: User, termo, por):
         click.echo(f"   [{pub.id:>3}] {pub.title} - {pub.author}")
         click.echo(f"         {pub.status:7}")
 
+FACET_LABELS = {
+    "genre": ("genero", "Gênero"),
+    "publisher": ("editora", "Editora"),
+    "decade": ("decada", "Década"),
+    "status": ("status", "Status"),
+    "year": ("ano", "Ano"),
+    "type": ("tipo", "Tipo"),
+}
+
+@cli.command()
+@click.option('--status', type=click.Choice(['UNREAD', 'READING', 'READ'], case_sensitive=False))
+@click.option('--genero')
+@click.option('--editora')
+@click.option('--ano', type=int)
+@click.option('--tipo', type=click.Choice(['livro', 'revista']))
+@click.option('--dimensao', '-d', multiple=True,
+              type=click.Choice([option for option, _ in FACET_LABELS.values()]),
+              help='Dimensões a contar (padrão: genero, editora, decada, status)')
+@click.pass_obj
+def facetas(user: User, status, genero, editora, ano, tipo, dimensao):
+    """Mostra contagens por gênero, editora, década e status"""
+    criteria = {}
+    if status:
+        criteria["status"] = status
+    if genero:
+        criteria["genre"] = genero
+    if editora:
+        criteria["publisher"] = editora
+    if ano is not None:
+        criteria["year"] = ano
+    if tipo:
+        criteria["type"] = "Book" if tipo == "livro" else "Magazine"
+
+    by_option = {option: dimension for dimension, (option, _) in FACET_LABELS.items()}
+    dimensions = [by_option[option] for option in dimensao] or ["genre", "publisher", "decade", "status"]
+
+    query = user.collection.query().filter(**criteria)
+    total = query.count()
+
+    if total == 0:
+        click.echo("Nenhuma publicação encontrada")
+        return
+
+    click.echo(f"Total: {total} publicações\n")
+    for dimension, counts in query.facets(dimensions).items():
+        click.echo(FACET_LABELS[dimension][1])
+        for value, count in counts.items():
+            label = f"{value}s" if dimension == "decade" else value
+            click.echo(f"   {str(label):30} {count:>5}")
+        click.echo("")
+
 @cli.command()
 @click.argument('pub_id', type=int)
 @click.pass_obj
@@ -259,6 +375,42 @@ def progresso_meta(user: User):
         click.echo("Em atraso!")
 
 
+@cli.command()
+@click.option('--de', 'ano_inicial', type=int, help='Primeiro ano (padrão: primeiro ano com leituras)')
+@click.option('--ate', 'ano_final', type=int, help='Último ano (padrão: ano atual)')
+@click.option('--mensal', is_flag=True, help='Detalha cada ano mês a mês')
+@click.pass_obj
+def progresso_historico(user: User, ano_inicial, ano_final, mensal):
+    """Mostra leituras concluídas, páginas lidas e nota média por ano."""
+    rollups = repository.persist_rollups(user.collection)
+    years = rollups.years()
+
+    ano_final = ano_final or date.today().year
+    ano_inicial = ano_inicial or (years[0] if years else ano_final)
+    if ano_inicial > ano_final:
+        click.echo("Erro: o ano inicial deve ser anterior ou igual ao ano final.", err=True)
+        return
+
+    def line(label, totals):
+        average = f"{totals.average_rating:.1f}" if totals.average_rating is not None else "-"
+        return f"   {label:<8} {totals.finished:>10} {totals.pages:>10,} {average:>8}"
+
+    click.echo(f"📅 HISTÓRICO DE LEITURA - {ano_inicial} a {ano_final}\n")
+    click.echo(f"   {'Período':<8} {'Concluídas':>10} {'Páginas':>10} {'Nota':>8}")
+    history = rollups.history(ano_inicial, ano_final)
+    for year, totals in history.items():
+        click.echo(line(str(year), totals))
+        if mensal:
+            for month, month_totals in rollups.months(year).items():
+                if not month_totals.is_empty():
+                    click.echo(line(f"  {month:02d}/{year % 100:02d}", month_totals))
+
+    total = PeriodTotals()
+    for totals in history.values():
+        total.merge(totals)
+    click.echo(line("Total", total))
+
+
 @cli.command()
 @click.pass_obj
 def relatorio_avaliacoes(user: User):
@@ -272,8 +424,7 @@ def relatorio_avaliacoes(user: User):
         return
     
     strategy = EvaluationReportStrategy()
-    report_data = strategy.generate(publications)
-    output = strategy.format_output(report_data)
+    output = _cached_report('evaluation', {}, lambda: strategy.format_output(strategy.generate(publications)))
     
     click.echo(output)
 
@@ -292,8 +443,10 @@ def top_rated(user: User, limit):
         return
     
     strategy = TopRatedReportStrategy()
-    report_data = strategy.generate(publications, limit=limit)
-    output = strategy.format_output(report_data)
+    output = _cached_report(
+        'top_rated', {'limit': limit},
+        lambda: strategy.format_output(strategy.generate(publications, limit=limit))
+    )
     
     click.echo(output)
 
@@ -311,11 +464,133 @@ def progresso_detalhado(user: User):
         return
     
     strategy = ProgressReportStrategy()
-    report_data = strategy.generate(publications, config=user.configuration)
-    output = strategy.format_output(report_data)
+    config = user.configuration
+    # Depende da data atual (ano, previsões) e da meta configurada
+    params = {
+        'today': date.today().isoformat(),
+        'goal': config.annual_goal,
+        'limit': config.simultaneous_reading_limit
+    }
+    output = _cached_report(
+        'progress', params,
+        lambda: strategy.format_output(strategy.generate(publications, config=config))
+    )
     
     click.echo(output)
 
+@cli.command()
+@click.option('--compressao', type=int, default=100, help='Precisão do sketch (maior = mais preciso)')
+@click.pass_obj
+def relatorio_quantis(user: User, compressao):
+    """Exibe percentis (p10/p50/p90) de notas, notas por gênero e páginas por livro."""
+    from src.strategies import QuantileReportStrategy
+    
+    publications = user.collection.list_publications()
+    
+    if not publications:
+        click.echo("📚 Nenhuma publicação cadastrada ainda.")
+        return
+    
+    strategy = QuantileReportStrategy()
+    output = _cached_report(
+        'quantiles', {'compression': compressao},
+        lambda: strategy.format_output(strategy.generate(publications, compression=compressao))
+    )
+    
+    click.echo(output)
+
+GROUP_FIELDS = {
+    "autor": "author",
+    "editora": "publisher",
+    "genero": "genre",
+    "tipo": "type",
+    "status": "status",
+    "ano": "year",
+}
+AGGREGATE_FIELDS = {"nota": "rating", "paginas": "number_of_pages", "ano": "year"}
+AGGREGATE_FUNCTIONS = {"contagem": "count", "soma": "sum", "media": "avg", "min": "min", "max": "max"}
+
+def _aggregate_spec(text: str):
+    """Translate an aggregate such as 'media:nota' into an AggregateSpec labelled with the text."""
+    function, _, field = text.partition(":")
+    field = field.strip()
+    return AggregateSpec(
+        text, AGGREGATE_FUNCTIONS.get(function.strip(), function.strip()),
+        AGGREGATE_FIELDS.get(field, field) if field else None
+    )
+
+@cli.command()
+@click.option('--por', '-p', multiple=True, required=True, type=click.Choice(list(GROUP_FIELDS)),
+              help='Campo(s) de agrupamento')
+@click.option('--agregado', '-a', multiple=True,
+              help="Agregado 'funcao[:campo]': contagem, soma, media, min, max de nota, paginas ou ano "
+                   "(padrão: contagem)")
+@click.option('--status', type=click.Choice(['UNREAD', 'READING', 'READ'], case_sensitive=False))
+@click.option('--genero')
+@click.option('--editora')
+@click.option('--ano', type=int)
+@click.option('--tipo', type=click.Choice(['livro', 'revista']))
+@click.option('--condicao', '-c', multiple=True,
+              help="Condição sobre os grupos, com um campo de agrupamento ou um agregado, exibido ou não, "
+                   "ex.: 'contagem>=2'")
+@click.option('--ordenar', help='Agregado (exibido ou não) ou campo de agrupamento usado na ordenação')
+@click.option('--crescente', is_flag=True, help='Ordena do menor para o maior')
+@click.option('--limite', type=int, help='Número máximo de grupos')
+@click.pass_obj
+def relatorio_agrupado(user: User, por, agregado, status, genero, editora, ano, tipo, condicao, ordenar,
+                       crescente, limite):
+    """Agrupa publicações (ex.: autores mais lidos, nota média por gênero, páginas por editora)."""
+    from src.strategies import GroupByReportStrategy
+
+    where = {}
+    if status:
+        where["status"] = status.upper()
+    if genero:
+        where["genre"] = genero
+    if editora:
+        where["publisher"] = editora
+    if ano is not None:
+        where["year"] = ano
+    if tipo:
+        where["type"] = "Book" if tipo == "livro" else "Magazine"
+
+    aggregates = agregado or ("contagem",)
+
+    def column(name: str) -> str:
+        # Agregado não pedido com -a: vai para o motor no nome interno (ex.: contagem -> count)
+        if name in GROUP_FIELDS:
+            return GROUP_FIELDS[name]
+        if name in aggregates:
+            return name
+        spec = _aggregate_spec(name)
+        return f"{spec.function}:{spec.field}" if spec.field else spec.function
+
+    strategy = GroupByReportStrategy()
+    try:
+        having = []
+        for text in condicao:
+            name, op, value = parse_condition(text)
+            having.append(Condition(column(name), op, value))
+
+        params = {
+            'group_by': [GROUP_FIELDS[field] for field in por],
+            'aggregates': [_aggregate_spec(text) for text in aggregates],
+            'where': where,
+            'having': having,
+            'order_by': column(ordenar) if ordenar else None,
+            'descending': not crescente,
+            'limit': limite
+        }
+        output = _cached_report(
+            'group_by', params,
+            lambda: strategy.format_output(strategy.generate(user.collection, **params))
+        )
+    except ValueError as e:
+        click.echo(f"Erro: {e}", err=True)
+        return
+
+    click.echo(output)
+
 @cli.command()
 @click.argument('pub_id', type=int)
 @click.argument('texto')
@@ -331,8 +606,7 @@ def adicionar_anotacao(user: User, pub_id, texto, trecho):
             click.echo(f"Publicação com ID {pub_id} não encontrada.", err=True)
             return
         
-        existing_annotations = pub.list_annotations()
-        annotation_id = f"ann_{pub_id}_{len(existing_annotations) + 1}"
+        annotation_id = pub.next_annotation_id()
 
         annotation = Annotation(
             annotation_id=annotation_id,
@@ -405,20 +679,12 @@ def remover_anotacao(user: User, pub_id, annotation_id):
             click.echo(f"Publicação com ID {pub_id} não encontrada.", err=True)
             return
         
-        annotations = pub.list_annotations()
-        annotation_exists = any(ann.id == annotation_id for ann in annotations)
-
-        if not annotation_exists:
+        if not pub.remove_annotation(annotation_id):
             click.echo(f"Anotação {annotation_id} não encontrada.", err=True)
             return
-        
-        removed = pub.remove_annotation(annotation_id)
 
-        if removed:
-            repository.save_collection(user.collection)
-            click.echo(f"Anotação '{annotation_id}' removida com sucesso")
-        else:
-            click.echo(f"Não foi possível remover a anotação", err=True)
+        repository.save_collection(user.collection)
+        click.echo(f"Anotação '{annotation_id}' removida com sucesso")
 
     except Exception as e:
         click.echo(f"Erro: {e}", err=True)
@@ -437,8 +703,7 @@ def ver_anotacao(user: User, pub_id, annotation_id):
             click.echo(f"Publicação com ID {pub_id} não encontrada.", err=True)
             return
         
-        annotations = pub.list_annotations()
-        annotation = next((ann for ann in annotations if ann.id == annotation_id), None)
+        annotation = pub.get_annotation(annotation_id)
 
         if not annotation:
             click.echo(f"Anotação {annotation_id} não encontrada.", err=True)
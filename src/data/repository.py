@@ -1,13 +1,34 @@
 """
 Module containing data persistinf functions.
 """
+import os
 import sys
 import json
+import time
+import hashlib
 import sqlite3
-from typing import List
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import date
 from pathlib import Path
 from src.models import Collection, Publication, Annotation
+from src.models.serialization import paused_gc
+from src.models.symbols import decode_records, encode_records
+from src.models.progress import ProgressLog, dump_logs, load_logs
+from src.models.table import PublicationTable
+from src.models.report_cache import ReportCache
+from src.models.rollups import ReadingRollups
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+LOCK_TIMEOUT = 5.0
+
+# Digest de cada arquivo lido ou gravado, pela assinatura (inode, tamanho, mtime) que tinha
+_file_digests: Dict[Path, Tuple[tuple, bytes]] = {}
 
 def _get_data_filepath(filename: str = "library.json") -> Path:
     """
@@ -21,6 +42,83 @@ def _get_data_filepath(filename: str = "library.json") -> Path:
     """
     return (Path(__file__).parent.parent.parent / filename).resolve()
 
+def _signature(path: Path) -> Optional[tuple]:
+    """Get the (inode, size, mtime) signature of a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+def _remember_digest(path: Path, content: bytes, signature: Optional[tuple]) -> None:
+    """Keep the digest of bytes just read or written, under the file signature they belong to."""
+    if signature is not None:
+        _file_digests[path] = (signature, hashlib.blake2b(content, digest_size=16).digest())
+
+def _file_digest(path: Path) -> bytes:
+    """Get the content digest of a file, reading it only if it changed since it was last seen."""
+    signature = _signature(path)
+    if signature is None:
+        return b""
+    known = _file_digests.get(path)
+    if known is not None and known[0] == signature:
+        return known[1]
+    _remember_digest(path, path.read_bytes(), signature)
+    return _file_digests[path][1]
+
+def _save_progress(publications: List[Publication], full_path: Path) -> None:
+    """
+    Write the page progress logs to the binary sidecar next to the library file
+    ("library.progress"), keeping library.json free of time series.
+    """
+    progress_path = full_path.with_suffix(".progress")
+    logs = {pub.id: pub.progress for pub in publications if pub.progress is not None}
+    if not logs and not progress_path.exists():
+        return
+    tmp_path = progress_path.with_suffix(".progress.tmp")
+    content = dump_logs(logs)
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, progress_path)
+    _remember_digest(progress_path, content, _signature(progress_path))
+
+def _read_progress(full_path: Path) -> Dict[int, ProgressLog]:
+    """
+    Read the progress logs stored in the binary sidecar next to the library file.
+
+    Returns:
+        Logs by publication ID (empty if the sidecar is missing or corrupt)
+    """
+    progress_path = full_path.with_suffix(".progress")
+    signature = _signature(progress_path)
+    try:
+        content = progress_path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    _remember_digest(progress_path, content, signature)
+    try:
+        return load_logs(content)
+    except ValueError as e:
+        print(f"Progresso de leitura ignorado, arquivo corrompido: {progress_path} ({e})")
+        return {}
+
+def _load_progress(publications: List[Publication], full_path: Path) -> None:
+    """Attach the progress logs stored in the binary sidecar to their publications."""
+    logs = _read_progress(full_path)
+    for pub in publications:
+        log = logs.get(pub.id)
+        if log is not None:
+            pub._restore_progress(log)
+
+def save_progress(publications: List[Publication], filepath: str = "library.json") -> None:
+    """
+    Save only the page progress logs, leaving the JSON snapshot untouched.
+
+    Args:
+        publications: Publications whose progress logs are saved
+        filepath: Library filename the progress sidecar belongs to
+    """
+    _save_progress(publications, _get_data_filepath(filepath))
+
 def save_publication(publications: List[Publication], filepath: str = "library.json") -> None:
     """
     Save a publication to JSON file.
@@ -37,15 +135,17 @@ def save_publication(publications: List[Publication], filepath: str = "library.j
 
     with open(full_path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4, ensure_ascii=False)
+    _save_progress(publications, full_path)
 
     print(f"✅ {len(publications)} publicações salvas em: {full_path}")
 
-def load_publications(filepath: str = "library.json") -> List[Publication]:
+def load_publications(filepath: str = "library.json", trusted: bool = False) -> List[Publication]:
     """
     Load all publications from JSON file.
 
     Args:
         filepath: Filename (will be loaded from project root)
+        trusted: Skip validation, for files written by save_publication/save_collection
 
     Returns:
         List of Publication objects (Book or Magazine instances)
@@ -58,9 +158,14 @@ def load_publications(filepath: str = "library.json") -> List[Publication]:
 
     try:
         with open(full_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+            data = decode_records(json.load(f))
 
-        publications = [Publication.from_dict(pub_dict) for pub_dict in data]
+        if trusted:
+            with paused_gc():
+                publications = [Publication.from_dict(pub_dict, trusted=True) for pub_dict in data]
+        else:
+            publications = [Publication.from_dict(pub_dict) for pub_dict in data]
+        _load_progress(publications, full_path)
 
         print(f"✅ {len(publications)} publicações carregadas de: {full_path}")
         return publications
@@ -78,35 +183,87 @@ def load_publications(filepath: str = "library.json") -> List[Publication]:
         print(f"Erro inesperado ao carregar publicações: {e}")
         raise
 
-def save_collection(collection: Collection, filepath: str = "library.json") -> None:
+def iter_publications(filepath: str = "library.json", trusted: bool = True) -> Iterator[Publication]:
+    """
+    Yield the publications of a JSON snapshot one at a time.
+
+    Only the parsed records are held in memory; each Publication is built when
+    requested, so a streaming consumer (e.g. EvaluationReportStrategy) never
+    keeps them all alive. Progress logs are not attached.
+
+    Args:
+        filepath: Filename (will be loaded from project root)
+        trusted: Skip validation, for files written by save_publication/save_collection
+
+    Returns:
+        Iterator of Publication objects (empty if the file does not exist)
+    """
+    full_path = _get_data_filepath(filepath)
+    try:
+        with open(full_path, "r", encoding="utf-8") as f:
+            data = decode_records(json.load(f))
+    except FileNotFoundError:
+        return
+    for pub_dict in data:
+        yield Publication.from_dict(pub_dict, trusted=trusted)
+
+def save_collection(collection: Collection, filepath: str = "library.json", encoded: bool = False) -> None:
     """
     Save all publications in a JSON file.
+
+    Args:
+        collection: Collection to save
+        filepath: Filename (will be saved in project root)
+        encoded: Write authors, publishers and genres once in a symbol list and
+            reference them by code (smaller file, faster to load). Every loader
+            reads both formats.
     """
     full_path = _get_data_filepath(filepath)
     publications = collection.list_publications()
     data = [pub.to_dict() for pub in publications]
+    if encoded:
+        data = encode_records(data)
 
     full_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(full_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    content = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    full_path.write_bytes(content)
+    _remember_digest(full_path, content, _signature(full_path))
+    _save_progress(publications, full_path)
+    if collection._rollups is not None:
+        # Só quando já construídos: salvar não deve forçar um passe sobre a coleção
+        save_rollups(collection._rollups, filepath, version=snapshot_version(filepath))
 
     print(f"{len(publications)} salvas em {full_path}")
 
-def load_collection(filepath: str = "library.json") -> Collection:
+def load_collection(filepath: str = "library.json", trusted: bool = True) -> Collection:
     """
     Load collection from a JSON file.
+
+    Args:
+        filepath: Filename (will be loaded from project root)
+        trusted: The file is our own snapshot, so objects are built directly from it.
+            Pass False for imported files to run every validation and duplicate check.
     """
     full_path = _get_data_filepath(filepath)
     collection = Collection()
 
     try:
-        with open(full_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
+        signature = _signature(full_path)
+        content = full_path.read_bytes()
+        _remember_digest(full_path, content, signature)
+        data = decode_records(json.loads(content))
+
+        if trusted:
+            collection = Collection.from_dict({"publications": data}, trusted=True)
+        else:
             for pub_data in data:
                 pub = Publication.from_dict(pub_data)
                 collection.register_publication(pub)
+        _load_progress(collection.list_publications(), full_path)
+        rollups = load_rollups(filepath)
+        if rollups is not None:
+            collection._restore_rollups(rollups)
 
         print(f"{len(data)} publicações carregadas de {full_path}")
 
@@ -120,6 +277,249 @@ def load_collection(filepath: str = "library.json") -> Collection:
 
     return collection
 
+def load_table(filepath: str = "library.json") -> PublicationTable:
+    """
+    Load publications straight into a columnar table, without creating Publication objects.
+
+    Args:
+        filepath: Filename (will be loaded from project root)
+
+    Returns:
+        PublicationTable (empty if the file does not exist)
+    """
+    full_path = _get_data_filepath(filepath)
+
+    try:
+        with open(full_path, "r", encoding="utf-8") as f:
+            data = decode_records(json.load(f))
+    except FileNotFoundError:
+        print(f"Arquivo não encontrado: {full_path}")
+        return PublicationTable()
+
+    table = PublicationTable.from_records(data)
+    logs = _read_progress(full_path)
+    table.progress = {pub_id: log for pub_id, log in logs.items() if pub_id in table}
+    return table
+
+def _lock_handle(handle) -> None:
+    """Take an exclusive, non-blocking OS lock on an open file (OSError if held elsewhere)."""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    else:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+
+def _unlock_handle(handle) -> None:
+    """Release a lock taken by _lock_handle."""
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+@contextmanager
+def _file_lock(lock_path: Path, timeout: float = LOCK_TIMEOUT):
+    """
+    Hold an exclusive lock on a lock file while the block runs.
+
+    The lock is an OS lock on an open handle (flock, or msvcrt.locking on
+    Windows), so separate processes never hold it together and it is released
+    by the OS if the holder crashes or is killed: a leftover lock file never
+    blocks later writers.
+
+    Args:
+        lock_path: Path of the lock file (created if missing, kept afterwards)
+        timeout: Seconds to keep retrying before giving up
+
+    Raises:
+        TimeoutError: If the lock is still held by another writer after timeout
+    """
+    deadline = time.monotonic() + timeout
+    with open(lock_path, "a+b") as handle:
+        while True:
+            try:
+                _lock_handle(handle)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not acquire lock {lock_path}")
+                time.sleep(0.01)
+        try:
+            yield
+        finally:
+            _unlock_handle(handle)
+
+def allocate_ids(count: int = 1, filepath: str = "library.json", floor: int = 0) -> range:
+    """
+    Reserve a block of new publication IDs from the library's persisted sequence.
+
+    The last reserved ID is kept in a sidecar file next to the library
+    ("library.seq"). IDs only move forward, so IDs of removed publications are
+    never handed out again, and concurrent writers get disjoint blocks.
+
+    Only the ID allocation is serialized: save_collection is not locked, so
+    two processes saving the library at the same time still overwrite each
+    other's changes (the last save wins).
+
+    Args:
+        count: Number of IDs to reserve (e.g. the size of a bulk import)
+        filepath: Library filename the sequence belongs to
+        floor: Highest ID already in use (e.g. Collection.max_id), so the
+            sequence starts above it on first use
+
+    Returns:
+        Range of the reserved IDs
+
+    Raises:
+        ValueError: If count is not positive
+        TimeoutError: If another process holds the sequence lock for longer than LOCK_TIMEOUT
+    """
+    if count <= 0:
+        raise ValueError("Count must be positive")
+
+    seq_path = _get_data_filepath(filepath).with_suffix(".seq")
+    seq_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with _file_lock(seq_path.with_suffix(".seq.lock")):
+        try:
+            last = int(seq_path.read_text(encoding="utf-8") or 0)
+        except FileNotFoundError:
+            last = 0
+        start = max(last, floor) + 1
+        tmp_path = seq_path.with_suffix(".seq.tmp")
+        tmp_path.write_text(str(start + count - 1), encoding="utf-8")
+        os.replace(tmp_path, seq_path)
+
+    return range(start, start + count)
+
+def allocate_id(filepath: str = "library.json", floor: int = 0) -> int:
+    """
+    Reserve a single new publication ID (see allocate_ids).
+
+    Args:
+        filepath: Library filename the sequence belongs to
+        floor: Highest ID already in use
+
+    Returns:
+        New, never used publication ID
+    """
+    return allocate_ids(1, filepath, floor).start
+
+def snapshot_version(filepath: str = "library.json") -> str:
+    """
+    Get a content hash of the library: the JSON snapshot plus its progress sidecar.
+
+    Every save of a changed library produces a new value, so it identifies the
+    state report outputs were computed from. Digests of the bytes load_collection
+    read and save_collection wrote are reused while each file keeps the same
+    inode, size and mtime, so after a load or save this costs two stat calls
+    instead of reading and hashing the library again.
+
+    Args:
+        filepath: Library filename
+
+    Returns:
+        Hexadecimal digest ("" parts for missing files)
+    """
+    full_path = _get_data_filepath(filepath)
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (full_path, full_path.with_suffix(".progress")):
+        digest.update(_file_digest(path))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def load_report_cache(filepath: str = "library.json") -> ReportCache:
+    """
+    Load the report cache stored next to the library ("library.reports").
+
+    Args:
+        filepath: Library filename the cache belongs to
+
+    Returns:
+        ReportCache (empty if missing or unreadable)
+    """
+    cache_path = _get_data_filepath(filepath).with_suffix(".reports")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return ReportCache.from_dict(json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+        return ReportCache()
+
+def save_report_cache(cache: ReportCache, filepath: str = "library.json") -> None:
+    """
+    Save the report cache next to the library, replacing it atomically.
+
+    Args:
+        cache: Cache to save
+        filepath: Library filename the cache belongs to
+    """
+    cache_path = _get_data_filepath(filepath).with_suffix(".reports")
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".reports.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache.to_dict(), f, ensure_ascii=False)
+    os.replace(tmp_path, cache_path)
+
+def load_rollups(filepath: str = "library.json") -> Optional[ReadingRollups]:
+    """
+    Load the reading rollups stored next to the library ("library.rollups").
+
+    Rollups are saved with the snapshot_version of the library they summarize,
+    and only returned while the library still has that content.
+
+    Args:
+        filepath: Library filename the rollups belong to
+
+    Returns:
+        ReadingRollups, or None if missing, unreadable or saved for another version
+    """
+    rollups_path = _get_data_filepath(filepath).with_suffix(".rollups")
+    try:
+        with open(rollups_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != snapshot_version(filepath):
+            return None
+        return ReadingRollups.from_dict(data["months"])
+    except (FileNotFoundError, json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+def persist_rollups(collection: Collection, filepath: str = "library.json") -> ReadingRollups:
+    """
+    Get the reading rollups of a loaded collection, saving them if they had to be built.
+
+    Once saved, load_collection adopts them and every save_collection keeps them
+    current, so the full pass over the collection happens only once.
+
+    Args:
+        collection: Collection loaded from the library
+        filepath: Library filename the rollups belong to
+
+    Returns:
+        The collection's rollups
+    """
+    built = collection._rollups is None
+    rollups = collection.rollups
+    if built:
+        save_rollups(rollups, filepath)
+    return rollups
+
+def save_rollups(rollups: ReadingRollups, filepath: str = "library.json",
+                 version: Optional[str] = None) -> None:
+    """
+    Save the reading rollups next to the library, for its current version, replacing them atomically.
+
+    Args:
+        rollups: Rollups of the saved library
+        filepath: Library filename the rollups belong to
+        version: snapshot_version of the library, if the caller already has it
+    """
+    rollups_path = _get_data_filepath(filepath).with_suffix(".rollups")
+    rollups_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = rollups_path.with_suffix(".rollups.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": version or snapshot_version(filepath), "months": rollups.to_dict()}, f)
+    os.replace(tmp_path, rollups_path)
+
 '''
 
 Para implementação posterior com SQLite
@@ -9,6 +9,9 @@ from .publication import Publication, Book, Magazine
 from .mixins import DigitalAsset
 from .annotation import Annotation
 from .report import Report
+from .query import Query
+from .table import PublicationTable, PublicationRow
+from .events import EventBus
 
 __all__ = [
     'User',
@@ -19,5 +22,9 @@ __all__ = [
     'Book',
     'Magazine',
     'Annotation',
-    'Report'
+    'Report',
+    'Query',
+    'PublicationTable',
+    'PublicationRow',
+    'EventBus'
 ]
\ No newline at end of file
@@ -4,6 +4,7 @@ Module containing the Annotation class.
 
 from typing import Optional
 from datetime import date
+from .serialization import str_to_date
 
 class Annotation:
     """
@@ -18,6 +19,8 @@ class Annotation:
 		text (str): The annotation content itself
     """
 
+    __slots__ = ("__id", "_text", "_reference_excerpt", "_date")
+
     def __init__(self, annotation_id: str, text: str, reference_excerpt: Optional[str] = None):
         """
         Initialize a new annotation.
@@ -47,16 +50,24 @@ class Annotation:
         }
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'Annotation':
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'Annotation':
         """
         Create an Annotation from a dictionary.
 
         Args:
             data: Dictionary with annotation data
+            trusted: Skip validation for data previously written by to_dict
 
         Returns:
             Annotation instance
         """
+        if trusted:
+            annotation = cls.__new__(cls)
+            annotation.__id = data["annotation_id"]
+            annotation._text = data["text"]
+            annotation._reference_excerpt = data.get("reference_excerpt")
+            annotation._date = str_to_date(data.get("date")) or date.today()
+            return annotation
 
         annotation = cls(
             annotation_id=data["annotation_id"],
@@ -65,7 +76,7 @@ class Annotation:
         )
 
         if data.get("date"):
-            annotation._date = date.fromisoformat(data["date"])
+            annotation._date = str_to_date(data["date"])
 
         return annotation
 
@@ -3,9 +3,21 @@ Module containing the Collection class.
 """
 
 from datetime import date
-from typing import Dict, List, Optional
-from .publication import Publication
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from .publication import Publication, change_count, identity_key
 from .configuration import Configuration
+from .query import Query, FIELD_GETTERS
+from .serialization import paused_gc
+from .table import PublicationTable
+from .symbols import SymbolTable
+from .events import EventBus, FieldChanged, PublicationAdded, PublicationRemoved
+from .indexes import (
+    BITMAP_FIELDS, DEFAULT_FACETS, FACET_DIMENSIONS, BitmapIndex,
+    RatingIndex, SessionIndex, bits_from_rows, iter_bits, popcount, sort_facet_counts
+)
+from .sessions import ReadingSession
+from .stats import CollectionStats
+from .rollups import ReadingRollups
 
 class Collection:
     """
@@ -13,8 +25,22 @@ class Collection:
 
     Responsible for adding, removing, searching publications and enforcing business rules related to the collection as a whole.
 
+    Each publication also gets a dense internal row number, used by the bitmap
+    indexes over low-cardinality fields (see BITMAP_FIELDS). Indexes are built on
+    first use and kept current through publication change notifications.
+
+    Every attached publication is connected to the collection's event bus, so
+    subscribers to `events` see all publication changes plus PublicationAdded
+    and PublicationRemoved. The collection's own index maintenance is the first
+    subscriber, so indexes are current when other handlers run.
+
+    Authors, publishers and genres are interned in the collection's symbol table
+    when publications are attached, so repeated values share one str object.
+
     Attributes:
         publications (Dict[int, Publication]): Dictionary of publications indexed by ID
+        symbols (SymbolTable): Shared author/publisher/genre strings
+        events (EventBus): Change events of the collection and its publications
     """
 
     def __init__(self):
@@ -22,6 +48,499 @@ class Collection:
         Initialize an empty collection.
         """
         self._publications = {}
+        self._rows: List[Optional[Publication]] = []
+        self._row_of: Dict[int, int] = {}
+        self._bitmap_indexes: Optional[Dict[str, BitmapIndex]] = None
+        self._live_rows = 0
+        self._rating_index: Optional[RatingIndex] = None
+        self._table: Optional[PublicationTable] = None
+        self._identities: Optional[Dict[tuple, int]] = None
+        self._session_index: Optional[SessionIndex] = None
+        self._stats: Optional[CollectionStats] = None
+        self._rollups: Optional[ReadingRollups] = None
+        self._detached_at: Optional[int] = None
+        self._max_id = 0
+        self.symbols = SymbolTable()
+        self.events = EventBus()
+        self.events.subscribe(self._on_publication_changed, FieldChanged)
+
+    def _attach(self, publication: Publication, connect: bool = True) -> None:
+        """
+        Store a publication, assign its row and start tracking its changes.
+
+        Callers are responsible for validation (see register_publication).
+        With connect=False (set operation views) the publication is left
+        untouched: it is neither interned nor connected to this collection.
+        """
+        if connect:
+            publication._intern_fields(self.symbols)
+        self._publications[publication.id] = publication
+        self._max_id = max(self._max_id, publication.id)
+        row = len(self._rows)
+        self._rows.append(publication)
+        self._row_of[publication.id] = row
+        if connect:
+            publication.connect(self.events)
+
+        if self._bitmap_indexes is not None:
+            self._live_rows |= 1 << row
+            for index in self._bitmap_indexes.values():
+                index.add(row, publication)
+
+        if self._rating_index is not None:
+            self._rating_index.add(publication)
+
+        if self._table is not None:
+            self._table.append(publication)
+
+        if self._identities is not None:
+            self._identities.setdefault(publication.identity, publication.id)
+
+        if self._session_index is not None:
+            for session in publication.reading_sessions():
+                if session.end_read_date is not None:
+                    self._session_index.add(publication.id, session.end_read_date)
+
+        if self._stats is not None:
+            self._stats.add(publication)
+
+        if self._rollups is not None:
+            self._rollups.add(publication)
+
+        if self.events.has_subscribers(PublicationAdded):
+            self.events.publish(PublicationAdded(publication))
+
+    def _attach_many(self, publications: List[Publication], connect: bool = True) -> None:
+        """
+        Bulk version of _attach, used when loading snapshots.
+
+        A snapshot repeating an ID keeps only its last record, replacing any
+        publication already attached with that ID, so every ID owns one row.
+        connect=False works as in _attach.
+        """
+        by_id: Dict[int, Publication] = {}
+        for publication in publications:
+            by_id[publication.id] = publication
+        for pub_id in by_id.keys() & self._publications.keys():
+            self._detach(self._publications[pub_id])
+        if len(by_id) != len(publications):
+            publications = list(by_id.values())
+
+        if (self._bitmap_indexes is not None or self._rating_index is not None or self._table is not None
+                or self._identities is not None or self._session_index is not None or self._stats is not None
+                or self._rollups is not None or self.events.has_subscribers(PublicationAdded)):
+            for publication in publications:
+                self._attach(publication, connect)
+            return
+
+        start = len(self._rows)
+        ids = [pub.id for pub in publications]
+        self._publications.update(zip(ids, publications))
+        self._rows.extend(publications)
+        self._row_of.update(zip(ids, range(start, start + len(ids))))
+        self._max_id = max(self._max_id, max(ids, default=0))
+        if not connect:
+            return
+        bus = self.events
+        symbols = self.symbols
+        for publication in publications:
+            publication._intern_fields(symbols)
+            publication.connect(bus)
+
+    def _detach(self, publication: Publication) -> None:
+        """Forget a publication and clear it from every index."""
+        del self._publications[publication.id]
+        row = self._row_of.pop(publication.id)
+        self._rows[row] = None
+        publication.disconnect(self.events)
+
+        if self._bitmap_indexes is not None:
+            self._live_rows &= ~(1 << row)
+            for field, index in self._bitmap_indexes.items():
+                index.discard(row, FIELD_GETTERS[field](publication))
+
+        if self._rating_index is not None:
+            self._rating_index.discard(publication.id)
+
+        if self._table is not None:
+            self._table.remove(publication.id)
+
+        if self._identities is not None and self._identities.get(publication.identity) == publication.id:
+            del self._identities[publication.identity]
+
+        if self._session_index is not None:
+            self._session_index.discard(publication.id)
+
+        if self._stats is not None:
+            self._stats.discard(publication)
+
+        if self._rollups is not None:
+            self._rollups.discard(publication)
+
+        if self.events.has_subscribers(PublicationRemoved):
+            self.events.publish(PublicationRemoved(publication))
+
+        if len(self._rows) > 2 * len(self._publications) + 64:
+            self._compact_rows()
+
+    def _compact_rows(self) -> None:
+        """Renumber rows densely, dropping the slots left by removals."""
+        self._rows = [pub for pub in self._rows if pub is not None]
+        self._row_of = {pub.id: row for row, pub in enumerate(self._rows)}
+        self._bitmap_indexes = None
+
+    def _on_publication_changed(self, event: FieldChanged) -> None:
+        """Keep indexes in sync with a change reported by a publication."""
+        publication, field = event.publication, event.field
+        if self._bitmap_indexes is not None and field in self._bitmap_indexes:
+            self._bitmap_indexes[field].move(self._row_of[publication.id], event.old_value, event.new_value)
+        if self._rating_index is not None and field in ("rating", "title"):
+            self._rating_index.update(publication)
+        if self._table is not None:
+            self._table.refresh(publication)
+        if self._session_index is not None and field == "status" and event.new_value == "READ":
+            self._session_index.add(publication.id, publication.end_read_date)
+        if self._stats is not None:
+            self._stats.update(publication, field, event.old_value, event.new_value)
+        if self._rollups is not None:
+            self._rollups.update(publication, field, event.old_value, event.new_value)
+        if self._identities is not None and field == "title":
+            old_key = identity_key(event.old_value, publication.author)
+            if self._identities.get(old_key) == publication.id:
+                del self._identities[old_key]
+            self._identities.setdefault(publication.identity, publication.id)
+
+    def _refresh_view(self) -> None:
+        """
+        Drop the indexes of a detached view once any publication changed since they were built.
+
+        Views built by union, difference and intersection receive no change
+        events, so they compare change_count() with the value seen last and
+        rebuild their indexes lazily, from the publications' current state.
+        """
+        if self._detached_at is None:
+            return
+        current = change_count()
+        if current != self._detached_at:
+            self._detached_at = current
+            self._bitmap_indexes = None
+            self._live_rows = 0
+            self._rating_index = None
+            self._table = None
+            self._identities = None
+            self._session_index = None
+            self._stats = None
+            self._rollups = None
+
+    def _detached_view(self, publications: Iterable[Publication]) -> 'Collection':
+        """Build a collection holding the publications without connecting or modifying them."""
+        view = Collection()
+        view._detached_at = change_count()
+        view._attach_many(list(publications), connect=False)
+        return view
+
+    def __len__(self) -> int:
+        """Number of publications in the collection."""
+        return len(self._publications)
+
+    @property
+    def stats(self) -> CollectionStats:
+        """
+        Get the running totals of the collection (status counts, ratings, completions per year).
+
+        Computed on first access, then kept current by every registration,
+        removal and publication change, so reading them is O(1).
+        """
+        self._refresh_view()
+        if self._stats is None:
+            self._stats = CollectionStats.build(self._publications.values())
+        return self._stats
+
+    @property
+    def rollups(self) -> ReadingRollups:
+        """
+        Get the finished readings, pages read and ratings per month and year.
+
+        Computed on first access (or restored from a saved snapshot, see
+        _restore_rollups), then kept current by every registration, removal and
+        publication change, so any range of years is read without a scan.
+        """
+        self._refresh_view()
+        if self._rollups is None:
+            self._rollups = ReadingRollups.build(self._publications.values())
+        return self._rollups
+
+    def _restore_rollups(self, rollups: ReadingRollups) -> None:
+        """Adopt rollups saved for exactly this content (used during loading from persistence)."""
+        self._rollups = rollups
+
+    @property
+    def max_id(self) -> int:
+        """
+        Get the highest publication ID ever attached to the collection (0 if none).
+
+        Removals do not lower it, so IDs above it are free.
+        """
+        return self._max_id
+
+    def _sessions(self) -> SessionIndex:
+        """Get the finished-reading index, building it on first use."""
+        self._refresh_view()
+        if self._session_index is None:
+            self._session_index = SessionIndex.build(self._publications.values())
+        return self._session_index
+
+    def count_finished_between(self, start_date: date, end_date: date) -> int:
+        """
+        Count the readings finished within a period, re-reads included.
+
+        Args:
+            start_date: Beginning of the period (inclusive)
+            end_date: End of the period (inclusive)
+
+        Returns:
+            Number of finished readings, read from the session index
+        """
+        return self._sessions().count_between(start_date, end_date)
+
+    def sessions_finished_between(self, start_date: date, end_date: date) -> List[Tuple[Publication, ReadingSession]]:
+        """
+        Get the readings finished within a period, re-reads included.
+
+        Args:
+            start_date: Beginning of the period (inclusive)
+            end_date: End of the period (inclusive)
+
+        Returns:
+            (publication, session) pairs ordered by finish date
+        """
+        result = []
+        pending: Dict[int, List[ReadingSession]] = {}
+        for ordinal, pub_id in self._sessions().between(start_date, end_date):
+            sessions = pending.get(pub_id)
+            if sessions is None:
+                sessions = pending[pub_id] = [
+                    session for session in self._publications[pub_id].reading_sessions()
+                    if session.end_read_date is not None
+                ]
+            session = next(s for s in sessions if s.end_read_date.toordinal() == ordinal)
+            sessions.remove(session)
+            result.append((self._publications[pub_id], session))
+        return result
+
+    def finished_counts_by_year(self) -> Dict[int, int]:
+        """
+        Count finished readings per year, re-reads included.
+
+        Returns:
+            Dictionary of year to number of readings finished, in year order
+        """
+        return self._sessions().counts_by_year()
+
+    def _identity_index(self) -> Dict[tuple, int]:
+        """Get the identity index (normalized title/author to ID), building it on first use."""
+        self._refresh_view()
+        if self._identities is None:
+            self._identities = {}
+            for pub in self._publications.values():
+                self._identities.setdefault(pub.identity, pub.id)
+        return self._identities
+
+    def find_equivalent(self, publication: Publication) -> Optional[Publication]:
+        """
+        Get the publication considered equal to the given one (same normalized title and author).
+
+        Args:
+            publication: Publication to look for (need not belong to the collection)
+
+        Returns:
+            The matching publication of this collection, or None
+        """
+        pub_id = self._identity_index().get(publication.identity)
+        return None if pub_id is None else self._publications[pub_id]
+
+    def table(self) -> PublicationTable:
+        """
+        Get a columnar view of the collection for analytics.
+
+        The table is built on first use and then kept in sync with every
+        registration, removal and publication state change.
+
+        Returns:
+            PublicationTable with one row per publication
+        """
+        self._refresh_view()
+        if self._table is None:
+            self._table = PublicationTable.from_publications(self._publications.values())
+        return self._table
+
+    def _ratings(self) -> RatingIndex:
+        """Get the rating index, building it on first use."""
+        self._refresh_view()
+        if self._rating_index is None:
+            self._rating_index = RatingIndex.build(self._publications.values())
+        return self._rating_index
+
+    def iter_by_rating(self) -> Iterator[Publication]:
+        """
+        Lazily yield rated publications from best to worst rated (ties by title).
+
+        Returns:
+            Iterator over the maintained rating index
+        """
+        publications = self._publications
+        for pub_id in self._ratings().ids():
+            yield publications[pub_id]
+
+    def rated_between(self, min_rating: Optional[float] = None, max_rating: Optional[float] = None) -> List[Publication]:
+        """
+        Get publications rated within a closed interval, using the rating index.
+
+        Args:
+            min_rating: Lower bound (inclusive), or None for no bound
+            max_rating: Upper bound (inclusive), or None for no bound
+
+        Returns:
+            Publications from best to worst rated (ties by title)
+        """
+        publications = self._publications
+        return [publications[pub_id] for pub_id in self._ratings().ids_between(min_rating, max_rating)]
+
+    def rating_bitmap(self, min_rating: Optional[float] = None, max_rating: Optional[float] = None) -> int:
+        """Get the bitset of rows rated within a closed interval."""
+        row_of = self._row_of
+        ids = self._ratings().ids_between(min_rating, max_rating)
+        return bits_from_rows((row_of[pub_id] for pub_id in ids), len(self._rows))
+
+    def rating_percentile(self, percent: float) -> Optional[float]:
+        """
+        Get the rating at a percentile of all rated publications (nearest rank).
+
+        Args:
+            percent: Percentile between 0 and 100 (50 is the median)
+
+        Returns:
+            Rating value, or None if no publication is rated
+        """
+        return self._ratings().percentile(percent)
+
+    def top_rated(self, limit: int, status: Optional[str] = None) -> List[Publication]:
+        """
+        Get the best rated publications, read from the maintained rating index.
+
+        Args:
+            limit: Maximum number of publications
+            status: Only consider publications with this status (optional)
+
+        Returns:
+            Up to `limit` publications sorted by rating (highest first), then title
+        """
+        top = []
+        if limit <= 0:
+            return top
+        for pub in self.iter_by_rating():
+            if status is None or pub.status == status.upper():
+                top.append(pub)
+                if len(top) == limit:
+                    break
+        return top
+
+    def _bitmaps(self) -> Dict[str, BitmapIndex]:
+        """Get the bitmap indexes, building them in bulk on first use."""
+        self._refresh_view()
+        if self._bitmap_indexes is None:
+            self._live_rows = bits_from_rows(self._row_of.values(), len(self._rows))
+            self._bitmap_indexes = {
+                field: BitmapIndex.build(field, FIELD_GETTERS[field], self._rows)
+                for field in BITMAP_FIELDS
+            }
+        return self._bitmap_indexes
+
+    def bitmap(self, field: str, values: Any) -> int:
+        """
+        Get the bitset of rows whose field holds the value, or any of the values.
+
+        Args:
+            field: One of BITMAP_FIELDS
+            values: A value, or a list/tuple/set of values combined with OR
+
+        Returns:
+            Bitset over internal row numbers
+
+        Raises:
+            ValueError: If the field has no bitmap index
+        """
+        if field not in BITMAP_FIELDS:
+            raise ValueError(f"Field '{field}' has no bitmap index")
+        index = self._bitmaps()[field]
+        if isinstance(values, (list, tuple, set, frozenset)):
+            return index.lookup_any(values) & self._live_rows
+        return index.lookup(values) & self._live_rows
+
+    def match_bitmap(self, include: Optional[Dict[str, Any]] = None, exclude: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Combine bitmap filters: AND across fields, OR within a field, NOT for exclusions.
+
+        Args:
+            include: Field to accepted value(s); every field must match
+            exclude: Field to rejected value(s); rows matching any are removed
+
+        Returns:
+            Bitset of matching rows
+        """
+        self._bitmaps()
+        bits = self._live_rows
+        for field, values in (include or {}).items():
+            bits &= self.bitmap(field, values)
+        for field, values in (exclude or {}).items():
+            bits &= ~self.bitmap(field, values)
+        return bits
+
+    def facets(self, dimensions: Iterable[str] = DEFAULT_FACETS, mask: Optional[int] = None) -> Dict[str, Dict[Any, int]]:
+        """
+        Count publications per value for several dimensions at once.
+
+        Counts come straight from the bitmap indexes, so no publication is visited.
+
+        Args:
+            dimensions: Any of FACET_DIMENSIONS ("decade" is derived from "year")
+            mask: Bitset restricting the counted rows (e.g. Query.bitmap()), or None for all
+
+        Returns:
+            Dictionary of dimension to {value: count}, most frequent values first
+
+        Raises:
+            ValueError: If a dimension is unknown
+        """
+        indexes = self._bitmaps()
+        mask = self._live_rows if mask is None else mask & self._live_rows
+        result = {}
+        for dimension in dimensions:
+            if dimension not in FACET_DIMENSIONS:
+                raise ValueError(f"Unknown facet dimension: {dimension}")
+            if dimension == "decade":
+                counts = {}
+                for year, count in indexes["year"].counts(mask).items():
+                    decade = year // 10 * 10
+                    counts[decade] = counts.get(decade, 0) + count
+            else:
+                counts = indexes[dimension].counts(mask)
+            result[dimension] = sort_facet_counts(counts)
+        return result
+
+    def publications_in(self, bits: int) -> Iterator[Publication]:
+        """
+        Lazily yield the publications whose rows are set in the bitset.
+
+        Args:
+            bits: Bitset over internal row numbers
+
+        Returns:
+            Iterator of publications in collection order
+        """
+        rows = self._rows
+        for row in iter_bits(bits):
+            yield rows[row]
 
     def register_publication(self, publication: Publication) -> bool:
         """
@@ -45,11 +564,10 @@ class Collection:
         if publication.id in self._publications:
             raise ValueError(f"Publication with ID {publication.id} already exists.")
         
-        for existing_pub in self._publications.values():
-            if existing_pub == publication:
-                raise ValueError("Publication with same title and author already exists.")
+        if publication.identity in self._identity_index():
+            raise ValueError("Publication with same title and author already exists.")
             
-        self._publications[publication.id] = publication
+        self._attach(publication)
         return True
 
     def list_publications(self) -> List[Publication]:
@@ -72,7 +590,7 @@ class Collection:
             True if successfully removed, False if not found 
         """
         if publication_id in self._publications:
-            del self._publications[publication_id]
+            self._detach(self._publications[publication_id])
             return True
         return False
 
@@ -86,7 +604,9 @@ class Collection:
         Returns:
             List of publications by the specified author
         """
-        return [pub for pub in self._publications.values() if author.lower() in pub.author.lower()]
+        needle = author.lower()
+        lower = self.symbols.lower
+        return [pub for pub in self._publications.values() if needle in lower(pub.author)]
               
     def search_by_title(self, title: str) -> List[Publication]:
         """
@@ -110,7 +630,16 @@ class Collection:
         Returns:
             List of publications with the specified status
         """
-        return [pub for pub in self._publications.values() if status.upper() == pub.status]
+        return list(self.publications_in(self.bitmap("status", status.upper())))
+
+    def query(self) -> Query:
+        """
+        Start a composable query over the collection.
+
+        Returns:
+            Unfiltered Query; chain filters, ordering and limits on it and iterate lazily
+        """
+        return Query(self)
 
     def filter_by_reading_period(self, start_date: date, end_date: date) -> List[Publication]:
         """
@@ -121,14 +650,11 @@ class Collection:
             end_date: End of the period
 
         Returns:
-            List of publications read during the specified period
+            List of publications with a reading (current or archived) finished
+            during the specified period, each listed once, by first finish date
         """
-        return [
-            pub for pub in self._publications.values() 
-            if pub.status == "READ" 
-            and pub.end_read_date
-            and start_date <= pub.end_read_date <= end_date
-        ]
+        finished = {pub.id: pub for pub, _ in self.sessions_finished_between(start_date, end_date)}
+        return list(finished.values())
 
 
     def start_publication_reading(self, publication_id: int, configuration: Configuration) -> bool:
@@ -150,7 +676,7 @@ class Collection:
         if publication_id not in self._publications:
             raise ValueError(f"Publication with ID {publication_id} not found.")
         
-        simultaneous_reading = len(self.search_by_status("READING"))
+        simultaneous_reading = popcount(self.bitmap("status", "READING"))
 
         if simultaneous_reading >= configuration.simultaneous_reading_limit:
             raise ValueError("Maximum number of simultaneous readings reached.")
@@ -158,6 +684,87 @@ class Collection:
         self._publications[publication_id].start_reading()
         return True
     
+    def union(self, other: 'Collection') -> 'Collection':
+        """
+        Build a collection with the publications of both collections.
+
+        Publications of `other` equal to one of this collection are left out, so
+        this collection's copy wins. Runs in linear time.
+
+        Like difference and intersection, the result is a detached view: the
+        shared publications are not connected to it nor modified, so the
+        result can be dropped without leaving anything behind. Its membership
+        is a snapshot, but its queries always see the publications' current
+        state: indexes are rebuilt lazily on the first query after any
+        publication changed (see _refresh_view).
+
+        Args:
+            other: Collection to merge in
+
+        Returns:
+            New Collection sharing the publication objects
+
+        Raises:
+            ValueError: If a publication of `other` reuses an ID taken by a different publication
+        """
+        result = self._detached_view(self.list_publications())
+        identities = result._identity_index()
+        for pub in other._publications.values():
+            if pub.identity in identities:
+                continue
+            if pub.id in result._publications:
+                raise ValueError(f"Publication with ID {pub.id} already exists.")
+            result._attach(pub, connect=False)
+        return result
+
+    def difference(self, other: 'Collection') -> 'Collection':
+        """
+        Build a collection with the publications that have no equal in `other`.
+
+        The result is a detached view (see union).
+
+        Args:
+            other: Collection whose publications are excluded
+
+        Returns:
+            New Collection sharing the publication objects
+        """
+        identities = other._identity_index()
+        return self._detached_view(pub for pub in self._publications.values() if pub.identity not in identities)
+
+    def intersection(self, other: 'Collection') -> 'Collection':
+        """
+        Build a collection with the publications that have an equal in `other`.
+
+        The result is a detached view (see union).
+
+        Args:
+            other: Collection to intersect with
+
+        Returns:
+            New Collection sharing this collection's publication objects
+        """
+        identities = other._identity_index()
+        return self._detached_view(pub for pub in self._publications.values() if pub.identity in identities)
+
+    def deduplicate(self) -> List[Publication]:
+        """
+        Remove publications equal to an earlier one (e.g. after a trusted load or a bulk import).
+
+        Returns:
+            Removed publications; the first registered copy of each is kept
+        """
+        seen = set()
+        duplicates = []
+        for pub in self._publications.values():
+            if pub.identity in seen:
+                duplicates.append(pub)
+            else:
+                seen.add(pub.identity)
+        for pub in duplicates:
+            self._detach(pub)
+        return duplicates
+
     def to_dict(self) -> dict:
         """
         Serialize collection to dictionary.
@@ -170,20 +777,25 @@ class Collection:
         }
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'Collection':
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'Collection':
         """
         Create Collection from dictionary.
         
         Args:
             data: Dictionary with collection data
+            trusted: Build publications directly from snapshot data, skipping validation
             
         Returns:
             Reconstructed Collection instance
         """
         collection = cls()
-        for pub_data in data.get('publications', []):
-            pub = Publication.from_dict(pub_data)
-            collection._publications[pub.id] = pub
+        records = data.get('publications', [])
+        if trusted:
+            with paused_gc():
+                publications = [Publication.from_dict(pub_data, trusted=True) for pub_data in records]
+        else:
+            publications = [Publication.from_dict(pub_data) for pub_data in records]
+        collection._attach_many(publications)
         
         return collection
     
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Module containing the typed change events and the EventBus that delivers them.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple, Type
+
+class Event:
+    """Base class of every model event."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        """Returns a representation listing the event fields."""
+        fields = ", ".join(
+            f"{name}={getattr(self, name)!r}"
+            for klass in reversed(type(self).__mro__)
+            for name in getattr(klass, "__slots__", ())
+        )
+        return f"{type(self).__name__}({fields})"
+
+
+class PublicationEvent(Event):
+    """
+    Event concerning a single publication.
+
+    Attributes:
+        publication (Publication): Publication the event refers to
+    """
+
+    __slots__ = ("publication",)
+
+    def __init__(self, publication):
+        self.publication = publication
+
+
+class FieldChanged(PublicationEvent):
+    """
+    A publication field changed value. Subclasses fix the field name.
+
+    Attributes:
+        field (str): Name of the changed field (class attribute)
+        old_value: Value before the change
+        new_value: Value after the change
+    """
+
+    __slots__ = ("old_value", "new_value")
+    field = ""
+
+    def __init__(self, publication, old_value: Any, new_value: Any):
+        self.publication = publication
+        self.old_value = old_value
+        self.new_value = new_value
+
+
+class TitleChanged(FieldChanged):
+    """The title changed."""
+    __slots__ = ()
+    field = "title"
+
+
+class YearChanged(FieldChanged):
+    """The publication year changed."""
+    __slots__ = ()
+    field = "year"
+
+
+class PagesChanged(FieldChanged):
+    """The number of pages changed."""
+    __slots__ = ()
+    field = "number_of_pages"
+
+
+class StatusChanged(FieldChanged):
+    """The reading status changed (start_reading, finish_reading)."""
+    __slots__ = ()
+    field = "status"
+
+
+class RatingChanged(FieldChanged):
+    """The rating changed (rate_publication, or cleared by a re-read)."""
+    __slots__ = ()
+    field = "rating"
+
+
+class ProgressChanged(FieldChanged):
+    """The page reached in the current reading changed (record_progress)."""
+    __slots__ = ()
+    field = "current_page"
+
+
+class AnnotationEvent(PublicationEvent):
+    """
+    An annotation was added to or removed from a publication.
+
+    Attributes:
+        annotation (Annotation): The annotation concerned
+    """
+
+    __slots__ = ("annotation",)
+
+    def __init__(self, publication, annotation):
+        self.publication = publication
+        self.annotation = annotation
+
+
+class AnnotationAdded(AnnotationEvent):
+    """An annotation was added."""
+    __slots__ = ()
+
+
+class AnnotationRemoved(AnnotationEvent):
+    """An annotation was removed."""
+    __slots__ = ()
+
+
+class PublicationAdded(PublicationEvent):
+    """A publication was registered in a collection."""
+    __slots__ = ()
+
+
+class PublicationRemoved(PublicationEvent):
+    """A publication was removed from a collection."""
+    __slots__ = ()
+
+
+Handler = Callable[[Event], None]
+
+class EventBus:
+    """
+    Synchronous publish/subscribe dispatcher for model events.
+
+    Handlers subscribe to an event class and receive its subclasses too
+    (subscribing to FieldChanged delivers StatusChanged, RatingChanged, ...).
+    Handlers run in subscription order. The handler list of each concrete event
+    class is resolved once and cached until the subscriptions change.
+    """
+
+    __slots__ = ("_subscriptions", "_dispatch")
+
+    def __init__(self):
+        """Initialize a bus without subscribers."""
+        self._subscriptions: List[Tuple[Type[Event], Handler]] = []
+        self._dispatch: Dict[Type[Event], Tuple[Handler, ...]] = {}
+
+    def subscribe(self, handler: Handler, *event_types: Type[Event]) -> None:
+        """
+        Register a handler.
+
+        Args:
+            handler: Callable receiving the event
+            *event_types: Event classes to receive (default: every event)
+        """
+        for event_type in event_types or (Event,):
+            self._subscriptions.append((event_type, handler))
+        self._dispatch.clear()
+
+    def unsubscribe(self, handler: Handler, *event_types: Type[Event]) -> None:
+        """
+        Remove a handler registered with subscribe.
+
+        Args:
+            handler: Previously subscribed callable
+            *event_types: Event classes to stop receiving (default: every subscription of the handler)
+        """
+        self._subscriptions = [
+            (event_type, subscribed) for event_type, subscribed in self._subscriptions
+            if subscribed != handler or (event_types and event_type not in event_types)
+        ]
+        self._dispatch.clear()
+
+    def _handlers(self, event_type: Type[Event]) -> Tuple[Handler, ...]:
+        """Get (and cache) the handlers receiving an event class."""
+        handlers = self._dispatch.get(event_type)
+        if handlers is None:
+            handlers = tuple(
+                handler for subscribed, handler in self._subscriptions
+                if issubclass(event_type, subscribed)
+            )
+            self._dispatch[event_type] = handlers
+        return handlers
+
+    def has_subscribers(self, event_type: Type[Event] = Event) -> bool:
+        """Check whether publishing an event of this class would reach any handler."""
+        return bool(self._handlers(event_type))
+
+    def publish(self, event: Event) -> None:
+        """Deliver an event to every handler subscribed to its class or a base class."""
+        for handler in self._handlers(type(event)):
+            handler(event)
@@ -0,0 +1,485 @@
+"""
+Module containing the GroupBy hash-aggregation engine over publications or table columns.
+"""
+
+import operator
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+from .indexes import BITMAP_FIELDS
+from .query import FIELD_GETTERS
+from .table import PublicationTable
+
+KEY_FIELDS = ("author", "publisher", "genre", "type", "status", "year")
+VALUE_FIELDS = ("rating", "number_of_pages", "year")
+COMPARISONS: Dict[str, Callable[[Any, Any], bool]] = {
+    ">=": operator.ge, "<=": operator.le, "!=": operator.ne,
+    ">": operator.gt, "<": operator.lt, "=": operator.eq,
+}
+_CONDITION = re.compile(r"^\s*(.+?)\s*(>=|<=|!=|>|<|=)\s*(.+?)\s*$")
+
+class Aggregate(ABC):
+    """
+    Accumulator of one aggregate function over the rows of a group.
+
+    Missing values (None, or NaN from a ratings column) are skipped, as in SQL.
+    Each accumulator keeps O(1) state and merges with another of the same kind,
+    so groups can be aggregated per shard and reduced.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def add(self, value: Any) -> None:
+        """Account for one value."""
+        pass
+
+    @abstractmethod
+    def merge(self, other: 'Aggregate') -> 'Aggregate':
+        """Fold another accumulator of the same kind into this one and return self."""
+        pass
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Get the aggregate of the values added so far."""
+        pass
+
+
+class CountAggregate(Aggregate):
+    """Number of rows, or of non-missing values when counting a field."""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        if value is not None and value == value:
+            self.count += 1
+
+    def merge(self, other: 'CountAggregate') -> 'CountAggregate':
+        self.count += other.count
+        return self
+
+    def result(self) -> int:
+        return self.count
+
+
+class SumAggregate(Aggregate):
+    """Sum of the values (0 when there are none)."""
+
+    __slots__ = ("total",)
+
+    def __init__(self):
+        self.total = 0
+
+    def add(self, value: Any) -> None:
+        if value is not None and value == value:
+            self.total += value
+
+    def merge(self, other: 'SumAggregate') -> 'SumAggregate':
+        self.total += other.total
+        return self
+
+    def result(self) -> Any:
+        return self.total
+
+
+class AvgAggregate(Aggregate):
+    """Average of the values (None when there are none)."""
+
+    __slots__ = ("total", "count")
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        if value is not None and value == value:
+            self.total += value
+            self.count += 1
+
+    def merge(self, other: 'AvgAggregate') -> 'AvgAggregate':
+        self.total += other.total
+        self.count += other.count
+        return self
+
+    def result(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class MinAggregate(Aggregate):
+    """Smallest value (None when there are none)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = None
+
+    def add(self, value: Any) -> None:
+        if value is not None and value == value and (self.value is None or value < self.value):
+            self.value = value
+
+    def merge(self, other: 'MinAggregate') -> 'MinAggregate':
+        self.add(other.value)
+        return self
+
+    def result(self) -> Any:
+        return self.value
+
+
+class MaxAggregate(Aggregate):
+    """Largest value (None when there are none)."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = None
+
+    def add(self, value: Any) -> None:
+        if value is not None and value == value and (self.value is None or value > self.value):
+            self.value = value
+
+    def merge(self, other: 'MaxAggregate') -> 'MaxAggregate':
+        self.add(other.value)
+        return self
+
+    def result(self) -> Any:
+        return self.value
+
+
+AGGREGATES = {
+    "count": CountAggregate,
+    "sum": SumAggregate,
+    "avg": AvgAggregate,
+    "min": MinAggregate,
+    "max": MaxAggregate,
+}
+
+
+class AggregateSpec(NamedTuple):
+    """
+    One output column of a grouping.
+
+    Attributes:
+        name (str): Column name in the result rows
+        function (str): One of AGGREGATES
+        field (Optional[str]): One of VALUE_FIELDS, or None to count rows
+    """
+    name: str
+    function: str
+    field: Optional[str] = None
+
+
+class Condition(NamedTuple):
+    """
+    HAVING condition comparing a result column with a constant.
+
+    Attributes:
+        name (str): Aggregate or key column name
+        op (str): One of COMPARISONS
+        value (Any): Constant compared with the column value
+    """
+    name: str
+    op: str
+    value: Any
+
+
+def parse_aggregate(text: str) -> AggregateSpec:
+    """
+    Parse an aggregate written as "function" or "function:field" (e.g. "avg:rating").
+
+    Args:
+        text: Aggregate text, also used as the column name
+
+    Returns:
+        AggregateSpec named after the text
+    """
+    function, _, field = text.partition(":")
+    return AggregateSpec(text, function.strip(), field.strip() or None)
+
+def parse_condition(text: str) -> Condition:
+    """
+    Parse a condition written as "<column><op><value>" (e.g. "count>=2").
+
+    Numeric constants are converted to numbers; anything else is kept as text.
+
+    Raises:
+        ValueError: If the text is not a comparison
+    """
+    match = _CONDITION.match(text)
+    if match is None:
+        raise ValueError(f"Invalid condition: {text}")
+    name, op, value = match.groups()
+    try:
+        value = float(value)
+    except ValueError:
+        pass
+    return Condition(name, op, value)
+
+
+Source = Union[PublicationTable, Iterable[Any]]
+Groups = Dict[tuple, List[Aggregate]]
+
+class GroupBy:
+    """
+    Hash aggregation over publications: WHERE, GROUP BY, aggregates, HAVING, ORDER BY and LIMIT.
+
+    partial scans the source once and keeps one small accumulator per group and
+    aggregate, so memory is O(groups x aggregates) whatever the number of
+    publications. A Collection is filtered with its bitmap indexes; a
+    PublicationTable is grouped on its dictionary codes and columns, decoding
+    only one key per group. Partials of separate shards merge with combine, and
+    finalize applies HAVING, ORDER BY and LIMIT to the merged groups.
+
+    HAVING conditions and the ordering may also name an aggregate that is not
+    an output column (e.g. "count" with only "avg:rating" requested); it is
+    computed alongside the others and left out of the result rows.
+
+    Example:
+        GroupBy(["author"], ["avg:rating"], where={"status": "READ"},
+                having=["count>=2"], order_by="avg:rating", limit=10).run(collection)
+
+    Attributes:
+        keys (Tuple[str, ...]): Grouping fields (any of KEY_FIELDS)
+        aggregates (Tuple[AggregateSpec, ...]): Output columns
+        where (Dict[str, Any]): Field to accepted value(s), applied before grouping
+        having (Tuple[Condition, ...]): Conditions every output group must meet
+        order_by (Optional[str]): Column sorting the groups (default: the keys)
+        descending (bool): Sort from the largest value
+        limit (Optional[int]): Maximum number of groups returned
+    """
+
+    def __init__(self, keys: Union[str, Sequence[str]], aggregates: Sequence[Union[str, AggregateSpec]] = ("count",),
+                 where: Optional[Dict[str, Any]] = None, having: Sequence[Union[str, Condition]] = (),
+                 order_by: Optional[str] = None, descending: bool = True, limit: Optional[int] = None):
+        """
+        Initialize and validate a grouping.
+
+        Args:
+            keys: Grouping field, or fields
+            aggregates: AggregateSpec or "function[:field]" texts
+            where: Field to accepted value (a list/tuple/set matches any of its elements)
+            having: Condition or "<column><op><value>" texts
+            order_by: Aggregate or key column to sort by
+            descending: Sort from the largest value (missing values always last)
+            limit: Maximum number of groups
+
+        Raises:
+            ValueError: If a field, function, column or comparison is unknown
+        """
+        self.keys = (keys,) if isinstance(keys, str) else tuple(keys)
+        self.aggregates = tuple(
+            spec if isinstance(spec, AggregateSpec) else parse_aggregate(spec) for spec in aggregates
+        )
+        self.where = {
+            field: frozenset(value) if isinstance(value, (list, tuple, set, frozenset)) else frozenset([value])
+            for field, value in (where or {}).items()
+        }
+        self.having = tuple(
+            condition if isinstance(condition, Condition) else parse_condition(condition) for condition in having
+        )
+        self.order_by = order_by
+        self.descending = descending
+        self.limit = limit
+        self._hidden: Tuple[AggregateSpec, ...] = ()
+        self._validate()
+
+    @property
+    def _computed(self) -> Tuple[AggregateSpec, ...]:
+        """Output aggregates followed by the hidden ones only HAVING or ORDER BY use."""
+        return self.aggregates + self._hidden
+
+    def _validate(self) -> None:
+        """Reject unknown fields, functions and columns, and collect the hidden aggregates."""
+        if not self.keys:
+            raise ValueError("At least one grouping field is required")
+        for field in self.keys + tuple(self.where):
+            if field not in KEY_FIELDS:
+                raise ValueError(f"Cannot group or filter by '{field}'")
+        for spec in self.aggregates:
+            error = _spec_error(spec)
+            if error:
+                raise ValueError(error)
+        columns = set(self.keys) | {spec.name for spec in self.aggregates}
+        hidden: Dict[str, AggregateSpec] = {}
+
+        def known(name: str) -> bool:
+            if name in columns or name in hidden:
+                return True
+            spec = parse_aggregate(name)
+            if _spec_error(spec):
+                return False
+            hidden[name] = spec
+            return True
+
+        for condition in self.having:
+            if not known(condition.name):
+                raise ValueError(f"Unknown column in condition: {condition.name}")
+            if condition.op not in COMPARISONS:
+                raise ValueError(f"Unknown comparison: {condition.op}")
+        if self.order_by is not None and not known(self.order_by):
+            raise ValueError(f"Unknown column to order by: {self.order_by}")
+        if self.limit is not None and self.limit < 0:
+            raise ValueError("Limit cannot be negative")
+        self._hidden = tuple(hidden.values())
+
+    def _new_accumulators(self) -> List[Aggregate]:
+        """Create the accumulators of a new group."""
+        return [AGGREGATES[spec.function]() for spec in self._computed]
+
+    def partial(self, source: Source) -> Groups:
+        """
+        Aggregate the matching publications of a source in one pass.
+
+        Args:
+            source: Collection, PublicationTable or any iterable of publications
+
+        Returns:
+            Dictionary of group key tuple to accumulators, mergeable with combine
+        """
+        if isinstance(source, PublicationTable):
+            return self._partial_table(source)
+
+        if self.where and set(self.where) <= set(BITMAP_FIELDS) and hasattr(source, "match_bitmap"):
+            # Filtros resolvidos pelos índices bitmap da coleção
+            include = {field: list(values) for field, values in self.where.items()}
+            publications = source.publications_in(source.match_bitmap(include=include))
+        else:
+            publications = source.list_publications() if hasattr(source, "list_publications") else source
+            if self.where:
+                filters = [(FIELD_GETTERS[field], values) for field, values in self.where.items()]
+                publications = (p for p in publications if all(get(p) in values for get, values in filters))
+
+        key_getters = [FIELD_GETTERS[field] for field in self.keys]
+        value_getters = [
+            FIELD_GETTERS[spec.field] if spec.field is not None else _row_marker for spec in self._computed
+        ]
+        groups: Groups = {}
+        for pub in publications:
+            key = tuple(get(pub) for get in key_getters)
+            accumulators = groups.get(key)
+            if accumulators is None:
+                accumulators = groups[key] = self._new_accumulators()
+            for accumulator, get in zip(accumulators, value_getters):
+                accumulator.add(get(pub))
+        return groups
+
+    def _partial_table(self, table: PublicationTable) -> Groups:
+        """Aggregate a table over its columns, grouping on dictionary codes."""
+        rows: Iterable[int] = range(len(table))
+        for field, values in self.where.items():
+            column = _table_column(table, field)
+            if hasattr(column, "codes"):
+                codes = {column.code_of(value) for value in values} - {None}
+                rows = [row for row in rows if column.codes[row] in codes]
+            else:
+                rows = [row for row in rows if column[row] in values]
+
+        key_columns = [_table_column(table, field) for field in self.keys]
+        key_sequences = [getattr(column, "codes", column) for column in key_columns]
+        value_sequences = [
+            _table_column(table, spec.field) if spec.field is not None else None for spec in self._computed
+        ]
+        coded: Groups = {}
+        for row in rows:
+            key = tuple(sequence[row] for sequence in key_sequences)
+            accumulators = coded.get(key)
+            if accumulators is None:
+                accumulators = coded[key] = self._new_accumulators()
+            for accumulator, sequence in zip(accumulators, value_sequences):
+                accumulator.add(sequence[row] if sequence is not None else row)
+
+        decoders = [column.values.__getitem__ if hasattr(column, "codes") else None for column in key_columns]
+        return {
+            tuple(decode(part) if decode else part for decode, part in zip(decoders, key)): accumulators
+            for key, accumulators in coded.items()
+        }
+
+    @staticmethod
+    def combine(left: Groups, right: Groups) -> Groups:
+        """
+        Merge the groups of two partials built over disjoint sources.
+
+        Args:
+            left: Groups (updated in place)
+            right: Groups of the same grouping
+
+        Returns:
+            The left dictionary, holding the merged groups
+        """
+        for key, accumulators in right.items():
+            mine = left.get(key)
+            if mine is None:
+                left[key] = accumulators
+            else:
+                for accumulator, other in zip(mine, accumulators):
+                    accumulator.merge(other)
+        return left
+
+    def finalize(self, groups: Groups) -> List[Dict[str, Any]]:
+        """
+        Turn merged groups into result rows, applying HAVING, ORDER BY and LIMIT.
+
+        Args:
+            groups: Merged partial
+
+        Returns:
+            One dictionary per group, with the key fields and the aggregate columns
+        """
+        result = []
+        for key, accumulators in groups.items():
+            row = dict(zip(self.keys, key))
+            for spec, accumulator in zip(self._computed, accumulators):
+                row[spec.name] = accumulator.result()
+            if all(_meets(row[c.name], c) for c in self.having):
+                result.append(row)
+
+        result.sort(key=lambda row: tuple((row[field] is None, row[field]) for field in self.keys))
+        if self.order_by is not None:
+            column = self.order_by
+            if self.descending:
+                result.sort(key=lambda row: (row[column] is not None, row[column]), reverse=True)
+            else:
+                result.sort(key=lambda row: (row[column] is None, row[column]))
+        result = result if self.limit is None else result[:self.limit]
+        for row in result:
+            for spec in self._hidden:
+                del row[spec.name]
+        return result
+
+    def run(self, source: Source) -> List[Dict[str, Any]]:
+        """Group a source in one pass and return the final rows (see finalize)."""
+        return self.finalize(self.partial(source))
+
+
+def _spec_error(spec: AggregateSpec) -> Optional[str]:
+    """Explain why an aggregate is invalid, or None if it is valid."""
+    if spec.function not in AGGREGATES:
+        return f"Unknown aggregate function: {spec.function}"
+    if spec.field is None and spec.function != "count":
+        return f"Aggregate '{spec.function}' needs a field"
+    if spec.field is not None and spec.field not in VALUE_FIELDS:
+        return f"Cannot aggregate '{spec.field}'"
+    return None
+
+def _row_marker(pub) -> int:
+    """Value counted by a plain row count."""
+    return 1
+
+def _meets(value: Any, condition: Condition) -> bool:
+    """Check a HAVING condition; missing values never meet one."""
+    if value is None:
+        return False
+    try:
+        return COMPARISONS[condition.op](value, condition.value)
+    except TypeError:
+        return False
+
+def _table_column(table: PublicationTable, field: str):
+    """Get the table column holding a field."""
+    return {
+        "author": table.authors, "publisher": table.publishers, "genre": table.genres,
+        "type": table.types, "status": table.status, "year": table.years,
+        "rating": table.ratings, "number_of_pages": table.pages,
+    }[field]
@@ -0,0 +1,341 @@
+"""
+Module containing in-memory index structures used by the Collection.
+"""
+
+import bisect
+import heapq
+import math
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+BITMAP_FIELDS = ("status", "type", "genre", "publisher", "year")
+FACET_DIMENSIONS = BITMAP_FIELDS + ("decade",)
+DEFAULT_FACETS = ("genre", "publisher", "decade", "status")
+
+def popcount(bits: int) -> int:
+    """Count the set bits of a bitset."""
+    return bin(bits).count("1")
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """
+    Yield the positions of the set bits in ascending order.
+
+    The bitset is rendered once as a binary string so the scan runs in C,
+    instead of clearing the lowest bit of a large int at every step.
+    """
+    if not bits:
+        return
+    digits = format(bits, "b")[::-1]
+    position = digits.find("1")
+    while position != -1:
+        yield position
+        position = digits.find("1", position + 1)
+
+def sort_facet_counts(counts: Dict[Any, int]) -> Dict[Any, int]:
+    """Order facet counts from most to least frequent, ties by value."""
+    return dict(sorted(counts.items(), key=lambda item: (-item[1], str(item[0]))))
+
+def bits_from_rows(rows: Iterable[int], size: int) -> int:
+    """
+    Build a bitset from row numbers in a single pass.
+
+    Args:
+        rows: Row numbers to set
+        size: Total number of rows (upper bound for row numbers)
+    """
+    buffer = bytearray((size + 7) // 8)
+    for row in rows:
+        buffer[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buffer, "little")
+
+
+class BitmapIndex:
+    """
+    Bitmap index over a low-cardinality field.
+
+    Keeps, for each distinct value, a Python int used as a bitset over the
+    collection's dense row numbers. Boolean filters become bitwise operations.
+
+    Attributes:
+        field (str): Name of the indexed field
+    """
+
+    def __init__(self, field: str, getter: Callable[[Any], Any]):
+        """
+        Initialize an empty index.
+
+        Args:
+            field: Name of the indexed field
+            getter: Function extracting the field value from a publication
+        """
+        self.field = field
+        self._getter = getter
+        self._bitmaps: Dict[Any, int] = {}
+
+    @classmethod
+    def build(cls, field: str, getter: Callable[[Any], Any], rows: List[Optional[Any]]) -> 'BitmapIndex':
+        """
+        Build an index over all rows at once.
+
+        Args:
+            field: Name of the indexed field
+            getter: Function extracting the field value from a publication
+            rows: Publications by row number (None marks a free row)
+
+        Returns:
+            Populated BitmapIndex
+        """
+        index = cls(field, getter)
+        rows_by_value: Dict[Any, List[int]] = {}
+        for row, pub in enumerate(rows):
+            if pub is not None:
+                rows_by_value.setdefault(getter(pub), []).append(row)
+        index._bitmaps = {
+            value: bits_from_rows(value_rows, len(rows))
+            for value, value_rows in rows_by_value.items()
+        }
+        return index
+
+    def add(self, row: int, pub) -> None:
+        """Index a publication stored at the given row."""
+        value = self._getter(pub)
+        self._bitmaps[value] = self._bitmaps.get(value, 0) | (1 << row)
+
+    def discard(self, row: int, value: Any) -> None:
+        """Remove a row from the bitmap of the given value."""
+        bits = self._bitmaps.get(value, 0) & ~(1 << row)
+        if bits:
+            self._bitmaps[value] = bits
+        else:
+            self._bitmaps.pop(value, None)
+
+    def move(self, row: int, old_value: Any, new_value: Any) -> None:
+        """Move a row from the bitmap of one value to another."""
+        if old_value == new_value:
+            return
+        self.discard(row, old_value)
+        self._bitmaps[new_value] = self._bitmaps.get(new_value, 0) | (1 << row)
+
+    def lookup(self, value: Any) -> int:
+        """Get the bitset of rows holding the value."""
+        return self._bitmaps.get(value, 0)
+
+    def lookup_any(self, values: Iterable[Any]) -> int:
+        """Get the bitset of rows holding any of the values (OR)."""
+        bits = 0
+        for value in values:
+            bits |= self._bitmaps.get(value, 0)
+        return bits
+
+    def values(self) -> List[Any]:
+        """Get the distinct indexed values."""
+        return list(self._bitmaps)
+
+    def counts(self, mask: Optional[int] = None) -> Dict[Any, int]:
+        """
+        Count rows per value, optionally restricted to a mask.
+
+        Args:
+            mask: Bitset of rows to consider, or None for all rows
+
+        Returns:
+            Dictionary of value to number of rows (values with zero rows omitted)
+        """
+        counts = {}
+        for value, bits in self._bitmaps.items():
+            count = popcount(bits if mask is None else bits & mask)
+            if count:
+                counts[value] = count
+        return counts
+
+
+def rating_order(pub) -> tuple:
+    """Sort key for rated publications: rating descending, then title."""
+    return (-pub.rating, pub.title)
+
+def select_top_rated(publications: Iterable[Any], limit: int) -> List[Any]:
+    """
+    Select the best rated publications without sorting all of them.
+
+    Uses a bounded heap, so the cost is O(n log k) and the result matches
+    sorting every rated publication by rating_order and slicing.
+
+    Args:
+        publications: Publications to rank (unrated ones are skipped)
+        limit: Maximum number of publications to return
+
+    Returns:
+        Up to `limit` publications, best rated first
+    """
+    rated = (pub for pub in publications if pub.rating is not None)
+    return heapq.nsmallest(max(limit, 0), rated, key=rating_order)
+
+
+class RatingIndex:
+    """
+    Ordered index of rated publications.
+
+    Keeps sorted keys (-rating, title, id) plus a parallel list of negated ratings,
+    so the best rated publications are read from the front in O(k), rating ranges
+    are located by binary search and percentiles are read by position.
+    Unrated publications are not indexed.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._keys: List[tuple] = []
+        self._negated: List[float] = []
+        self._key_of: Dict[int, tuple] = {}
+
+    @classmethod
+    def build(cls, publications: Iterable[Any]) -> 'RatingIndex':
+        """Build the index over all publications at once."""
+        index = cls()
+        index._key_of = {
+            pub.id: (-pub.rating, pub.title, pub.id)
+            for pub in publications if pub.rating is not None
+        }
+        index._keys = sorted(index._key_of.values())
+        index._negated = [key[0] for key in index._keys]
+        return index
+
+    def __len__(self) -> int:
+        """Number of rated publications in the index."""
+        return len(self._keys)
+
+    def add(self, pub) -> None:
+        """Index a publication if it has a rating."""
+        if pub.rating is None:
+            return
+        key = (-pub.rating, pub.title, pub.id)
+        self._key_of[pub.id] = key
+        position = bisect.bisect_left(self._keys, key)
+        self._keys.insert(position, key)
+        self._negated.insert(position, key[0])
+
+    def discard(self, pub_id: int) -> None:
+        """Remove a publication from the index, if present."""
+        key = self._key_of.pop(pub_id, None)
+        if key is not None:
+            position = bisect.bisect_left(self._keys, key)
+            del self._keys[position]
+            del self._negated[position]
+
+    def update(self, pub) -> None:
+        """Re-index a publication after its rating or title changed."""
+        self.discard(pub.id)
+        self.add(pub)
+
+    def ids(self) -> Iterator[int]:
+        """Yield publication ids from best to worst rated."""
+        for key in self._keys:
+            yield key[2]
+
+    def ids_between(self, min_rating: Optional[float] = None, max_rating: Optional[float] = None) -> List[int]:
+        """
+        Get the ids of publications rated within the closed interval.
+
+        Args:
+            min_rating: Lower bound (inclusive), or None for no bound
+            max_rating: Upper bound (inclusive), or None for no bound
+
+        Returns:
+            Publication ids from best to worst rated
+        """
+        start = 0 if max_rating is None else bisect.bisect_left(self._negated, -max_rating)
+        stop = len(self._negated) if min_rating is None else bisect.bisect_right(self._negated, -min_rating)
+        return [key[2] for key in self._keys[start:stop]]
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Get the rating at a percentile using the nearest-rank method.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Rating at the percentile, or None if nothing is rated
+
+        Raises:
+            ValueError: If percent is outside 0-100
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        total = len(self._negated)
+        if total == 0:
+            return None
+        rank = max(1, math.ceil(percent / 100 * total))
+        return -self._negated[total - rank]
+
+
+class SessionIndex:
+    """
+    Ordered index of finished readings, re-reads included.
+
+    Keeps sorted (finish date ordinal, publication id) keys, so the readings
+    finished within any period are counted with two binary searches.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._keys: List[tuple] = []
+        self._keys_of: Dict[int, List[tuple]] = {}
+
+    @classmethod
+    def build(cls, publications: Iterable[Any]) -> 'SessionIndex':
+        """Build the index from every finished reading of the publications."""
+        index = cls()
+        for pub in publications:
+            keys = [
+                (session.end_read_date.toordinal(), pub.id)
+                for session in pub.reading_sessions() if session.end_read_date is not None
+            ]
+            if keys:
+                index._keys_of[pub.id] = keys
+                index._keys.extend(keys)
+        index._keys.sort()
+        return index
+
+    def __len__(self) -> int:
+        """Number of finished readings in the index."""
+        return len(self._keys)
+
+    def add(self, pub_id: int, end_date) -> None:
+        """Index a reading of a publication finished on end_date."""
+        key = (end_date.toordinal(), pub_id)
+        bisect.insort(self._keys, key)
+        self._keys_of.setdefault(pub_id, []).append(key)
+
+    def discard(self, pub_id: int) -> None:
+        """Remove every reading of a publication."""
+        for key in self._keys_of.pop(pub_id, ()):
+            del self._keys[bisect.bisect_left(self._keys, key)]
+
+    def _span(self, start_date, end_date) -> tuple:
+        """Get the slice bounds of the keys finished within the closed period."""
+        start = bisect.bisect_left(self._keys, (start_date.toordinal(),))
+        stop = bisect.bisect_left(self._keys, (end_date.toordinal() + 1,))
+        return start, stop
+
+    def count_between(self, start_date, end_date) -> int:
+        """Count the readings finished within the closed period."""
+        start, stop = self._span(start_date, end_date)
+        return stop - start
+
+    def between(self, start_date, end_date) -> List[tuple]:
+        """Get (finish date ordinal, publication id) keys within the period, by finish date."""
+        start, stop = self._span(start_date, end_date)
+        return self._keys[start:stop]
+
+    def counts_by_year(self) -> Dict[int, int]:
+        """Count finished readings per year, in year order."""
+        if not self._keys:
+            return {}
+        first = date.fromordinal(self._keys[0][0]).year
+        last = date.fromordinal(self._keys[-1][0]).year
+        counts = {}
+        for year in range(first, last + 1):
+            count = self.count_between(date(year, 1, 1), date(year, 12, 31))
+            if count:
+                counts[year] = count
+        return counts
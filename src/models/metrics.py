@@ -0,0 +1,326 @@
+"""
+Module containing the metric accumulators evaluated together in a single pass.
+"""
+
+import heapq
+import math
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from .indexes import rating_order
+
+STATUSES = ("UNREAD", "READING", "READ")
+RATING_BINS = 101  # Um por décimo de nota, de 0.0 a 10.0
+
+class Metric(ABC):
+    """
+    Accumulator of one report metric.
+
+    Receives every publication through add, then produces its value with result.
+    Metrics keep only what their result needs (counters, sums, a bounded
+    candidate buffer), never a copy of the publications. Accumulators of the
+    same kind built over separate chunks are combined with merge, so a metric
+    can be computed per shard and reduced.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def add(self, pub) -> None:
+        """Account for one publication."""
+        pass
+
+    @abstractmethod
+    def merge(self, other: 'Metric') -> 'Metric':
+        """Fold another accumulator of the same kind into this one and return self."""
+        pass
+
+    @abstractmethod
+    def result(self) -> Any:
+        """Get the metric value for the publications added so far."""
+        pass
+
+
+class Count(Metric):
+    """Number of publications."""
+
+    __slots__ = ("count",)
+
+    def __init__(self):
+        self.count = 0
+
+    def add(self, pub) -> None:
+        self.count += 1
+
+    def merge(self, other: 'Count') -> 'Count':
+        self.count += other.count
+        return self
+
+    def result(self) -> int:
+        return self.count
+
+
+class StatusCounts(Metric):
+    """(count, percentage) per status, in the Report.check_publications_by_status shape."""
+
+    __slots__ = ("counts", "total")
+
+    def __init__(self):
+        self.counts: Dict[str, int] = dict.fromkeys(STATUSES, 0)
+        self.total = 0
+
+    def add(self, pub) -> None:
+        self.total += 1
+        self.counts[pub.status] = self.counts.get(pub.status, 0) + 1
+
+    def merge(self, other: 'StatusCounts') -> 'StatusCounts':
+        self.total += other.total
+        for status, count in other.counts.items():
+            self.counts[status] = self.counts.get(status, 0) + count
+        return self
+
+    def result(self) -> Dict[str, Tuple[int, float]]:
+        return {
+            status: (self.counts[status], self.counts[status] / self.total * 100 if self.total else 0.0)
+            for status in STATUSES
+        }
+
+
+class RatingMean(Metric):
+    """Average rating, optionally restricted to one status (None when nothing is rated)."""
+
+    __slots__ = ("status", "total", "count")
+
+    def __init__(self, status: Optional[str] = None):
+        self.status = status
+        self.total = 0.0
+        self.count = 0
+
+    def add(self, pub) -> None:
+        rating = pub.rating
+        if rating is not None and (self.status is None or pub.status == self.status):
+            self.total += rating
+            self.count += 1
+
+    def merge(self, other: 'RatingMean') -> 'RatingMean':
+        self.total += other.total
+        self.count += other.count
+        return self
+
+    def result(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class RatingStats(Metric):
+    """
+    Streaming rating statistics of the EvaluationReportStrategy.
+
+    Uses O(1) memory whatever the number of ratings: Welford's online algorithm
+    for the mean and variance (merged with Chan's formula), running min and
+    max, and a fixed histogram with one bin per tenth from 0.0 to 10.0, the
+    grid rate_publication enforces (a rating loaded off it counts in the
+    nearest tenth). Each bin is labelled with the first rating seen in it and
+    the bins keep the order they were first filled in, so the distribution keys
+    and the most common rating (first seen wins a tie) match a Counter over the
+    ratings.
+    """
+
+    __slots__ = ("count", "mean", "m2", "minimum", "maximum", "bins", "labels", "order")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self.bins: List[int] = [0] * RATING_BINS
+        self.labels: List[Optional[float]] = [None] * RATING_BINS
+        self.order: List[int] = []
+
+    def add(self, pub) -> None:
+        if pub.rating is not None:
+            self.add_rating(pub.rating)
+
+    def add_rating(self, rating: float) -> None:
+        """Account for one rating value."""
+        self.count += 1
+        delta = rating - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (rating - self.mean)
+        if self.minimum is None or rating < self.minimum:
+            self.minimum = rating
+        if self.maximum is None or rating > self.maximum:
+            self.maximum = rating
+        index = min(max(round(rating * 10), 0), RATING_BINS - 1)
+        if not self.bins[index]:
+            self.labels[index] = rating
+            self.order.append(index)
+        self.bins[index] += 1
+
+    def merge(self, other: 'RatingStats') -> 'RatingStats':
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            self.bins, self.labels, self.order = list(other.bins), list(other.labels), list(other.order)
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        for index in other.order:
+            if not self.bins[index]:
+                self.labels[index] = other.labels[index]
+                self.order.append(index)
+            self.bins[index] += other.bins[index]
+        return self
+
+    def result(self) -> Dict[str, Any]:
+        if not self.count:
+            return {'count': 0, 'mean': None, 'std_dev': None, 'distribution': {},
+                    'most_common': None, 'min': None, 'max': None}
+        distribution = {self.labels[index]: self.bins[index] for index in sorted(self.order)}
+        # Empate: fica a nota vista primeiro, como em Counter.most_common
+        best = max(self.order, key=self.bins.__getitem__)
+        most_common = (self.labels[best], self.bins[best])
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'std_dev': math.sqrt(max(self.m2, 0.0) / (self.count - 1)) if self.count > 1 else 0.0,
+            'distribution': distribution,
+            'most_common': most_common,
+            'min': self.minimum,
+            'max': self.maximum,
+        }
+
+
+class TopRated(Metric):
+    """
+    Best rated publications (rating descending, then title), optionally of one status.
+
+    Candidates are buffered and pruned back to the limit whenever the buffer
+    grows past a few times the limit, so memory stays O(limit) and the total
+    cost O(n log limit).
+    """
+
+    __slots__ = ("limit", "status", "rated", "_candidates", "_capacity")
+
+    def __init__(self, limit: int, status: Optional[str] = None):
+        self.limit = max(limit, 0)
+        self.status = status
+        self.rated = 0
+        self._candidates: List[Any] = []
+        self._capacity = max(4 * self.limit, 64)
+
+    def add(self, pub) -> None:
+        if pub.rating is None or (self.status is not None and pub.status != self.status):
+            return
+        self.rated += 1
+        self._candidates.append(pub)
+        if len(self._candidates) > self._capacity:
+            self._prune()
+
+    def _prune(self) -> None:
+        """Keep only the current best `limit` candidates."""
+        self._candidates = heapq.nsmallest(self.limit, self._candidates, key=rating_order)
+
+    def extend(self, candidates: Iterable[Any], rated: int) -> None:
+        """
+        Add candidates already filtered by the caller (e.g. selected over table columns).
+
+        Args:
+            candidates: Rated publications or rows to rank
+            rated: Number of rated publications they were selected from
+        """
+        self.rated += rated
+        self._candidates.extend(candidates)
+        if len(self._candidates) > self._capacity:
+            self._prune()
+
+    def merge(self, other: 'TopRated') -> 'TopRated':
+        self.extend(other._candidates, other.rated)
+        return self
+
+    def result(self) -> List[Any]:
+        return heapq.nsmallest(self.limit, self._candidates, key=rating_order)
+
+
+class FinishedBetween(Metric):
+    """(publication, finish date) of every reading finished in a period, re-reads included, by finish date."""
+
+    __slots__ = ("start_date", "end_date", "finished")
+
+    def __init__(self, start_date: date, end_date: date):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.finished: List[Tuple[Any, date]] = []
+
+    def add(self, pub) -> None:
+        for session in pub.reading_sessions():
+            end = session.end_read_date
+            if end is not None and self.start_date <= end <= self.end_date:
+                self.finished.append((pub, end))
+
+    def merge(self, other: 'FinishedBetween') -> 'FinishedBetween':
+        self.finished.extend(other.finished)
+        return self
+
+    def result(self) -> List[Tuple[Any, date]]:
+        return sorted(self.finished, key=lambda item: item[1])
+
+
+class CurrentlyReading(Metric):
+    """Publications with a reading started and not finished."""
+
+    __slots__ = ("reading",)
+
+    def __init__(self):
+        self.reading: List[Any] = []
+
+    def add(self, pub) -> None:
+        if pub.start_read_date and not pub.end_read_date:
+            self.reading.append(pub)
+
+    def merge(self, other: 'CurrentlyReading') -> 'CurrentlyReading':
+        self.reading.extend(other.reading)
+        return self
+
+    def result(self) -> List[Any]:
+        return self.reading
+
+
+def evaluate(publications: Iterable[Any], metrics: Dict[str, Metric]) -> Dict[str, Any]:
+    """
+    Compute several metrics in one traversal of the publications.
+
+    Args:
+        publications: Publications to scan (any iterable, consumed once)
+        metrics: Accumulators by name
+
+    Returns:
+        Dictionary of metric name to result
+    """
+    adders = [metric.add for metric in metrics.values()]
+    for pub in publications:
+        for add in adders:
+            add(pub)
+    return {name: metric.result() for name, metric in metrics.items()}
+
+def merge_metrics(left: Dict[str, Metric], right: Dict[str, Metric]) -> Dict[str, Metric]:
+    """
+    Combine two sets of accumulators built over separate chunks.
+
+    Args:
+        left: Accumulators by name (updated in place)
+        right: Accumulators of the same names and kinds
+
+    Returns:
+        The left dictionary, holding the merged accumulators
+    """
+    for name, metric in right.items():
+        left[name].merge(metric)
+    return left
@@ -10,10 +10,15 @@ class DigitalAsset():
 
     Provides file path management and validation for digital publications.
 
+    The mixin declares no slots of its own: combining two bases with non-empty
+    __slots__ is a layout conflict, so each concrete class declares "_file_path".
+
     Attributes:
         file_path (str): Path to the digital file.
     """
 
+    __slots__ = ()
+
     def __init__(self, file_path: str = "", **kwargs):
         """
         Initialize digital asset capabilities.
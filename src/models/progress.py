@@ -0,0 +1,173 @@
+"""
+Module containing the ProgressLog class, a compact time series of pages read.
+"""
+
+import bisect
+import math
+import struct
+import sys
+from array import array
+from datetime import date, timedelta
+from typing import Dict, Iterator, Optional, Tuple
+
+MAGIC = b"PGL1"
+_HEADER = struct.Struct("<qI")
+
+class ProgressLog:
+    """
+    Append-only time series of the page reached in a publication.
+
+    Days (as ordinals) and pages live in two parallel int32 arrays, 8 bytes per
+    entry, with at most one entry per day (a later update on the same day
+    overwrites it). Entries are never removed, so the log spans every reading;
+    within one reading the page never goes back, while a new reading restarts
+    from page 0.
+
+    Attributes:
+        days (array): Day ordinals, non-decreasing
+        pages (array): Page reached on each day
+    """
+
+    __slots__ = ("days", "pages")
+
+    def __init__(self):
+        """Initialize an empty log."""
+        self.days = array("i")
+        self.pages = array("i")
+
+    def __len__(self) -> int:
+        """Number of entries."""
+        return len(self.days)
+
+    def __iter__(self) -> Iterator[Tuple[date, int]]:
+        """Yield (day, page) entries in chronological order."""
+        for ordinal, page in zip(self.days, self.pages):
+            yield date.fromordinal(ordinal), page
+
+    def record(self, page: int, day: date, since: Optional[date] = None) -> None:
+        """
+        Store the page reached on a day.
+
+        Args:
+            page: Page reached
+            day: Day of the update
+            since: Start of the current reading; within it the page never goes
+                back, even when the day's entry is overwritten (a new reading
+                restarts from page 0)
+
+        Raises:
+            ValueError: If the day is earlier than the last entry, or the page is
+                lower than the last one recorded in the same reading
+        """
+        ordinal = day.toordinal()
+        if self.days and ordinal < self.days[-1]:
+            raise ValueError("Progress must be recorded in chronological order")
+        if (since is not None and self.days and self.days[-1] >= since.toordinal()
+                and page < self.pages[-1]):
+            raise ValueError(f"The page cannot be lower than {self.pages[-1]} within the same reading")
+        if self.days and ordinal == self.days[-1]:
+            self.pages[-1] = page
+        else:
+            self.days.append(ordinal)
+            self.pages.append(page)
+
+    def _first_since(self, since: date) -> int:
+        """Index of the first entry on or after a day."""
+        return bisect.bisect_left(self.days, since.toordinal())
+
+    def current_page(self, since: Optional[date] = None) -> Optional[int]:
+        """
+        Get the last page recorded.
+
+        Args:
+            since: Only consider entries from this day on (e.g. the current reading's start)
+
+        Returns:
+            Page number, or None if nothing was recorded in that span
+        """
+        if not self.days or (since is not None and self._first_since(since) == len(self.days)):
+            return None
+        return self.pages[-1]
+
+    def pages_per_day(self, since: date) -> Optional[float]:
+        """
+        Average reading pace since a day (the reading's start, at page 0).
+
+        Args:
+            since: Day the reading started
+
+        Returns:
+            Pages per day up to the last entry, or None if nothing was recorded since then
+        """
+        if self.current_page(since) is None:
+            return None
+        elapsed = self.days[-1] - since.toordinal() + 1
+        return self.pages[-1] / elapsed
+
+    def eta(self, total_pages: int, since: date, today: date) -> Optional[date]:
+        """
+        Estimate the day the reading ends at the current pace.
+
+        Args:
+            total_pages: Number of pages of the publication
+            since: Day the reading started
+            today: Reference day for the estimate
+
+        Returns:
+            Estimated finish date, or None without progress to extrapolate from
+        """
+        pace = self.pages_per_day(since)
+        if not pace:
+            return None
+        remaining = max(total_pages - self.pages[-1], 0)
+        return today + timedelta(days=math.ceil(remaining / pace))
+
+
+def dump_logs(logs: Dict[int, ProgressLog]) -> bytes:
+    """
+    Encode the progress logs of several publications into the binary sidecar format.
+
+    Layout: MAGIC, then per publication a (pub_id int64, count uint32) header
+    followed by the day and page arrays as little-endian int32.
+    """
+    chunks = [MAGIC]
+    for pub_id, log in logs.items():
+        if not len(log):
+            continue
+        days, pages = array("i", log.days), array("i", log.pages)
+        if sys.byteorder != "little":
+            days.byteswap()
+            pages.byteswap()
+        chunks.append(_HEADER.pack(pub_id, len(log)))
+        chunks.append(days.tobytes())
+        chunks.append(pages.tobytes())
+    return b"".join(chunks)
+
+def load_logs(data: bytes) -> Dict[int, ProgressLog]:
+    """
+    Decode the binary sidecar format written by dump_logs.
+
+    Raises:
+        ValueError: If the data is not a progress file or is truncated
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("Not a progress file")
+    logs = {}
+    offset = len(MAGIC)
+    while offset < len(data):
+        if offset + _HEADER.size > len(data):
+            raise ValueError("Truncated progress file")
+        pub_id, count = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        if offset + 8 * count > len(data):
+            raise ValueError("Truncated progress file")
+        log = ProgressLog()
+        log.days.frombytes(data[offset:offset + 4 * count])
+        offset += 4 * count
+        log.pages.frombytes(data[offset:offset + 4 * count])
+        offset += 4 * count
+        if sys.byteorder != "little":
+            log.days.byteswap()
+            log.pages.byteswap()
+        logs[pub_id] = log
+    return logs
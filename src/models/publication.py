@@ -4,8 +4,35 @@ Module containing the Publication class and its specializations.
 
 from datetime import date
 from abc import ABC
+from typing import Optional
 from .annotation import Annotation
 from .mixins import DigitalAsset
+from .serialization import date_to_str, str_to_date
+from .sessions import ReadingSession
+from .progress import ProgressLog
+from .events import (
+    AnnotationAdded, AnnotationRemoved, PagesChanged, ProgressChanged, RatingChanged,
+    StatusChanged, TitleChanged, YearChanged
+)
+
+_change_count = 0
+
+def change_count() -> int:
+    """
+    Number of field changes made to any publication so far.
+
+    Detached collection views (see Collection.union) compare it with the value
+    seen when they built their indexes to know whether these may be stale.
+    """
+    return _change_count
+
+def identity_key(title: str, author: str) -> tuple:
+    """
+    Normalized (title, author) pair identifying a publication regardless of
+    letter case and repeated whitespace.
+    """
+    return (" ".join(title.casefold().split()), " ".join(author.casefold().split()))
+
 
 class Publication(ABC):
     """
@@ -27,10 +54,42 @@ class Publication(ABC):
         end_read_date (Optional[date]): End date of reading
         rating (Optional[float]): Score from 0 to 10
         rating_inclusion_date (Optional[date]): Date of the rating
-        annotations (list): List of associated annotations
+        annotations (list): Associated annotations, in insertion order
+        past_sessions (Tuple[ReadingSession, ...]): Earlier readings, archived by start_reading on a re-read
+        progress (Optional[ProgressLog]): Pages reached over time (persisted apart from the JSON snapshot)
+
+    Annotations are kept in an id-keyed dictionary, so lookup and removal by ID
+    are O(1). New IDs come from next_annotation_id(), a per-publication counter
+    persisted with the publication, so IDs are never reused after a removal.
+
+    State changes are published as typed events (see events.py) on every
+    EventBus connected with connect(). With no bus connected, no event object
+    is ever created.
         
     """
 
+    __slots__ = (
+        "__id",
+        "_buses",
+        "_title",
+        "_year",
+        "_author",
+        "_publisher",
+        "_genre",
+        "_number_of_pages",
+        "_pub_type",
+        "__status",
+        "_start_read_date",
+        "_end_read_date",
+        "__rating",
+        "_rating_inclusion_date",
+        "_annotations",
+        "_annotation_seq",
+        "_identity",
+        "_history",
+        "_progress",
+    )
+
     def __init__(self,
         pub_id: int,
         title: str,
@@ -60,6 +119,8 @@ class Publication(ABC):
         if not isinstance(pub_id, int) or pub_id <= 0:
             raise ValueError("ID must be a positive integer")
         self.__id = pub_id
+        self._buses = ()
+        self._identity = None
 
         self.title = title       
 
@@ -76,7 +137,10 @@ class Publication(ABC):
         self._end_read_date = None
         self.__rating = None
         self._rating_inclusion_date = None
-        self._annotations = []
+        self._annotations = {}
+        self._annotation_seq = 0
+        self._history = ()
+        self._progress = None
 
     def __str__(self):
         """Returns a string representation of the publication."""
@@ -86,11 +150,28 @@ class Publication(ABC):
         """Returns a detailed representation of the publication for debugging."""
         return f"Publication(id={self.id}, title='{self.title}', year={self.year}, author='{self.author}', status='{self.status}')"
     
+    @property
+    def identity(self) -> tuple:
+        """
+        Get the normalized (title, author) key used for equality and hashing.
+
+        Computed on first use and cached until the title changes.
+        """
+        if self._identity is None:
+            self._identity = identity_key(self._title, self._author)
+        return self._identity
+
     def __eq__(self, other):
-        """Checks equality based on title and author."""
+        """Checks equality based on title and author (ignoring case and extra whitespace)."""
+        if self is other:
+            return True
         if not isinstance(other, Publication):
             return False
-        return self.title == other.title and self.author == other.author
+        return self.identity == other.identity
+
+    def __hash__(self):
+        """Hash consistent with __eq__. Renaming a publication changes its hash."""
+        return hash(self.identity)
     
     def __lt__(self, other):
         """Compares publications by year for sorting."""
@@ -104,10 +185,7 @@ class Publication(ABC):
 
         Returns:
             Dictionary with all publication data
-        """       
-        def date_to_str(d):
-            return d.isoformat() if d else None
-
+        """
         return {
             "type": self.__class__.__name__,
             "pub_id": self.id,
@@ -122,16 +200,22 @@ class Publication(ABC):
             "end_read_date": date_to_str(self.end_read_date),
             "rating": self.rating,
             "rating_inclusion_date": date_to_str(self._rating_inclusion_date),
-            "annotations": [ann.to_dict() for ann in self._annotations]
+            "annotations": [ann.to_dict() for ann in self._annotations.values()],
+            "annotation_seq": self._annotation_seq,
+            "reading_history": [session.to_dict() for session in self._history]
         }
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'Publication':
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'Publication':
         """
         Create appropriate Publication subclass from dictionary.
 
         Args:
             data: Dictionary with publication data
+            trusted: Skip validation for data previously written by to_dict
+                (our own snapshots). Imports must keep the default strict mode.
+                A record missing any key written by to_dict (older or hand-edited
+                snapshots) is loaded through the strict path instead.
 
         Returns:
             Book or Magazine instance
@@ -139,12 +223,56 @@ class Publication(ABC):
         pub_type = data.get("type")
 
         if pub_type == "Book":
-            return Book.from_dict(data)
+            return Book.from_dict(data, trusted)
         elif pub_type == "Magazine":
-            return Magazine.from_dict(data)
+            return Magazine.from_dict(data, trusted)
         else:
             raise ValueError(f"Unknown publication type: {pub_type}")
 
+    def _load_trusted(self, data: dict) -> None:
+        """
+        Fill the core attributes straight from snapshot data, skipping the
+        property setters and _restore_state. Every key written by to_dict must be present
+        (annotation_seq and reading_history may be missing in snapshots written before they existed).
+
+        This is a protected method for internal use by the trusted loading path.
+        """
+        self.__id = data["pub_id"]
+        self._buses = ()
+        self._identity = None
+        self._title = data["title"]
+        self._year = data["year"]
+        self._author = data["author"]
+        self._publisher = data["publisher"]
+        self._genre = data["genre"]
+        self._number_of_pages = data["number_of_pages"]
+        self._pub_type = data["type"]
+        self.__status = data["status"]
+        self._start_read_date = str_to_date(data["start_read_date"])
+        self._end_read_date = str_to_date(data["end_read_date"])
+        self.__rating = data["rating"]
+        self._rating_inclusion_date = str_to_date(data["rating_inclusion_date"])
+        annotations = data["annotations"]
+        if annotations:
+            self._annotations = {ann["annotation_id"]: Annotation.from_dict(ann, trusted=True) for ann in annotations}
+            self._annotation_seq = max(data.get("annotation_seq") or 0, self._highest_annotation_number())
+        else:
+            self._annotations = {}
+            self._annotation_seq = data.get("annotation_seq") or 0
+        history = data.get("reading_history")
+        self._history = tuple(map(ReadingSession.from_dict, history)) if history else ()
+        self._progress = None
+
+    def _intern_fields(self, symbols) -> None:
+        """
+        Replace author, publisher and genre by the shared instances held in a SymbolTable.
+
+        This is a protected method for internal use by Collection.
+        """
+        self._author = symbols.intern(self._author)
+        self._publisher = symbols.intern(self._publisher)
+        self._genre = symbols.intern(self._genre)
+
     @property
     def id(self):
         """Get publication ID."""
@@ -160,7 +288,10 @@ class Publication(ABC):
         """Set publication title with validation."""
         if not value or not value.strip():
             raise ValueError("Title cannot be empty")
+        old_value = getattr(self, "_title", None)
         self._title = value.strip()
+        self._identity = None
+        self._emit(TitleChanged, old_value, self._title)
 
     @property
     def year(self):
@@ -173,7 +304,9 @@ class Publication(ABC):
         if value < 1500:
             raise ValueError("Year must be greater than or equal to 1500")
         
+        old_value = getattr(self, "_year", None)
         self._year = value
+        self._emit(YearChanged, old_value, value)
 
     @property
     def author(self):
@@ -200,7 +333,14 @@ class Publication(ABC):
         """Set publication number of pages wuth validation."""
         if value <= 0:
             raise ValueError("Number of pages must be greater than zero")
+        old_value = getattr(self, "_number_of_pages", None)
         self._number_of_pages = value
+        self._emit(PagesChanged, old_value, value)
+
+    @property
+    def pub_type(self):
+        """Get publication's type (Book/Magazine)."""
+        return self._pub_type
 
     @property
     def status(self):
@@ -218,14 +358,16 @@ class Publication(ABC):
     
     @property
     def annotations(self):
-        return self._annotations
+        """Get the annotations in insertion order."""
+        return list(self._annotations.values())
 
     def start_reading(self):
         """
         Starts reading the publication.
         
         Updates the status to READING and registers the start date.
-        If publication was already READ, resets rating and end date.
+        If publication was already READ, the finished reading (dates and rating)
+        is archived in past_sessions and the current rating and end date are reset.
         
         Raises:
             ValueError: If publication already has READING status.
@@ -233,13 +375,19 @@ class Publication(ABC):
         if self.__status == "READING":
             raise ValueError("Publication already has READING status")
         
+        old_status = self.__status
+        old_rating = self.__rating
+
         if self.__status == "READ":
+            self._history += (ReadingSession(self._start_read_date, self._end_read_date, self.__rating),)
             self._end_read_date = None
             self.__rating = None
             self._rating_inclusion_date = None
         
         self.__status = "READING"
         self._start_read_date = date.today()
+        self._emit(StatusChanged, old_status, "READING")
+        self._emit(RatingChanged, old_rating, self.__rating)
         
 
     def finish_reading(self):
@@ -256,19 +404,132 @@ class Publication(ABC):
         
         self.__status = "READ"
         self._end_read_date = date.today()
+        self._emit(StatusChanged, "READING", "READ")
 
-    def _restore_state(self, status, start_date, end_date, rating, rating_date, annotations):
+    def _restore_state(self, status, start_date, end_date, rating, rating_date, annotations, annotation_seq=None,
+                       history=()):
         """
         Restore internal state (used during deserialization).
 
         This is a protected method for internal use during loading from persistence.
         """
+        old_status = self.__status
+        old_rating = self.__rating
         self.__status = status
         self._start_read_date = start_date
         self._end_read_date = end_date
         self.__rating = rating
         self._rating_inclusion_date = rating_date
-        self._annotations = annotations
+        self._annotations = {ann.id: ann for ann in annotations}
+        self._annotation_seq = max(annotation_seq or 0, self._highest_annotation_number())
+        self._history = tuple(history)
+        self._emit(StatusChanged, old_status, status)
+        self._emit(RatingChanged, old_rating, rating)
+
+    def connect(self, bus) -> None:
+        """
+        Publish this publication's change events on an EventBus.
+
+        Args:
+            bus: EventBus that will receive the events (e.g. Collection.events)
+        """
+        self._buses += (bus,)
+
+    def disconnect(self, bus) -> None:
+        """Stop publishing on a bus previously passed to connect()."""
+        if bus in self._buses:
+            buses = list(self._buses)
+            buses.remove(bus)
+            self._buses = tuple(buses)
+
+    def _emit(self, event_type, old_value, new_value) -> None:
+        """Count a real change of a field and publish it as a FieldChanged event, if a bus is connected."""
+        global _change_count
+        if old_value != new_value:
+            _change_count += 1
+            if self._buses:
+                self._publish(event_type(self, old_value, new_value))
+
+    def _publish(self, event) -> None:
+        """Deliver an event to every connected bus."""
+        for bus in self._buses:
+            bus.publish(event)
+
+    @property
+    def past_sessions(self):
+        """Get the archived earlier readings, oldest first."""
+        return self._history
+
+    def reading_sessions(self):
+        """
+        Get every reading of the publication, oldest first.
+
+        Returns:
+            List of ReadingSession: the archived ones plus the current reading,
+            if it was started (its end_read_date is None while in progress)
+        """
+        sessions = list(self._history)
+        if self._start_read_date is not None:
+            sessions.append(ReadingSession(self._start_read_date, self._end_read_date, self.__rating))
+        return sessions
+
+    @property
+    def progress(self) -> Optional[ProgressLog]:
+        """Get the page progress log, or None if progress was never recorded."""
+        return self._progress
+
+    @property
+    def current_page(self) -> Optional[int]:
+        """Get the last page recorded during the current reading, or None."""
+        if self._progress is None or self._start_read_date is None:
+            return None
+        return self._progress.current_page(since=self._start_read_date)
+
+    def record_progress(self, page: int, day: Optional[date] = None) -> None:
+        """
+        Record the page reached in the current reading.
+
+        Args:
+            page: Page reached (0 to number_of_pages)
+            day: Day of the update (default: today); one entry is kept per day
+
+        Raises:
+            TypeError: If page is not an int
+            ValueError: If the publication is not being read, the page is out
+                of range or below an earlier day of this reading, or the day is
+                before the reading started or the last update
+        """
+        if not isinstance(page, int):
+            raise TypeError("The page must be of int type")
+
+        if self.__status != "READING":
+            raise ValueError("Progress can only be recorded while reading")
+
+        if page < 0 or page > self._number_of_pages:
+            raise ValueError(f"The page must be between 0 and {self._number_of_pages}")
+
+        day = day or date.today()
+        if day < self._start_read_date:
+            raise ValueError("Progress cannot be recorded before the reading started")
+
+        old_page = self.current_page
+        if self._progress is None:
+            self._progress = ProgressLog()
+        self._progress.record(page, day, since=self._start_read_date)
+        self._emit(ProgressChanged, old_page, page)
+
+    def _restore_progress(self, log: ProgressLog) -> None:
+        """
+        Attach a progress log read from persistence.
+
+        This is a protected method for internal use during loading from persistence.
+        """
+        self._progress = log
+
+    @property
+    def times_read(self) -> int:
+        """Get the number of finished readings, re-reads included."""
+        return len(self._history) + (self.__status == "READ")
 
     @property
     def start_read_date(self):
@@ -285,7 +546,7 @@ class Publication(ABC):
         Registers a rating for the publication.
 
         Args:
-            rating_value: Value between 0 and 10
+            rating_value: Value between 0 and 10, with at most one decimal place
 
         Raises:
             TypeError: If rating_value is not int or float.
@@ -300,8 +561,13 @@ class Publication(ABC):
         if 0 > rating_value or rating_value > 10:
             raise ValueError("The rating cannot be less than 0 or greater than 10")
 
+        if round(rating_value * 10) / 10 != rating_value:
+            raise ValueError("The rating must have at most one decimal place")
+
+        old_rating = self.__rating
         self.__rating = rating_value
         self._rating_inclusion_date = date.today()
+        self._emit(RatingChanged, old_rating, rating_value)
 
     def add_annotation(self, annotation: Annotation) -> None:
         """
@@ -315,8 +581,14 @@ class Publication(ABC):
         """
         if not isinstance(annotation, Annotation):
             raise TypeError("The annotation must be an Annotation instance")
+
+        if annotation.id in self._annotations:
+            raise ValueError(f"Annotation with ID {annotation.id} already exists")
         
-        self._annotations.append(annotation)
+        self._annotations[annotation.id] = annotation
+        self._annotation_seq = max(self._annotation_seq, self._annotation_number(annotation.id))
+        if self._buses:
+            self._publish(AnnotationAdded(self, annotation))
 
     def list_annotations(self):
         """
@@ -325,7 +597,41 @@ class Publication(ABC):
         Returns:
             List of Annotation objects (Shallow copy)
         """
-        return self._annotations[:]
+        return list(self._annotations.values())
+
+    def get_annotation(self, annotation_id: str) -> Optional[Annotation]:
+        """
+        Get an annotation by ID.
+
+        Args:
+            annotation_id: Identifier of the annotation
+
+        Returns:
+            The Annotation, or None if the publication has no annotation with that ID
+        """
+        return self._annotations.get(annotation_id)
+
+    def next_annotation_id(self) -> str:
+        """
+        Allocate a new annotation ID ("ann_<pub_id>_<n>").
+
+        The counter only moves forward, so an ID freed by remove_annotation is never handed out again.
+
+        Returns:
+            Unused annotation ID
+        """
+        self._annotation_seq += 1
+        return f"ann_{self.id}_{self._annotation_seq}"
+
+    def _annotation_number(self, annotation_id: str) -> int:
+        """Get n from an ID shaped like next_annotation_id's output, or 0 for any other ID."""
+        prefix = f"ann_{self.id}_"
+        number = annotation_id[len(prefix):] if annotation_id.startswith(prefix) else ""
+        return int(number) if number.isdigit() else 0
+
+    def _highest_annotation_number(self) -> int:
+        """Get the largest counter value used by the current annotations."""
+        return max(map(self._annotation_number, self._annotations), default=0)
 
     def remove_annotation(self, annotation_id: str):
         """
@@ -337,11 +643,12 @@ class Publication(ABC):
         Returns:
             True if successfully removed, False otherwise
         """
-        for annotation in self._annotations:
-            if annotation.id == annotation_id:
-                self._annotations.remove(annotation)
-                return True
-        return False
+        annotation = self._annotations.pop(annotation_id, None)
+        if annotation is None:
+            return False
+        if self._buses:
+            self._publish(AnnotationRemoved(self, annotation))
+        return True
 
 class Book(Publication, DigitalAsset):
     """
@@ -354,6 +661,8 @@ class Book(Publication, DigitalAsset):
         edition (int): Edition number
     """
 
+    __slots__ = ("_file_path", "_isbn", "_edition")
+
     def __init__(self,
         pub_id,
         title,
@@ -412,12 +721,27 @@ class Book(Publication, DigitalAsset):
         return data
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'Book':
-        """Create Book from dictionary."""
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'Book':
+        """
+        Create Book from dictionary.
+
+        Args:
+            data: Dictionary with book data
+            trusted: Build the object directly from snapshot data, without validation
+                (falls back to the strict path if a snapshot key is missing)
+        """
+        if trusted:
+            try:
+                book = cls.__new__(cls)
+                book._load_trusted(data)
+                book._file_path = data["file_path"]
+                book._isbn = data["isbn"]
+                book._edition = data["edition"]
+                return book
+            except KeyError:
+                # Registro antigo ou editado à mão: segue pelo caminho validado, com valores padrão
+                pass
 
-        def str_to_date(date_str):
-            return date.fromisoformat(date_str) if date_str else None
-        
         annotations_data = data.get("annotations", [])
         annotations = [Annotation.from_dict(ann) for ann in annotations_data]
         
@@ -440,7 +764,9 @@ class Book(Publication, DigitalAsset):
             end_date=str_to_date(data.get("end_read_date")),
             rating=data.get("rating"),
             rating_date=str_to_date(data.get("rating_inclusion_date")),
-            annotations=annotations
+            annotations=annotations,
+            annotation_seq=data.get("annotation_seq"),
+            history=[ReadingSession.from_dict(session) for session in data.get("reading_history", [])]
         )
         
         return book
@@ -470,6 +796,8 @@ class Magazine(Publication, DigitalAsset):
         issue_number (int): Magazine issue/edition number
     """
 
+    __slots__ = ("_file_path", "_issn", "_issue_number")
+
     def __init__(self,
         pub_id,
         title,
@@ -528,12 +856,27 @@ class Magazine(Publication, DigitalAsset):
         return data
     
     @classmethod
-    def from_dict(cls, data: dict) -> 'Magazine':
-        """Create Magazine from dictionary."""
+    def from_dict(cls, data: dict, trusted: bool = False) -> 'Magazine':
+        """
+        Create Magazine from dictionary.
+
+        Args:
+            data: Dictionary with magazine data
+            trusted: Build the object directly from snapshot data, without validation
+                (falls back to the strict path if a snapshot key is missing)
+        """
+        if trusted:
+            try:
+                magazine = cls.__new__(cls)
+                magazine._load_trusted(data)
+                magazine._file_path = data["file_path"]
+                magazine._issn = data["issn"]
+                magazine._issue_number = data["issue_number"]
+                return magazine
+            except KeyError:
+                # Registro antigo ou editado à mão: segue pelo caminho validado, com valores padrão
+                pass
 
-        def str_to_date(date_str):
-            return date.fromisoformat(date_str) if date_str else None
-        
         annotations_data = data.get("annotations", [])
         annotations = [Annotation.from_dict(ann) for ann in annotations_data]
 
@@ -556,7 +899,9 @@ class Magazine(Publication, DigitalAsset):
             end_date=str_to_date(data.get("end_read_date")),
             rating=data.get("rating"),
             rating_date=str_to_date(data.get("rating_inclusion_date")),
-            annotations=annotations
+            annotations=annotations,
+            annotation_seq=data.get("annotation_seq"),
+            history=[ReadingSession.from_dict(session) for session in data.get("reading_history", [])]
         )
 
         return magazine
@@ -0,0 +1,386 @@
+"""
+Module containing the Query class.
+"""
+
+import heapq
+from datetime import date
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from .indexes import BITMAP_FIELDS, DEFAULT_FACETS, FACET_DIMENSIONS, popcount, sort_facet_counts
+
+FIELD_GETTERS: Dict[str, Callable[[Any], Any]] = {
+    "id": lambda pub: pub.id,
+    "title": lambda pub: pub.title,
+    "author": lambda pub: pub.author,
+    "publisher": lambda pub: pub.publisher,
+    "year": lambda pub: pub.year,
+    "genre": lambda pub: pub.genre,
+    "number_of_pages": lambda pub: pub.number_of_pages,
+    "type": lambda pub: pub.pub_type,
+    "status": lambda pub: pub.status,
+    "rating": lambda pub: pub.rating,
+    "start_read_date": lambda pub: pub.start_read_date,
+    "end_read_date": lambda pub: pub.end_read_date,
+    "rating_inclusion_date": lambda pub: pub.rating_inclusion_date,
+}
+
+class Query:
+    """
+    Composable, lazily evaluated query over a Collection.
+
+    Filters are accumulated through chained calls and only evaluated when the query is iterated.
+    Equality filters and exclusions on bitmap-indexed fields, and rating ranges, are pushed down
+    to the collection indexes as bitwise AND/OR/NOT; the remaining predicates are applied to each
+    candidate publication, cheapest first.
+
+    Example:
+        collection.query().filter(status="READ", type="Book").author_contains("Orwell") \\
+            .rating_between(min_rating=8).order_by("rating", descending=True).limit(5)
+    """
+
+    def __init__(self, collection):
+        """
+        Initialize an unfiltered query.
+
+        Args:
+            collection: Collection the query runs against
+        """
+        self._collection = collection
+        self._criteria: Dict[str, frozenset] = {}
+        self._exclusions: Dict[str, frozenset] = {}
+        self._min_rating: Optional[float] = None
+        self._max_rating: Optional[float] = None
+        self._text_filters: List[Callable[[Any], bool]] = []
+        self._predicates: List[Callable[[Any], bool]] = []
+        self._order: Optional[tuple] = None
+        self._offset = 0
+        self._limit: Optional[int] = None
+        self._fields: Optional[tuple] = None
+
+    def _clone(self) -> 'Query':
+        """Return a copy of the query so each builder call leaves the original untouched."""
+        query = Query(self._collection)
+        query._criteria = dict(self._criteria)
+        query._exclusions = dict(self._exclusions)
+        query._min_rating = self._min_rating
+        query._max_rating = self._max_rating
+        query._text_filters = list(self._text_filters)
+        query._predicates = list(self._predicates)
+        query._order = self._order
+        query._offset = self._offset
+        query._limit = self._limit
+        query._fields = self._fields
+        return query
+
+    def filter(self, **criteria) -> 'Query':
+        """
+        Keep only publications whose fields equal the given values.
+
+        A list, tuple or set value matches any of its elements. Repeated filters
+        on the same field are intersected.
+
+        Args:
+            **criteria: Field name and accepted value(s), e.g. status="READ", year=[2024, 2025]
+
+        Returns:
+            New filtered Query
+
+        Raises:
+            ValueError: If a field is unknown
+        """
+        query = self._clone()
+        for field, value in criteria.items():
+            accepted = self._normalize(field, value)
+            if field in query._criteria:
+                accepted = query._criteria[field] & accepted
+            query._criteria[field] = accepted
+        return query
+
+    def exclude(self, **criteria) -> 'Query':
+        """
+        Drop publications whose fields equal any of the given values.
+
+        Args:
+            **criteria: Field name and rejected value(s), e.g. status="READ"
+
+        Returns:
+            New filtered Query
+
+        Raises:
+            ValueError: If a field is unknown
+        """
+        query = self._clone()
+        for field, value in criteria.items():
+            query._exclusions[field] = query._exclusions.get(field, frozenset()) | self._normalize(field, value)
+        return query
+
+    @staticmethod
+    def _normalize(field: str, value: Any) -> frozenset:
+        """Validate a filter field and turn its value(s) into a set."""
+        if field not in FIELD_GETTERS:
+            raise ValueError(f"Unknown field: {field}")
+        values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+        if field == "status":
+            values = [v.upper() for v in values]
+        return frozenset(values)
+
+    def author_contains(self, text: str) -> 'Query':
+        """Keep publications whose author contains the text (case-insensitive)."""
+        needle = text.lower()
+        lower = self._collection.symbols.lower
+        query = self._clone()
+        query._text_filters.append(lambda pub: needle in lower(pub.author))
+        return query
+
+    def title_contains(self, text: str) -> 'Query':
+        """Keep publications whose title contains the text (case-insensitive)."""
+        needle = text.lower()
+        query = self._clone()
+        query._text_filters.append(lambda pub: needle in pub.title.lower())
+        return query
+
+    def rating_between(self, min_rating: Optional[float] = None, max_rating: Optional[float] = None) -> 'Query':
+        """
+        Keep rated publications whose rating lies in the closed interval.
+
+        Args:
+            min_rating: Lower bound (inclusive), or None for no bound
+            max_rating: Upper bound (inclusive), or None for no bound
+        """
+        query = self._clone()
+        if min_rating is not None:
+            query._min_rating = min_rating if query._min_rating is None else max(query._min_rating, min_rating)
+        if max_rating is not None:
+            query._max_rating = max_rating if query._max_rating is None else min(query._max_rating, max_rating)
+        return query
+
+    def finished_between(self, start_date: date, end_date: date) -> 'Query':
+        """Keep publications whose reading ended within the period (inclusive)."""
+        query = self._clone()
+        query._predicates.append(
+            lambda pub: pub.end_read_date is not None and start_date <= pub.end_read_date <= end_date
+        )
+        return query
+
+    def where(self, predicate: Callable[[Any], bool]) -> 'Query':
+        """Keep publications for which the predicate returns True."""
+        query = self._clone()
+        query._predicates.append(predicate)
+        return query
+
+    def order_by(self, field: str, descending: bool = False) -> 'Query':
+        """
+        Sort results by a field. Publications without a value always come last.
+
+        Args:
+            field: Field name to sort by
+            descending: Sort from highest to lowest
+
+        Raises:
+            ValueError: If the field is unknown
+        """
+        if field not in FIELD_GETTERS:
+            raise ValueError(f"Unknown field: {field}")
+        query = self._clone()
+        query._order = (field, descending)
+        return query
+
+    def offset(self, count: int) -> 'Query':
+        """Skip the first results."""
+        if count < 0:
+            raise ValueError("Offset cannot be negative")
+        query = self._clone()
+        query._offset = count
+        return query
+
+    def limit(self, count: int) -> 'Query':
+        """Return at most the given number of results."""
+        if count < 0:
+            raise ValueError("Limit cannot be negative")
+        query = self._clone()
+        query._limit = count
+        return query
+
+    def select(self, *fields: str) -> 'Query':
+        """
+        Project results into dictionaries with only the given fields.
+
+        Raises:
+            ValueError: If a field is unknown
+        """
+        for field in fields:
+            if field not in FIELD_GETTERS:
+                raise ValueError(f"Unknown field: {field}")
+        query = self._clone()
+        query._fields = fields or None
+        return query
+
+    def _uses_id_lookup(self) -> bool:
+        """Check whether candidates come straight from the id dictionary."""
+        return "id" in self._criteria
+
+    def _has_rating_range(self) -> bool:
+        """Check whether the query restricts ratings."""
+        return self._min_rating is not None or self._max_rating is not None
+
+    def _uses_bitmaps(self) -> bool:
+        """Check whether candidates come from the bitmap and rating indexes."""
+        return not self._uses_id_lookup() and (
+            self._has_rating_range()
+            or any(field in BITMAP_FIELDS for field in (*self._criteria, *self._exclusions))
+        )
+
+    def bitmap(self) -> int:
+        """
+        Get the bitset of rows selected by the index-backed filters of this query.
+
+        Bitmap field filters and the rating range are reflected; other filters are not.
+        """
+        include = {f: v for f, v in self._criteria.items() if f in BITMAP_FIELDS}
+        exclude = {f: v for f, v in self._exclusions.items() if f in BITMAP_FIELDS}
+        bits = self._collection.match_bitmap(include, exclude)
+        if self._has_rating_range():
+            bits &= self._collection.rating_bitmap(self._min_rating, self._max_rating)
+        return bits
+
+    def _candidates(self) -> Iterable[Any]:
+        """
+        Choose the cheapest source of candidate publications.
+
+        Returns:
+            Iterable of publications that may match the query
+        """
+        publications = self._collection._publications
+        if self._uses_id_lookup():
+            ids = self._criteria["id"]
+            return (publications[pub_id] for pub_id in sorted(ids) if pub_id in publications)
+        if self._uses_bitmaps():
+            return self._collection.publications_in(self.bitmap())
+        return publications.values()
+
+    def _residual_predicates(self) -> List[Callable[[Any], bool]]:
+        """Build the predicates not answered by the candidate source, cheapest first."""
+        pushed_down = set()
+        if self._uses_id_lookup():
+            pushed_down.add("id")
+        elif self._uses_bitmaps():
+            pushed_down.update(BITMAP_FIELDS)
+            pushed_down.add("rating")
+
+        predicates = []
+        for field, accepted in self._criteria.items():
+            if field in pushed_down:
+                continue
+            getter = FIELD_GETTERS[field]
+            predicates.append(lambda pub, getter=getter, accepted=accepted: getter(pub) in accepted)
+        for field, rejected in self._exclusions.items():
+            if field in pushed_down:
+                continue
+            getter = FIELD_GETTERS[field]
+            predicates.append(lambda pub, getter=getter, rejected=rejected: getter(pub) not in rejected)
+
+        if self._has_rating_range() and "rating" not in pushed_down:
+            low = self._min_rating if self._min_rating is not None else float("-inf")
+            high = self._max_rating if self._max_rating is not None else float("inf")
+            predicates.append(lambda pub: pub.rating is not None and low <= pub.rating <= high)
+
+        return predicates + self._text_filters + self._predicates
+
+    def _matches(self) -> Iterator[Any]:
+        """Yield matching publications in collection order."""
+        predicates = self._residual_predicates()
+        for pub in self._candidates():
+            if all(predicate(pub) for predicate in predicates):
+                yield pub
+
+    def _ordered(self, matches: Iterator[Any]) -> Iterable[Any]:
+        """Apply ordering, selecting only the needed head when a limit is set."""
+        field, descending = self._order
+        getter = FIELD_GETTERS[field]
+
+        if descending:
+            key = lambda pub: (getter(pub) is not None, getter(pub))
+        else:
+            key = lambda pub: (getter(pub) is None, getter(pub))
+
+        if self._limit is not None:
+            needed = self._offset + self._limit
+            select = heapq.nlargest if descending else heapq.nsmallest
+            return select(needed, matches, key=key)
+        return sorted(matches, key=key, reverse=descending)
+
+    def _project(self, pub) -> Any:
+        """Convert a publication into the selected projection."""
+        if self._fields is None:
+            return pub
+        return {field: FIELD_GETTERS[field](pub) for field in self._fields}
+
+    def __iter__(self) -> Iterator[Any]:
+        """Lazily evaluate the query."""
+        results = self._matches()
+        if self._order is not None:
+            results = self._ordered(results)
+
+        stop = None if self._limit is None else self._offset + self._limit
+        for pub in islice(results, self._offset, stop):
+            yield self._project(pub)
+
+    def all(self) -> List[Any]:
+        """Evaluate the query into a list."""
+        return list(self)
+
+    def first(self) -> Optional[Any]:
+        """Return the first result, or None if nothing matches."""
+        return next(iter(self.limit(1)), None)
+
+    def count(self) -> int:
+        """Count results, honouring offset and limit."""
+        if self._uses_bitmaps() and not self._residual_predicates():
+            total = max(0, popcount(self.bitmap()) - self._offset)
+            return total if self._limit is None else min(total, self._limit)
+        return sum(1 for _ in self)
+
+    def facets(self, dimensions: Iterable[str] = DEFAULT_FACETS) -> Dict[str, Dict[Any, int]]:
+        """
+        Count the publications matched by the filters per value of each dimension.
+
+        Ordering, offset and limit are ignored. When every filter is answered by the
+        bitmap indexes the counts are pure bitwise operations; otherwise all dimensions
+        are counted together in a single pass over the matches.
+
+        Args:
+            dimensions: Any of FACET_DIMENSIONS
+
+        Returns:
+            Dictionary of dimension to {value: count}, most frequent values first
+
+        Raises:
+            ValueError: If a dimension is unknown
+        """
+        dimensions = tuple(dimensions)
+        for dimension in dimensions:
+            if dimension not in FACET_DIMENSIONS:
+                raise ValueError(f"Unknown facet dimension: {dimension}")
+
+        if not self._uses_id_lookup() and not self._residual_predicates():
+            return self._collection.facets(dimensions, mask=self.bitmap())
+
+        counts = {dimension: {} for dimension in dimensions}
+        for pub in self._matches():
+            for dimension, dimension_counts in counts.items():
+                if dimension == "decade":
+                    value = pub.year // 10 * 10
+                else:
+                    value = FIELD_GETTERS[dimension](pub)
+                dimension_counts[value] = dimension_counts.get(value, 0) + 1
+        return {dimension: sort_facet_counts(value_counts) for dimension, value_counts in counts.items()}
+
+    def explain(self) -> str:
+        """Describe how the query will be executed."""
+        if self._uses_id_lookup():
+            source = "id lookup"
+        elif self._uses_bitmaps():
+            source = "bitmap index"
+        else:
+            source = "full scan"
+        return f"source={source}; residual_predicates={len(self._residual_predicates())}"
@@ -2,21 +2,32 @@
 Module containing the Report class.
 """
 
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple, Union
 from datetime import date
+from itertools import compress
 from .collection import Collection
 from .publication import Publication
 from .configuration import Configuration
+from .indexes import rating_order
+from .table import PublicationTable
+from .metrics import Count, RatingMean, StatusCounts, TopRated, evaluate
+
+Source = Union[Collection, PublicationTable]
 
 class Report:
     """
     Stateless service class responsible for generating metrics and reports.
 
     Process data from a Collection to produce various statics about the user's reading habits and library composition.
+    Every method also accepts a PublicationTable, in which case the metrics are computed over its columns.
+    For a Collection, counts, averages and yearly completions come from its maintained
+    CollectionStats, and the top publications from its rating index, so no method scans it.
+    print_full_report and generate_status_report_dict also accept any iterable of
+    publications, whose metrics are then accumulated together in a single pass.
     """
 
     @staticmethod
-    def check_total_publications(collection: Collection) -> int:
+    def check_total_publications(collection: Source) -> int:
         """
         Count total number of publications in the collection.
 
@@ -26,10 +37,10 @@ class Report:
         Returns:
             Total number of publications
         """
-        return len(collection.list_publications())
+        return len(collection)
 
     @staticmethod
-    def check_publications_by_status(collection: Collection) -> Dict[str, Tuple[int, float]]:
+    def check_publications_by_status(collection: Source) -> Dict[str, Tuple[int, float]]:
         """
         Calculate quantity and percentage of publicatons by status.
 
@@ -44,16 +55,16 @@ class Report:
         statuses = ["UNREAD", "READING", "READ"]
         if total == 0:
             return {"UNREAD": (0, 0.0), "READING": (0, 0.0), "READ": (0, 0.0)}
+        if isinstance(collection, Collection):
+            return collection.stats.status_breakdown()
+        counts = collection.status.counts()
         return {
-            status: (
-                count := len(collection.search_by_status(status)),
-                (count / total * 100) if total > 0 else 0.0
-            )
+            status: (counts.get(status, 0), counts.get(status, 0) / total * 100)
             for status in statuses
         }
 
     @staticmethod
-    def calculate_average_rating(collection: Collection) -> float:
+    def calculate_average_rating(collection: Source) -> float:
         """
         Calculate average rating of all read publications.
 
@@ -63,12 +74,15 @@ class Report:
         Returns:
             Average rating (0-10), or 0 if no rated publications exist
         """
-        ratings = [pub.rating for pub in collection.search_by_status("READ") if pub.rating is not None]
+        if isinstance(collection, Collection):
+            average = collection.stats.average_rating
+            return average if average is not None else 0.0
 
+        ratings = collection.rated_values(collection.status.mask("READ"))
         return sum(ratings) / len(ratings) if ratings else 0.0
 
     @staticmethod
-    def check_top_5_publications(collection: Collection) -> List[Publication]:
+    def check_top_5_publications(collection: Source) -> List[Publication]:
         """
         Get the top 5 highest-rated publications.
 
@@ -76,14 +90,22 @@ class Report:
             collection: Collection to analyze
 
         Returns:
-            List of up to 5 publications sorted by rating (highest first)
+            List of up to 5 publications sorted by rating (highest first), then title
         """
-        return sorted([pub for pub in collection.search_by_status("READ") if pub.rating is not None],
-                         key=lambda pub : pub.rating,
-                         reverse=True)[:5]
+        return Report._top_read(collection, 5)
+
+    @staticmethod
+    def _top_read(collection: Source, limit: int) -> List[Publication]:
+        """Get the best rated READ publications from the rating index or the table columns."""
+        if isinstance(collection, PublicationTable):
+            read_rated = compress(range(len(collection)), map(
+                bool.__and__, collection.status.mask("READ"), collection.rated_mask()
+            ))
+            return sorted(collection.rows(read_rated), key=rating_order)[:limit]
+        return collection.top_rated(limit, status="READ")
 
     @staticmethod
-    def check_annual_goal_progress(collection: Collection, configuration: Configuration) -> Dict[str, any]:
+    def check_annual_goal_progress(collection: Source, configuration: Configuration) -> Dict[str, any]:
         """
         Check progress towards annual reading goal.
 
@@ -94,20 +116,22 @@ class Report:
         Returns:
             Dictionary with keys:
             - 'goal': targer number
-            - 'completed': books read this year
+            - 'completed': readings finished this year (re-reads included)
             - 'remaining': books still needed
             - 'percentage': progress percentage
             - 'on_track': boolena indicating if on pace
         """
-        read_books = collection.search_by_status("READ")
-
         current_year = date.today().year
-        books_this_year = [
-            book for book in read_books
-            if book.end_read_date and book.end_read_date.year == current_year
-        ]
 
-        completed = len(books_this_year)
+        first_day, last_day = date(current_year, 1, 1), date(current_year, 12, 31)
+
+        if isinstance(collection, PublicationTable):
+            this_year = collection.ended_between_mask(first_day, last_day)
+            completed = sum(compress(collection.status.mask("READ"), this_year))
+            completed += len(collection.archived_rows_between(first_day, last_day))
+        else:
+            completed = collection.stats.completions_in(current_year)
+
         goal = configuration.annual_goal
 
         current_month = date.today().month
@@ -130,7 +154,36 @@ class Report:
         }
 
     @staticmethod
-    def print_status_report(collection: Collection) -> None:
+    def summarize(collection: Union[Source, Iterable[Publication]], top: int = 5) -> Dict[str, Any]:
+        """
+        Compute the metrics of the full report together.
+
+        Args:
+            collection: Collection, PublicationTable or iterable of publications
+            top: Number of best rated READ publications to include (0 skips the ranking)
+
+        Returns:
+            Dictionary with 'total', 'by_status', 'average_rating' (0.0 if nothing is
+            rated) and 'top' keys, in the shapes of the matching check_* methods
+        """
+        if isinstance(collection, (Collection, PublicationTable)):
+            return {
+                "total": Report.check_total_publications(collection),
+                "by_status": Report.check_publications_by_status(collection),
+                "average_rating": Report.calculate_average_rating(collection),
+                "top": Report._top_read(collection, top) if top > 0 else [],
+            }
+        accumulators = {"total": Count(), "by_status": StatusCounts(), "average_rating": RatingMean(status="READ")}
+        if top > 0:
+            accumulators["top"] = TopRated(top, status="READ")
+        metrics = evaluate(collection, accumulators)
+        metrics.setdefault("top", [])
+        if metrics["average_rating"] is None:
+            metrics["average_rating"] = 0.0
+        return metrics
+
+    @staticmethod
+    def print_status_report(collection: Source) -> None:
         """
         Print formatted status report to console.
 
@@ -170,17 +223,18 @@ class Report:
         print("\n" + "="*60 + "\n")
 
     @staticmethod
-    def print_full_report(collection: Collection) -> None:
+    def print_full_report(collection: Union[Source, Iterable[Publication]]) -> None:
         """
         Print comprehensive report with multiple metrics.
 
         Args:
-            collection: Collection to analyze
+            collection: Collection, PublicationTable or iterable of publications to analyze
         """
-        total = Report.check_total_publications(collection)
-        by_status = Report.check_publications_by_status(collection)
-        avg_rating = Report.calculate_average_rating(collection)
-        top_5 = Report.check_top_5_publications(collection)
+        summary = Report.summarize(collection)
+        total = summary["total"]
+        by_status = summary["by_status"]
+        avg_rating = summary["average_rating"]
+        top_5 = summary["top"]
         
         print("\n" + "="*70)
         print("📊 RELATÓRIO COMPLETO DA BIBLIOTECA")
@@ -227,18 +281,19 @@ class Report:
         print("\n" + "="*70 + "\n")
 
     @staticmethod
-    def generate_status_report_dict(collection: Collection) -> Dict:
+    def generate_status_report_dict(collection: Union[Source, Iterable[Publication]]) -> Dict:
         """
         Generate status report as a dictionary (useful for JSON export or APIs).
 
         Args:
-            collection: Collection to analyze
+            collection: Collection, PublicationTable or iterable of publications to analyze
 
         Returns:
             Dictionary with report data
         """
-        total = Report.check_total_publications(collection)
-        by_status = Report.check_publications_by_status(collection)
+        summary = Report.summarize(collection, top=0)
+        total = summary["total"]
+        by_status = summary["by_status"]
         
         return {
             "total_publications": total,
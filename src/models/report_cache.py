@@ -0,0 +1,108 @@
+"""
+Module containing the ReportCache class, rendered reports keyed by library version.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Optional
+
+MAX_ENTRIES = 32
+
+class ReportCache:
+    """
+    Rendered report outputs of one library version.
+
+    Entries are keyed by the strategy (or command) name and its parameters, and
+    the whole cache belongs to one version of the library, usually a content
+    hash of the snapshot. Any mutation produces a new version, and looking up
+    or storing under a new version drops every entry of the old one, so a stale
+    report is never returned.
+
+    Attributes:
+        version (Optional[str]): Library version the entries were computed for
+        max_entries (int): Number of entries kept (oldest dropped first)
+    """
+
+    def __init__(self, version: Optional[str] = None, max_entries: int = MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            version: Library version the entries belong to
+            max_entries: Number of entries kept
+        """
+        self.version = version
+        self.max_entries = max_entries
+        self._entries: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        """Number of cached reports."""
+        return len(self._entries)
+
+    @staticmethod
+    def key(strategy: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the entry key of a report.
+
+        Args:
+            strategy: Strategy or command name
+            params: JSON-serializable parameters the output depends on
+
+        Returns:
+            Stable hexadecimal key
+        """
+        payload = json.dumps([strategy, params or {}], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _sync(self, version: str) -> None:
+        """Drop every entry if the library version changed."""
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+
+    def get(self, strategy: str, params: Optional[Dict[str, Any]], version: str) -> Optional[str]:
+        """
+        Get a cached report output.
+
+        Args:
+            strategy: Strategy or command name
+            params: Parameters of the report
+            version: Current library version
+
+        Returns:
+            The cached output, or None if missing or computed for another version
+        """
+        self._sync(version)
+        return self._entries.get(self.key(strategy, params))
+
+    def put(self, strategy: str, params: Optional[Dict[str, Any]], version: str, output: str) -> None:
+        """
+        Store a report output computed for a library version.
+
+        Args:
+            strategy: Strategy or command name
+            params: Parameters of the report
+            version: Library version the output was computed from
+            output: Rendered report
+        """
+        self._sync(version)
+        key = self.key(strategy, params)
+        self._entries.pop(key, None)
+        self._entries[key] = output
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def to_dict(self) -> dict:
+        """Convert the cache to a dictionary for JSON serialization."""
+        return {"version": self.version, "entries": dict(self._entries)}
+
+    @classmethod
+    def from_dict(cls, data: dict, max_entries: int = MAX_ENTRIES) -> 'ReportCache':
+        """Create a cache from a dictionary written by to_dict."""
+        cache = cls(data.get("version"), max_entries)
+        cache._entries.update(data.get("entries", {}))
+        return cache
@@ -0,0 +1,217 @@
+"""
+Module containing the ReadingRollups class, reading totals per month and year kept up to date.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from .stats import RatingSum
+
+class PeriodTotals:
+    """
+    Reading totals of one period (a month or a year).
+
+    Attributes:
+        finished (int): Readings finished in the period, re-reads included
+        pages (int): Pages of those readings
+        ratings (RatingSum): Exact sum of the ratings given to those readings
+        rating_count (int): Number of rated readings
+    """
+
+    __slots__ = ("finished", "pages", "ratings", "rating_count")
+
+    def __init__(self, finished: int = 0, pages: int = 0, rating_sum: Union[float, str] = 0.0,
+                 rating_count: int = 0):
+        """Initialize the totals (empty by default); rating_sum also takes the "p/q" form of to_list."""
+        self.finished = finished
+        self.pages = pages
+        self.ratings = RatingSum.of(rating_sum)
+        self.rating_count = rating_count
+
+    def __eq__(self, other):
+        """Two totals are equal when every counter matches."""
+        if not isinstance(other, PeriodTotals):
+            return NotImplemented
+        return self.to_list() == other.to_list()
+
+    def __repr__(self):
+        return (f"PeriodTotals(finished={self.finished}, pages={self.pages}, "
+                f"average_rating={self.average_rating})")
+
+    @property
+    def rating_sum(self) -> float:
+        """Sum of the ratings given to the readings."""
+        return self.ratings.value()
+
+    @property
+    def average_rating(self) -> Optional[float]:
+        """Average rating of the rated readings, or None if none was rated."""
+        return self.ratings.mean(self.rating_count) if self.rating_count else None
+
+    def is_empty(self) -> bool:
+        """Whether nothing was finished or rated in the period."""
+        return not self.finished and not self.rating_count
+
+    def merge(self, other: 'PeriodTotals') -> 'PeriodTotals':
+        """Add the totals of another period and return self."""
+        self.finished += other.finished
+        self.pages += other.pages
+        self.ratings.merge(other.ratings)
+        self.rating_count += other.rating_count
+        return self
+
+    def to_list(self) -> list:
+        """Convert the totals to a compact list for JSON serialization."""
+        return [self.finished, self.pages, self.ratings.to_json(), self.rating_count]
+
+
+class ReadingRollups:
+    """
+    Finished readings, pages read and ratings per month, for every year.
+
+    Each finished reading, current or archived, counts in the month its
+    end_read_date falls in, with the publication's page count and the rating
+    given to that reading. Built with one pass over a collection, then adjusted
+    on every registration, removal, finish, rating and page count change, so
+    the totals of any month, year or range of years are read without visiting a
+    publication. Year totals add up at most 12 months.
+
+    Ratings only exist on READ publications and start_reading archives them
+    with the finished reading, so re-reading moves nothing between periods.
+    """
+
+    __slots__ = ("_months",)
+
+    def __init__(self):
+        """Initialize empty rollups."""
+        self._months: Dict[Tuple[int, int], PeriodTotals] = {}
+
+    @classmethod
+    def build(cls, publications: Iterable[Any]) -> 'ReadingRollups':
+        """Compute the rollups of the publications."""
+        rollups = cls()
+        for pub in publications:
+            rollups.add(pub)
+        return rollups
+
+    def _totals(self, day) -> PeriodTotals:
+        """Get the (possibly new) totals of the month of a date."""
+        key = (day.year, day.month)
+        totals = self._months.get(key)
+        if totals is None:
+            totals = self._months[key] = PeriodTotals()
+        return totals
+
+    def _drop_if_empty(self, day) -> None:
+        """Forget the month of a date once nothing is counted in it."""
+        key = (day.year, day.month)
+        totals = self._months.get(key)
+        if totals is not None and totals.is_empty():
+            del self._months[key]
+
+    def _count_rating(self, day, rating: float, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a rating in the month of a date."""
+        totals = self._totals(day)
+        totals.ratings.add(rating, sign)
+        totals.rating_count += sign
+        self._drop_if_empty(day)
+
+    def _shift(self, pub, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) the finished readings of a publication."""
+        pages = pub.number_of_pages or 0
+        for session in pub.reading_sessions():
+            end = session.end_read_date
+            if end is None:
+                continue
+            totals = self._totals(end)
+            totals.finished += sign
+            totals.pages += sign * pages
+            if session.rating is not None:
+                self._count_rating(end, session.rating, sign)
+            self._drop_if_empty(end)
+
+    def add(self, pub) -> None:
+        """Count the finished readings of a publication."""
+        self._shift(pub, 1)
+
+    def discard(self, pub) -> None:
+        """Remove the finished readings of a counted publication."""
+        self._shift(pub, -1)
+
+    def update(self, pub, field: str, old_value: Any, new_value: Any) -> None:
+        """
+        Apply a change reported by a counted publication.
+
+        Args:
+            pub: Changed publication (already holding the new value)
+            field: Name of the changed field; "status", "rating" and "number_of_pages" matter
+            old_value: Value before the change
+            new_value: Value after the change
+        """
+        end = pub.end_read_date
+        if field == "status":
+            if new_value == "READ" and end is not None:
+                totals = self._totals(end)
+                totals.finished += 1
+                totals.pages += pub.number_of_pages or 0
+        elif field == "rating":
+            # Fora de READ a nota foi arquivada com a leitura (releitura): nada muda
+            if pub.status == "READ" and end is not None:
+                if old_value is not None:
+                    self._count_rating(end, old_value, -1)
+                if new_value is not None:
+                    self._count_rating(end, new_value, 1)
+        elif field == "number_of_pages":
+            delta = (new_value or 0) - (old_value or 0)
+            for session in pub.reading_sessions():
+                if session.end_read_date is not None:
+                    self._totals(session.end_read_date).pages += delta
+
+    def month(self, year: int, month: int) -> PeriodTotals:
+        """Get the totals of a month (empty if nothing was finished in it)."""
+        totals = self._months.get((year, month))
+        return PeriodTotals().merge(totals) if totals is not None else PeriodTotals()
+
+    def months(self, year: int) -> Dict[int, PeriodTotals]:
+        """Get the totals of every month of a year, January to December."""
+        return {month: self.month(year, month) for month in range(1, 13)}
+
+    def year(self, year: int) -> PeriodTotals:
+        """Get the totals of a year."""
+        totals = PeriodTotals()
+        for month in range(1, 13):
+            month_totals = self._months.get((year, month))
+            if month_totals is not None:
+                totals.merge(month_totals)
+        return totals
+
+    def years(self) -> List[int]:
+        """Get the years with any finished or rated reading, in order."""
+        return sorted({year for year, _ in self._months})
+
+    def history(self, first_year: int, last_year: int) -> Dict[int, PeriodTotals]:
+        """
+        Get the totals of each year of a range.
+
+        Args:
+            first_year: First year (inclusive)
+            last_year: Last year (inclusive)
+
+        Returns:
+            Dictionary of year to totals, in year order, empty years included
+        """
+        return {year: self.year(year) for year in range(first_year, last_year + 1)}
+
+    def to_dict(self) -> dict:
+        """Convert the rollups to a dictionary for JSON serialization ("YYYY-MM" keys)."""
+        return {
+            f"{year:04d}-{month:02d}": totals.to_list()
+            for (year, month), totals in sorted(self._months.items())
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ReadingRollups':
+        """Create rollups from a dictionary written by to_dict."""
+        rollups = cls()
+        for key, values in data.items():
+            year, month = key.split("-")
+            rollups._months[(int(year), int(month))] = PeriodTotals(*values)
+        return rollups
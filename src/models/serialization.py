@@ -0,0 +1,45 @@
+"""
+Module containing helpers shared by the serialization code of the models.
+"""
+
+import gc
+from contextlib import contextmanager
+from datetime import date
+from functools import lru_cache
+from typing import Iterator, Optional
+
+@lru_cache(maxsize=4096)
+def str_to_date(value: Optional[str]) -> Optional[date]:
+    """
+    Convert an ISO formatted string to a date.
+
+    Results are cached, since reading dates repeat heavily across a library.
+
+    Args:
+        value: Date string (YYYY-MM-DD) or None/empty
+
+    Returns:
+        Parsed date, or None if no value was given
+    """
+    return date.fromisoformat(value) if value else None
+
+def date_to_str(value: Optional[date]) -> Optional[str]:
+    """Convert a date to its ISO string, keeping None as None."""
+    return value.isoformat() if value else None
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    """
+    Pause the cyclic garbage collector during a bulk load.
+
+    Every object built while loading a snapshot survives, so the collections
+    triggered by the allocations would only rescan them; they cost more than the
+    object construction itself.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
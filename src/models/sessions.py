@@ -0,0 +1,84 @@
+"""
+Module containing the ReadingSession record and helpers aggregating reading sessions.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from .serialization import date_to_str, str_to_date
+
+class ReadingSession(NamedTuple):
+    """
+    One reading of a publication.
+
+    Attributes:
+        start_read_date (Optional[date]): When the reading started
+        end_read_date (Optional[date]): When it finished (None while in progress)
+        rating (Optional[float]): Rating given after this reading
+    """
+    start_read_date: Optional[date]
+    end_read_date: Optional[date]
+    rating: Optional[float]
+
+    def to_dict(self) -> dict:
+        """Convert the session to a dictionary for JSON serialization."""
+        return {
+            "start_read_date": date_to_str(self.start_read_date),
+            "end_read_date": date_to_str(self.end_read_date),
+            "rating": self.rating,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ReadingSession':
+        """Create a session from a dictionary written by to_dict."""
+        return cls(str_to_date(data.get("start_read_date")), str_to_date(data.get("end_read_date")), data.get("rating"))
+
+
+def iter_finished_sessions(publications: Iterable[Any]) -> Iterator[Tuple[Any, ReadingSession]]:
+    """
+    Yield every finished reading, past re-reads included.
+
+    Args:
+        publications: Publications to scan
+
+    Returns:
+        Iterator of (publication, session) pairs
+    """
+    for pub in publications:
+        for session in pub.reading_sessions():
+            if session.end_read_date is not None:
+                yield pub, session
+
+def finished_between(publications: Iterable[Any], start_date: date, end_date: date) -> List[Tuple[Any, ReadingSession]]:
+    """
+    Get the readings finished within a period (a re-read counts again).
+
+    Args:
+        publications: Publications to scan
+        start_date: Beginning of the period (inclusive)
+        end_date: End of the period (inclusive)
+
+    Returns:
+        (publication, session) pairs ordered by finish date
+    """
+    finished = [
+        (pub, session) for pub, session in iter_finished_sessions(publications)
+        if start_date <= session.end_read_date <= end_date
+    ]
+    finished.sort(key=lambda item: item[1].end_read_date)
+    return finished
+
+def count_by_year(publications: Iterable[Any]) -> Dict[int, int]:
+    """
+    Count finished readings per year (a re-read counts again).
+
+    Args:
+        publications: Publications to scan
+
+    Returns:
+        Dictionary of year to number of readings finished, in year order
+    """
+    counts: Dict[int, int] = {}
+    for _, session in iter_finished_sessions(publications):
+        year = session.end_read_date.year
+        counts[year] = counts.get(year, 0) + 1
+    return dict(sorted(counts.items()))
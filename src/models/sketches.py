@@ -0,0 +1,164 @@
+"""
+Module containing the QuantileSketch class, a mergeable streaming quantile estimator.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_COMPRESSION = 100
+
+class QuantileSketch:
+    """
+    Merging t-digest: approximate quantiles in bounded memory.
+
+    Values are summarized by centroids (mean, weight). Centroids near the
+    tails are kept small and those near the median may grow, following the
+    t-digest k1 scale function, so extreme percentiles stay accurate. At most
+    about 2 x compression centroids are kept, however many values are added,
+    and two sketches merge into one summarizing both inputs, so sketches can be
+    built per shard and combined. While fewer values than the compression were
+    added, no centroid is merged and the quantiles are exact.
+
+    Quantiles interpolate linearly between centroid centers (the Hazen
+    definition on exact data: the median of 1, 2, 3, 4 is 2.5).
+
+    Attributes:
+        compression (int): Accuracy parameter (higher keeps more centroids)
+        count (int): Number of values added
+        minimum (Optional[float]): Smallest value added
+        maximum (Optional[float]): Largest value added
+    """
+
+    __slots__ = ("compression", "count", "minimum", "maximum", "_centroids", "_buffer")
+
+    def __init__(self, compression: int = DEFAULT_COMPRESSION):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            compression: Accuracy parameter
+
+        Raises:
+            ValueError: If compression is not positive
+        """
+        if compression <= 0:
+            raise ValueError("Compression must be positive")
+        self.compression = compression
+        self.count = 0
+        self.minimum: Optional[float] = None
+        self.maximum: Optional[float] = None
+        self._centroids: List[Tuple[float, int]] = []
+        self._buffer: List[Tuple[float, int]] = []
+
+    def __len__(self) -> int:
+        """Number of values added."""
+        return self.count
+
+    def add(self, value: float, weight: int = 1) -> None:
+        """Add a value (weight counts it several times)."""
+        self.count += weight
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        self._buffer.append((value, weight))
+        if len(self._buffer) >= 4 * self.compression:
+            self._compress()
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Add several values."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Fold another sketch into this one and return self."""
+        if not other.count:
+            return self
+        self.count += other.count
+        self.minimum = other.minimum if self.minimum is None else min(self.minimum, other.minimum)
+        self.maximum = other.maximum if self.maximum is None else max(self.maximum, other.maximum)
+        self._buffer.extend(other._centroids)
+        self._buffer.extend(other._buffer)
+        self._compress()
+        return self
+
+    def _k(self, q: float) -> float:
+        """t-digest k1 scale function."""
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+
+    def _compress(self) -> None:
+        """Merge the buffer into the centroids, keeping each within its size bound."""
+        if not self._buffer:
+            return
+        points = sorted(self._centroids + self._buffer)
+        self._buffer = []
+        total = self.count
+        if total <= self.compression:
+            self._centroids = points
+            return
+
+        merged: List[Tuple[float, int]] = []
+        mean, weight = points[0]
+        done = 0
+        limit = self._k(0.0) + 1
+        for value, value_weight in points[1:]:
+            if self._k((done + weight + value_weight) / total) <= limit:
+                weight += value_weight
+                mean += (value - mean) * value_weight / weight
+            else:
+                merged.append((mean, weight))
+                done += weight
+                limit = self._k(done / total) + 1
+                mean, weight = value, value_weight
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def centroids(self) -> List[Tuple[float, int]]:
+        """Get the (mean, weight) centroids, in order."""
+        self._compress()
+        return list(self._centroids)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1] (0.5 = median)
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+
+        Raises:
+            ValueError: If q is outside [0, 1]
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if not self.count:
+            return None
+        self._compress()
+        centroids = self._centroids
+        target = q * self.count
+        cumulative = 0.0
+        previous_center, previous_mean = None, None
+        for mean, weight in centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                if previous_center is None:
+                    return self.minimum if weight == 1 or target <= 0 else \
+                        self.minimum + (mean - self.minimum) * target / center
+                fraction = (target - previous_center) / (center - previous_center)
+                return previous_mean + (mean - previous_mean) * fraction
+            previous_center, previous_mean = center, mean
+            cumulative += weight
+        last_mean, last_weight = centroids[-1]
+        if last_weight == 1:
+            return self.maximum
+        last_center = self.count - last_weight / 2
+        if target >= self.count:
+            return self.maximum
+        fraction = (target - last_center) / (self.count - last_center)
+        return last_mean + (self.maximum - last_mean) * fraction
+
+    def quantiles(self, qs: Iterable[float]) -> Dict[float, Optional[float]]:
+        """Estimate several quantiles at once."""
+        return {q: self.quantile(q) for q in qs}
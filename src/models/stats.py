@@ -0,0 +1,195 @@
+"""
+Module containing the CollectionStats class, aggregates of a collection kept up to date.
+"""
+
+from fractions import Fraction
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+STATUSES = ("UNREAD", "READING", "READ")
+
+
+def _split_rating(rating: float) -> Tuple[int, Fraction]:
+    """Split a rating into whole tenths and the exact remainder of an off-grid value."""
+    tenths = round(rating * 10)
+    if tenths / 10 == rating:
+        return tenths, Fraction(0)
+    return 0, Fraction(rating)
+
+class RatingSum:
+    """
+    Exact sum of ratings, kept as an int of tenths plus a Fraction for the rare
+    rating off the 0.1 grid.
+
+    Any sequence of additions and removals ends on the same value as summing
+    the remaining ratings from scratch, where a running float sum drifts.
+
+    Attributes:
+        tenths (int): Sum of the ratings on the 0.1 grid, in tenths
+        rest (Fraction): Exact sum of the other ratings
+    """
+
+    __slots__ = ("tenths", "rest")
+
+    def __init__(self, tenths: int = 0, rest: Union[Fraction, int] = 0):
+        """Initialize the sum (zero by default)."""
+        self.tenths = tenths
+        self.rest = Fraction(rest)
+
+    @classmethod
+    def of(cls, value: Union[float, Fraction, str]) -> 'RatingSum':
+        """Create a sum holding a value: a float, a Fraction or a "p/q" string written by to_json."""
+        if isinstance(value, (str, Fraction)):
+            value = Fraction(value)
+            if (value * 10).denominator == 1:
+                return cls(int(value * 10))
+            return cls(0, value)
+        return cls(*_split_rating(value))
+
+    def __eq__(self, other):
+        """Two sums are equal when their exact values match."""
+        if not isinstance(other, RatingSum):
+            return NotImplemented
+        return self.exact() == other.exact()
+
+    def add(self, rating: float, sign: int = 1) -> None:
+        """Add (sign=1) or subtract (sign=-1) a rating."""
+        tenths, rest = _split_rating(rating)
+        self.tenths += sign * tenths
+        if rest:
+            self.rest += sign * rest
+
+    def merge(self, other: 'RatingSum') -> 'RatingSum':
+        """Add another sum and return self."""
+        self.tenths += other.tenths
+        self.rest += other.rest
+        return self
+
+    def exact(self) -> Fraction:
+        """Exact value of the sum."""
+        return Fraction(self.tenths, 10) + self.rest
+
+    def value(self) -> float:
+        """Value of the sum, correctly rounded to a float."""
+        return float(self.exact()) if self.rest else self.tenths / 10
+
+    def mean(self, count: int) -> float:
+        """Sum divided by a count, correctly rounded to a float."""
+        return float(self.exact() / count) if self.rest else self.tenths / (10 * count)
+
+    def to_json(self) -> Union[float, str]:
+        """The value as a float when it is on the 0.1 grid, else as an exact "p/q" string."""
+        exact = self.exact()
+        return float(exact) if (exact * 10).denominator == 1 else str(exact)
+
+class CollectionStats:
+    """
+    Running totals behind the Report figures.
+
+    Built with one pass over a collection, then adjusted on every registration,
+    removal, status change and rating change, so each figure is read in O(1).
+
+    Ratings only exist on READ publications (rate_publication requires READ and
+    start_reading clears the rating), so the rating sum and count cover exactly
+    the rated READ publications.
+
+    The rating sum is exact (see RatingSum), so any sequence of edits ends on
+    the same figures as a rebuild.
+
+    Attributes:
+        total (int): Number of publications
+        status_counts (Dict[str, int]): Publications per status
+        rating_count (int): Number of rated publications
+        completions_by_year (Dict[int, int]): Finished readings per year, re-reads included
+    """
+
+    __slots__ = ("total", "status_counts", "_ratings", "rating_count", "completions_by_year")
+
+    def __init__(self):
+        """Initialize empty totals."""
+        self.total = 0
+        self.status_counts: Dict[str, int] = dict.fromkeys(STATUSES, 0)
+        self._ratings = RatingSum()
+        self.rating_count = 0
+        self.completions_by_year: Dict[int, int] = {}
+
+    @classmethod
+    def build(cls, publications: Iterable[Any]) -> 'CollectionStats':
+        """Compute the totals of the publications."""
+        stats = cls()
+        for pub in publications:
+            stats.add(pub)
+        return stats
+
+    def _shift(self, pub, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) the contribution of a publication."""
+        self.total += sign
+        self.status_counts[pub.status] = self.status_counts.get(pub.status, 0) + sign
+        if pub.rating is not None:
+            self._count_rating(pub.rating, sign)
+        for session in pub.reading_sessions():
+            if session.end_read_date is not None:
+                self._count_completion(session.end_read_date.year, sign)
+
+    def _count_rating(self, rating: float, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a rating."""
+        self._ratings.add(rating, sign)
+        self.rating_count += sign
+
+    def _count_completion(self, year: int, sign: int) -> None:
+        """Adjust the completions of a year, dropping years that reach zero."""
+        count = self.completions_by_year.get(year, 0) + sign
+        if count:
+            self.completions_by_year[year] = count
+        else:
+            self.completions_by_year.pop(year, None)
+
+    def add(self, pub) -> None:
+        """Count a publication."""
+        self._shift(pub, 1)
+
+    def discard(self, pub) -> None:
+        """Remove the contribution of a counted publication."""
+        self._shift(pub, -1)
+
+    def update(self, pub, field: str, old_value: Any, new_value: Any) -> None:
+        """
+        Apply a change reported by a counted publication.
+
+        Args:
+            pub: Changed publication (already holding the new value)
+            field: Name of the changed field; only "status" and "rating" matter
+            old_value: Value before the change
+            new_value: Value after the change
+        """
+        if field == "status":
+            self.status_counts[old_value] -= 1
+            self.status_counts[new_value] = self.status_counts.get(new_value, 0) + 1
+            if new_value == "READ" and pub.end_read_date is not None:
+                self._count_completion(pub.end_read_date.year, 1)
+        elif field == "rating":
+            if old_value is not None:
+                self._count_rating(old_value, -1)
+            if new_value is not None:
+                self._count_rating(new_value, 1)
+
+    @property
+    def rating_sum(self) -> float:
+        """Sum of the ratings."""
+        return self._ratings.value()
+
+    @property
+    def average_rating(self) -> Optional[float]:
+        """Average rating, or None if nothing is rated."""
+        return self._ratings.mean(self.rating_count) if self.rating_count else None
+
+    def status_breakdown(self) -> Dict[str, Tuple[int, float]]:
+        """Get (count, percentage) per status, in the Report.check_publications_by_status shape."""
+        return {
+            status: (self.status_counts.get(status, 0),
+                     self.status_counts.get(status, 0) / self.total * 100 if self.total else 0.0)
+            for status in STATUSES
+        }
+
+    def completions_in(self, year: int) -> int:
+        """Number of readings finished in a year."""
+        return self.completions_by_year.get(year, 0)
@@ -0,0 +1,119 @@
+"""
+Module containing the SymbolTable class, shared storage for repeated strings.
+"""
+
+from typing import Dict, Iterable, List
+
+INTERNED_FIELDS = ("author", "publisher", "genre")
+DICTIONARY_FORMAT = "dictionary"
+
+class SymbolTable:
+    """
+    Interns repeated string values (authors, publishers, genres).
+
+    Every distinct value is kept once; publications holding the same author
+    then share one str object, so memory drops, equality checks succeed on the
+    identity shortcut and the hash is computed once. Each symbol also gets a
+    stable integer code (used by the dictionary-encoded snapshot format) and a
+    cached lowercase form for case-insensitive search.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        """
+        Initialize the table.
+
+        Args:
+            values: Initial symbols, coded in order (e.g. a snapshot's symbol list)
+        """
+        self._values: List[str] = []
+        self._code_of: Dict[str, int] = {}
+        self._lowered: Dict[str, str] = {}
+        for value in values:
+            self.intern(value)
+
+    def __len__(self) -> int:
+        """Number of distinct symbols."""
+        return len(self._values)
+
+    def __contains__(self, value: str) -> bool:
+        """Check whether a value is already interned."""
+        return value in self._code_of
+
+    def intern(self, value: str) -> str:
+        """Get the shared instance of a value, adding it if new."""
+        if value not in self._code_of:
+            self._code_of[value] = len(self._values)
+            self._values.append(value)
+            return value
+        return self._values[self._code_of[value]]
+
+    def code(self, value: str) -> int:
+        """Get the code of a value, interning it if new."""
+        code = self._code_of.get(value)
+        if code is None:
+            self.intern(value)
+            code = self._code_of[value]
+        return code
+
+    def value(self, code: int) -> str:
+        """Get the symbol stored under a code."""
+        return self._values[code]
+
+    def values(self) -> List[str]:
+        """Get every symbol, indexed by code."""
+        return list(self._values)
+
+    def lower(self, value: str) -> str:
+        """Get the lowercase form of a value, computed once per distinct value."""
+        lowered = self._lowered.get(value)
+        if lowered is None:
+            lowered = self._lowered[value] = value.lower()
+        return lowered
+
+
+def encode_records(records: Iterable[dict]) -> dict:
+    """
+    Dictionary-encode serialized publications.
+
+    The interned fields of each record are replaced by integer codes into a
+    symbol list stored once at the top of the snapshot.
+
+    Args:
+        records: Publication.to_dict outputs (left untouched)
+
+    Returns:
+        Snapshot dictionary with "format", "symbols" and "publications" keys
+    """
+    symbols = SymbolTable()
+    encoded = []
+    for record in records:
+        record = dict(record)
+        for field in INTERNED_FIELDS:
+            record[field] = symbols.code(record[field])
+        encoded.append(record)
+    return {"format": DICTIONARY_FORMAT, "symbols": symbols.values(), "publications": encoded}
+
+def decode_records(data) -> List[dict]:
+    """
+    Get plain publication records from a snapshot in either format.
+
+    Args:
+        data: Parsed JSON, either a list of records or a dictionary-encoded snapshot
+
+    Returns:
+        List of records in Publication.to_dict form. Decoded records share one
+        str object per distinct author/publisher/genre.
+
+    Raises:
+        ValueError: If the snapshot format is unknown
+    """
+    if isinstance(data, list):
+        return data
+    if data.get("format") != DICTIONARY_FORMAT:
+        raise ValueError(f"Unknown snapshot format: {data.get('format')}")
+    symbols = data["symbols"]
+    records = data["publications"]
+    for record in records:
+        for field in INTERNED_FIELDS:
+            record[field] = symbols[record[field]]
+    return records
@@ -0,0 +1,402 @@
+"""
+Module containing the PublicationTable class, a columnar view of publications.
+"""
+
+import math
+from array import array
+from collections import Counter
+from datetime import date
+from itertools import compress, filterfalse
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from .serialization import str_to_date
+from .sessions import ReadingSession
+from .progress import ProgressLog
+from . import vectorized
+
+MISSING_DATE = 0
+
+class PublicationRow(NamedTuple):
+    """Read-only row of a PublicationTable, with the same attribute names as Publication."""
+    id: int
+    title: str
+    author: str
+    publisher: str
+    genre: str
+    year: int
+    number_of_pages: int
+    pub_type: str
+    status: str
+    rating: Optional[float]
+    start_read_date: Optional[date]
+    end_read_date: Optional[date]
+
+
+class DictionaryColumn:
+    """
+    Dictionary-encoded column: each distinct value is stored once and rows hold
+    small integer codes in an array.
+
+    Attributes:
+        values (List[Any]): Distinct values, indexed by code
+        codes (array): Code of each row
+    """
+
+    def __init__(self):
+        """Initialize an empty column."""
+        self.values: List[Any] = []
+        self.codes = array("I")
+        self._code_of: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        """Get the code of a value, adding it to the dictionary if needed."""
+        code = self._code_of.get(value)
+        if code is None:
+            code = len(self.values)
+            self._code_of[value] = code
+            self.values.append(value)
+        return code
+
+    def code_of(self, value: Any) -> Optional[int]:
+        """Get the code of a value, or None if no row ever held it."""
+        return self._code_of.get(value)
+
+    def append(self, value: Any) -> None:
+        """Add a row."""
+        self.codes.append(self.encode(value))
+
+    def __getitem__(self, row: int) -> Any:
+        """Decode the value of a row."""
+        return self.values[self.codes[row]]
+
+    def __setitem__(self, row: int, value: Any) -> None:
+        """Replace the value of a row."""
+        self.codes[row] = self.encode(value)
+
+    def counts(self, rows: Optional[Iterable[int]] = None) -> Dict[Any, int]:
+        """
+        Count rows per value.
+
+        Args:
+            rows: Row numbers to count, or None for every row
+
+        Returns:
+            Dictionary of value to number of rows (values with zero rows omitted)
+        """
+        codes = self.codes if rows is None else map(self.codes.__getitem__, rows)
+        return {self.values[code]: count for code, count in Counter(codes).items()}
+
+    def mask(self, value: Any) -> List[bool]:
+        """Get a per-row selector (for itertools.compress) of rows holding the value."""
+        code = self._code_of.get(value)
+        if code is None:
+            return [False] * len(self.codes)
+        return list(map(code.__eq__, self.codes))
+
+    def slice(self, start: int, stop: int) -> 'DictionaryColumn':
+        """Copy a range of rows into a column whose dictionary holds only the values they use."""
+        column = DictionaryColumn()
+        values = self.values
+        column.codes = array("I", [column.encode(values[code]) for code in self.codes[start:stop]])
+        return column
+
+
+class PublicationTable:
+    """
+    Columnar, analytics-oriented representation of a set of publications.
+
+    Numeric fields live in parallel array-module columns and repeated strings in
+    dictionary-encoded columns, so aggregates run as C loops (sum, min, max,
+    Counter, itertools) instead of attribute access on each Publication.
+
+    Columns describe the current reading. Archived readings of re-read
+    publications and page progress logs only exist for some publications, so
+    they are kept aside in the sparse `history` and `progress` mappings.
+
+    Missing ratings are stored as NaN and missing dates as ordinal 0. A table built
+    by Collection.table() is kept in sync incrementally; row order is not stable
+    (removals move the last row into the freed slot).
+
+    Attributes:
+        ids (array): Publication ids
+        years (array): Publication years
+        pages (array): Number of pages
+        ratings (array): Ratings (NaN when unrated)
+        start_ordinals (array): Reading start dates as ordinals (0 when missing)
+        end_ordinals (array): Reading end dates as ordinals (0 when missing)
+        titles (List[str]): Titles
+        status (DictionaryColumn): Reading status
+        genres (DictionaryColumn): Genres
+        authors (DictionaryColumn): Authors
+        publishers (DictionaryColumn): Publishers
+        types (DictionaryColumn): Publication type (Book/Magazine)
+        history (Dict[int, Tuple[ReadingSession, ...]]): Archived readings by publication id
+        progress (Dict[int, ProgressLog]): Page progress logs by publication id
+    """
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self.ids = array("q")
+        self.years = array("i")
+        self.pages = array("i")
+        self.ratings = array("d")
+        self.start_ordinals = array("i")
+        self.end_ordinals = array("i")
+        self.titles: List[str] = []
+        self.status = DictionaryColumn()
+        self.genres = DictionaryColumn()
+        self.authors = DictionaryColumn()
+        self.publishers = DictionaryColumn()
+        self.types = DictionaryColumn()
+        self.history: Dict[int, Tuple[ReadingSession, ...]] = {}
+        self.progress: Dict[int, ProgressLog] = {}
+        self._row_of: Dict[int, int] = {}
+
+    @classmethod
+    def from_publications(cls, publications: Iterable[Any]) -> 'PublicationTable':
+        """
+        Build a table from publications (or any objects with the same attributes).
+
+        Args:
+            publications: Publications to copy into columns
+        """
+        table = cls()
+        for pub in publications:
+            table.append(pub)
+        return table
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> 'PublicationTable':
+        """
+        Build a table straight from snapshot records (Publication.to_dict output),
+        without creating Publication objects.
+
+        Args:
+            records: Serialized publications
+        """
+        table = cls()
+        for record in records:
+            table._append_values(
+                record["pub_id"], record["title"], record["author"], record.get("publisher", ""),
+                record.get("genre", ""), record["year"], record.get("number_of_pages", 0),
+                record["type"], record.get("status", "UNREAD"), record.get("rating"),
+                _to_ordinal(str_to_date(record.get("start_read_date"))),
+                _to_ordinal(str_to_date(record.get("end_read_date"))),
+            )
+            if record.get("reading_history"):
+                table.history[record["pub_id"]] = tuple(map(ReadingSession.from_dict, record["reading_history"]))
+        return table
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.ids)
+
+    def __contains__(self, pub_id: int) -> bool:
+        """Check whether a publication id has a row."""
+        return pub_id in self._row_of
+
+    def append(self, pub) -> None:
+        """Add a publication as a new row."""
+        self._append_values(
+            pub.id, pub.title, pub.author, pub.publisher, pub.genre, pub.year,
+            pub.number_of_pages, pub.pub_type, pub.status, pub.rating,
+            _to_ordinal(pub.start_read_date), _to_ordinal(pub.end_read_date),
+        )
+        self._store_sparse(pub)
+
+    def _store_sparse(self, pub) -> None:
+        """Keep the archived readings and progress log of a publication, if it has any."""
+        past_sessions = getattr(pub, "past_sessions", ())
+        if past_sessions:
+            self.history[pub.id] = past_sessions
+        else:
+            self.history.pop(pub.id, None)
+        progress = getattr(pub, "progress", None)
+        if progress is not None:
+            self.progress[pub.id] = progress
+        else:
+            self.progress.pop(pub.id, None)
+
+    def _append_values(self, pub_id, title, author, publisher, genre, year, pages, pub_type,
+                       status, rating, start_ordinal, end_ordinal) -> None:
+        """Append one row from raw field values."""
+        self._row_of[pub_id] = len(self.ids)
+        self.ids.append(pub_id)
+        self.titles.append(title)
+        self.authors.append(author)
+        self.publishers.append(publisher)
+        self.genres.append(genre)
+        self.years.append(year)
+        self.pages.append(pages)
+        self.types.append(pub_type)
+        self.status.append(status)
+        self.ratings.append(math.nan if rating is None else rating)
+        self.start_ordinals.append(start_ordinal)
+        self.end_ordinals.append(end_ordinal)
+
+    def refresh(self, pub) -> None:
+        """Rewrite the row of a publication after its state changed."""
+        row = self._row_of[pub.id]
+        self.titles[row] = pub.title
+        self.years[row] = pub.year
+        self.pages[row] = pub.number_of_pages
+        self.status[row] = pub.status
+        self.ratings[row] = math.nan if pub.rating is None else pub.rating
+        self.start_ordinals[row] = _to_ordinal(pub.start_read_date)
+        self.end_ordinals[row] = _to_ordinal(pub.end_read_date)
+        self._store_sparse(pub)
+
+    def remove(self, pub_id: int) -> None:
+        """Remove the row of a publication by moving the last row into its slot."""
+        self.history.pop(pub_id, None)
+        self.progress.pop(pub_id, None)
+        row = self._row_of.pop(pub_id)
+        last = len(self.ids) - 1
+        columns = self._columns()
+        if row != last:
+            moved_id = self.ids[last]
+            for column in columns:
+                column[row] = column[last]
+            self._row_of[moved_id] = row
+        for column in columns:
+            del column[last]
+
+    def slice(self, start: int, stop: int) -> 'PublicationTable':
+        """
+        Copy a range of rows into a standalone table.
+
+        Array columns are copied with C slicing and dictionary columns are
+        re-encoded to the values the rows use, so the result is compact to
+        pickle (e.g. to ship a chunk to a worker process).
+
+        Args:
+            start: First row
+            stop: Row after the last one
+        """
+        part = PublicationTable()
+        part.ids = self.ids[start:stop]
+        part.years = self.years[start:stop]
+        part.pages = self.pages[start:stop]
+        part.ratings = self.ratings[start:stop]
+        part.start_ordinals = self.start_ordinals[start:stop]
+        part.end_ordinals = self.end_ordinals[start:stop]
+        part.titles = self.titles[start:stop]
+        part.status = self.status.slice(start, stop)
+        part.genres = self.genres.slice(start, stop)
+        part.authors = self.authors.slice(start, stop)
+        part.publishers = self.publishers.slice(start, stop)
+        part.types = self.types.slice(start, stop)
+        part._row_of = {pub_id: row for row, pub_id in enumerate(part.ids)}
+        part.history = {pub_id: self.history[pub_id] for pub_id in part.ids if pub_id in self.history}
+        part.progress = {pub_id: self.progress[pub_id] for pub_id in part.ids if pub_id in self.progress}
+        return part
+
+    def chunks(self, size: int) -> Iterator['PublicationTable']:
+        """
+        Split the table into consecutive standalone tables of at most `size` rows.
+
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive")
+        for start in range(0, len(self), size):
+            yield self.slice(start, start + size)
+
+    def _columns(self) -> List[Any]:
+        """Get every per-row sequence (arrays, titles and dictionary codes)."""
+        return [
+            self.ids, self.years, self.pages, self.ratings, self.start_ordinals,
+            self.end_ordinals, self.titles, self.status.codes, self.genres.codes,
+            self.authors.codes, self.publishers.codes, self.types.codes,
+        ]
+
+    def row(self, row: int) -> PublicationRow:
+        """Decode a row into a PublicationRow."""
+        rating = self.ratings[row]
+        return PublicationRow(
+            id=self.ids[row],
+            title=self.titles[row],
+            author=self.authors[row],
+            publisher=self.publishers[row],
+            genre=self.genres[row],
+            year=self.years[row],
+            number_of_pages=self.pages[row],
+            pub_type=self.types[row],
+            status=self.status[row],
+            rating=None if rating != rating else rating,
+            start_read_date=_from_ordinal(self.start_ordinals[row]),
+            end_read_date=_from_ordinal(self.end_ordinals[row]),
+        )
+
+    def rows(self, selected: Optional[Iterable[int]] = None) -> Iterator[PublicationRow]:
+        """
+        Lazily decode rows.
+
+        Args:
+            selected: Row numbers to decode, or None for every row
+        """
+        for row in (range(len(self.ids)) if selected is None else selected):
+            yield self.row(row)
+
+    def rated_mask(self) -> List[bool]:
+        """Get a per-row selector of rated rows."""
+        return list(map(math.isfinite, self.ratings))
+
+    def ended_between_mask(self, start_date: date, end_date: date) -> List[bool]:
+        """Get a per-row selector of rows whose reading ended within the period."""
+        period = range(start_date.toordinal(), end_date.toordinal() + 1)
+        return list(map(period.__contains__, self.end_ordinals))
+
+    def archived_rows_between(self, start_date: date, end_date: date) -> List[PublicationRow]:
+        """
+        Get the archived readings finished within the period as rows.
+
+        Each row carries the publication's data with the start date, end date
+        and rating of that earlier reading.
+
+        Returns:
+            Rows ordered by finish date
+        """
+        rows = [
+            self.row(self._row_of[pub_id])._replace(
+                start_read_date=session.start_read_date,
+                end_read_date=session.end_read_date,
+                rating=session.rating,
+            )
+            for pub_id, sessions in self.history.items()
+            for session in sessions
+            if session.end_read_date and start_date <= session.end_read_date <= end_date
+        ]
+        rows.sort(key=lambda row: row.end_read_date)
+        return rows
+
+    def finished_counts_by_year(self) -> Dict[int, int]:
+        """
+        Count finished readings per year, archived re-reads included.
+
+        Returns:
+            Dictionary of year to number of readings finished, in year order
+        """
+        counts = Counter(vectorized.counts_by_year(self.end_ordinals))
+        for sessions in self.history.values():
+            counts.update(session.end_read_date.year for session in sessions if session.end_read_date)
+        return dict(sorted(counts.items()))
+
+    def rated_values(self, selector: Optional[Iterable[bool]] = None) -> array:
+        """
+        Get the ratings of rated rows, optionally restricted by a selector.
+
+        Args:
+            selector: Per-row booleans (e.g. DictionaryColumn.mask), or None for all rows
+        """
+        ratings = self.ratings if selector is None else compress(self.ratings, selector)
+        return array("d", filterfalse(math.isnan, ratings))
+
+
+def _to_ordinal(value: Optional[date]) -> int:
+    """Convert an optional date to an ordinal (0 when missing)."""
+    return value.toordinal() if value else MISSING_DATE
+
+def _from_ordinal(value: int) -> Optional[date]:
+    """Convert an ordinal back to a date (None when missing)."""
+    return date.fromordinal(value) if value else None
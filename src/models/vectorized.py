@@ -0,0 +1,122 @@
+"""
+Module containing the column kernels used by the strategies, vectorized with NumPy when installed.
+
+NumPy is optional (pip install .[analytics]). Every kernel has a standard
+library implementation with identical output, used when NumPy is missing or
+disabled with use_numpy(False).
+"""
+
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from datetime import date
+from itertools import compress
+from typing import Dict, Iterator, List, Sequence
+from .metrics import RATING_BINS, RatingStats
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_enabled = numpy is not None
+
+def available() -> bool:
+    """Whether NumPy is installed."""
+    return numpy is not None
+
+def enabled() -> bool:
+    """Whether the kernels currently run on NumPy."""
+    return _enabled
+
+@contextmanager
+def use_numpy(enabled: bool) -> Iterator[None]:
+    """
+    Select the NumPy or the standard library kernels while the block runs.
+
+    Args:
+        enabled: True for NumPy (ignored when it is not installed), False for the stdlib
+    """
+    global _enabled
+    previous = _enabled
+    _enabled = enabled and numpy is not None
+    try:
+        yield
+    finally:
+        _enabled = previous
+
+def _view(column: array):
+    """Zero-copy NumPy view of an array-module column."""
+    return numpy.frombuffer(column, dtype=column.typecode) if len(column) else numpy.array([], dtype=column.typecode)
+
+def rating_stats(ratings: array) -> RatingStats:
+    """
+    Build the rating statistics of a ratings column (NaN = unrated).
+
+    Args:
+        ratings: Ratings column, e.g. PublicationTable.ratings
+
+    Returns:
+        RatingStats over the rated values
+    """
+    stats = RatingStats()
+    if not _enabled:
+        for rating in ratings:
+            if rating == rating:
+                stats.add_rating(rating)
+        return stats
+
+    values = _view(ratings)
+    values = values[~numpy.isnan(values)]
+    if not len(values):
+        return stats
+    stats.count = int(len(values))
+    stats.mean = float(values.mean())
+    stats.m2 = float(((values - stats.mean) ** 2).sum())
+    stats.minimum = float(values.min())
+    stats.maximum = float(values.max())
+    bins = numpy.clip(numpy.rint(values * 10), 0, RATING_BINS - 1).astype(numpy.int64)
+    stats.bins = numpy.bincount(bins, minlength=RATING_BINS).tolist()
+    filled, first = numpy.unique(bins, return_index=True)
+    for index, row in zip(filled.tolist(), first.tolist()):
+        stats.labels[index] = float(values[row])
+    stats.order = filled[numpy.argsort(first, kind="stable")].tolist()
+    return stats
+
+def rows_ended_between(end_ordinals: array, start_date: date, end_date: date) -> List[int]:
+    """Get the rows whose reading ended within the closed period."""
+    first, last = start_date.toordinal(), end_date.toordinal()
+    if not _enabled:
+        period = range(first, last + 1)
+        return list(compress(range(len(end_ordinals)), map(period.__contains__, end_ordinals)))
+    ends = _view(end_ordinals)
+    return numpy.flatnonzero((ends >= first) & (ends <= last)).tolist()
+
+def rows_in_progress(start_ordinals: array, end_ordinals: array) -> List[int]:
+    """Get the rows with a reading started and not finished (ordinal 0 = missing date)."""
+    if not _enabled:
+        return [row for row, (start, end) in enumerate(zip(start_ordinals, end_ordinals)) if start and not end]
+    return numpy.flatnonzero((_view(start_ordinals) != 0) & (_view(end_ordinals) == 0)).tolist()
+
+def sum_rows(column: array, rows: Sequence[int]) -> int:
+    """Sum a numeric column over some rows (e.g. pages of the finished rows)."""
+    if not _enabled:
+        return sum(map(column.__getitem__, rows))
+    return int(_view(column)[numpy.asarray(rows, dtype=numpy.int64)].sum()) if len(rows) else 0
+
+def counts_by_year(ordinals: array) -> Dict[int, int]:
+    """
+    Count the dates of an ordinal column per year, skipping missing dates.
+
+    Returns:
+        Dictionary of year to count, in year order
+    """
+    if not _enabled:
+        counts = Counter(date.fromordinal(ordinal).year for ordinal in ordinals if ordinal)
+        return dict(sorted(counts.items()))
+    values = _view(ordinals)
+    values = values[values != 0].astype(numpy.int64) - _EPOCH_ORDINAL
+    years = values.astype("datetime64[D]").astype("datetime64[Y]").astype(numpy.int64) + 1970
+    unique, counts = numpy.unique(years, return_counts=True)
+    return {int(year): int(count) for year, count in zip(unique, counts)}
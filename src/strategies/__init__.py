@@ -9,10 +9,18 @@ from .report_strategy import ReportStrategy
 from .evaluation_report import EvaluationReportStrategy
 from .top_rated_report import TopRatedReportStrategy
 from .progress_report import ProgressReportStrategy
+from .quantile_report import QuantileReportStrategy
+from .group_by_report import GroupByReportStrategy
+from .runner import ParallelRunner, chunked, run_strategy
 
 __all__ = [
     'ReportStrategy',
     'EvaluationReportStrategy',
     'TopRatedReportStrategy',
-    'ProgressReportStrategy'
+    'ProgressReportStrategy',
+    'QuantileReportStrategy',
+    'GroupByReportStrategy',
+    'ParallelRunner',
+    'chunked',
+    'run_strategy'
 ]
\ No newline at end of file
@@ -2,10 +2,10 @@
 Strategy for Evaluation Report Generation
 """
 
-from typing import List, Dict, Any
-from statistics import mean, stdev
-from collections import Counter
-from src.models import Publication
+from typing import Iterable, List, Dict, Any, Union
+from src.models import Publication, PublicationTable
+from src.models import vectorized
+from src.models.metrics import Count, Metric, RatingStats, evaluate, merge_metrics
 from .report_strategy import ReportStrategy
 
 
@@ -16,27 +16,49 @@ class EvaluationReportStrategy(ReportStrategy):
     Calculates:
     - Average rating
     - Standard deviation
-    - Distribution by rating (0-10)
+    - Distribution by rating (0-10, one row per rating given)
     - Most common rating
+    
+    Statistics are computed online in a single pass (see RatingStats), so any
+    iterable of publications works, including a generator from
+    repository.iter_publications, and ratings are never collected in a list.
     """
     
-    def generate(self, publications: List[Publication], **kwargs) -> Dict[str, Any]:
+    def generate(self, publications: Union[List[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
         """
         Generate evaluation statistics.
         
         Args:
-            publications: List of publications
+            publications: Iterable of publications (scanned once), or a PublicationTable (read column-wise)
             
         Returns:
             Dictionary with evaluation statistics
         """
-        # Filtrar publicações com avaliação
-        evaluated = [p for p in publications if p.rating is not None]
+        return self.finalize(self.partial(publications, **kwargs), **kwargs)
+    
+    def partial(self, publications: Union[Iterable[Publication], PublicationTable], **kwargs) -> Dict[str, Metric]:
+        """Count the publications and the ratings of one chunk."""
+        if isinstance(publications, PublicationTable):
+            total = Count()
+            total.count = len(publications)
+            return {'total': total, 'ratings': vectorized.rating_stats(publications.ratings)}
+        # Uma única passagem: contagem total e estatísticas das notas
+        metrics = {'total': Count(), 'ratings': RatingStats()}
+        evaluate(publications, metrics)
+        return metrics
+    
+    def combine(self, left: Dict[str, Metric], right: Dict[str, Metric]) -> Dict[str, Metric]:
+        """Merge the counters of two chunks."""
+        return merge_metrics(left, right)
+    
+    def finalize(self, partial: Dict[str, Metric], **kwargs) -> Dict[str, Any]:
+        """Compute the evaluation statistics from the merged counters."""
+        total, ratings = partial['total'].result(), partial['ratings'].result()
         
-        if not evaluated:
+        if not ratings['count']:
             return {
                 'total_evaluated': 0,
-                'total_publications': len(publications),
+                'total_publications': total,
                 'average': None,
                 'std_dev': None,
                 'distribution': {},
@@ -45,18 +67,15 @@ class EvaluationReportStrategy(ReportStrategy):
                 'max_rating': None
             }
         
-        ratings = [p.rating for p in evaluated]
-        rating_counts = Counter(ratings)
-        
         return {
-            'total_evaluated': len(evaluated),
-            'total_publications': len(publications),
-            'average': round(mean(ratings), 2),
-            'std_dev': round(stdev(ratings), 2) if len(ratings) > 1 else 0,
-            'distribution': dict(sorted(rating_counts.items())),
-            'most_common': rating_counts.most_common(1)[0],
-            'min_rating': min(ratings),
-            'max_rating': max(ratings)
+            'total_evaluated': ratings['count'],
+            'total_publications': total,
+            'average': round(ratings['mean'], 2),
+            'std_dev': round(ratings['std_dev'], 2) if ratings['count'] > 1 else 0,
+            'distribution': ratings['distribution'],
+            'most_common': ratings['most_common'],
+            'min_rating': ratings['min'],
+            'max_rating': ratings['max']
         }
     
     def format_output(self, report_data: Dict[str, Any]) -> str:
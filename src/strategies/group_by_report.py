@@ -0,0 +1,102 @@
+"""
+Strategy for Grouped (Leaderboard) Report
+"""
+
+from typing import Iterable, List, Dict, Any, Union
+from src.models import Publication, PublicationTable
+from src.models.groupby import GroupBy
+from .report_strategy import ReportStrategy
+
+FIELD_LABELS = {
+    'author': "Autor",
+    'publisher': "Editora",
+    'genre': "Gênero",
+    'type': "Tipo",
+    'status': "Status",
+    'year': "Ano",
+}
+
+
+class GroupByReportStrategy(ReportStrategy):
+    """
+    Strategy for generating grouped reports, such as author, genre and publisher leaderboards.
+
+    A generic front end to the GroupBy engine: the grouping fields, aggregates,
+    filters, HAVING conditions, ordering and limit all come from the parameters,
+    e.g. "top authors by books read", "average rating per genre" or "pages read
+    per publisher", each computed in one pass with one accumulator per group.
+    """
+
+    def generate(self, publications: Union[List[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
+        """
+        Generate grouped statistics.
+
+        Args:
+            publications: Iterable of publications (scanned once), a Collection, or a PublicationTable
+            **kwargs: Must include 'group_by' (field or fields); can include 'aggregates'
+                (default: ["count"]), 'where', 'having', 'order_by', 'descending' and 'limit'
+                (see GroupBy)
+
+        Returns:
+            Dictionary with the grouping columns and one row per group
+        """
+        return self.finalize(self.partial(publications, **kwargs), **kwargs)
+
+    @staticmethod
+    def _grouping(kwargs: Dict[str, Any]) -> GroupBy:
+        """Build the GroupBy described by the parameters."""
+        if not kwargs.get('group_by'):
+            raise ValueError("Grouping field required for grouped report")
+        return GroupBy(
+            kwargs['group_by'],
+            kwargs.get('aggregates', ("count",)),
+            where=kwargs.get('where'),
+            having=kwargs.get('having', ()),
+            order_by=kwargs.get('order_by'),
+            descending=kwargs.get('descending', True),
+            limit=kwargs.get('limit')
+        )
+
+    def partial(self, publications: Union[Iterable[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
+        """Aggregate the groups of one chunk."""
+        return {'groups': self._grouping(kwargs).partial(publications)}
+
+    def combine(self, left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the groups of two chunks."""
+        left['groups'] = GroupBy.combine(left['groups'], right['groups'])
+        return left
+
+    def finalize(self, partial: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Apply HAVING, ordering and limit to the merged groups."""
+        grouping = self._grouping(kwargs)
+        return {
+            'keys': list(grouping.keys),
+            'columns': [spec.name for spec in grouping.aggregates],
+            'total_groups': len(partial['groups']),
+            'rows': grouping.finalize(partial['groups'])
+        }
+
+    def format_output(self, report_data: Dict[str, Any]) -> str:
+        """Format grouped report for display."""
+        keys, columns = report_data['keys'], report_data['columns']
+        title = ' / '.join(FIELD_LABELS.get(key, key) for key in keys)
+
+        def cell(value: Any) -> str:
+            if value is None:
+                return "-"
+            return f"{value:.2f}" if isinstance(value, float) else str(value)
+
+        output = [f"📊 RELATÓRIO AGRUPADO POR {title.upper()}\n"]
+        if not report_data['rows']:
+            output.append("Nenhum grupo encontrado.")
+            return '\n'.join(output)
+
+        widths = [max(12, len(name)) for name in columns]
+        output.append("   " + " │ ".join([f"{title:30}"] + [f"{name:>{width}}" for name, width in zip(columns, widths)]))
+        for row in report_data['rows']:
+            label = ' / '.join(cell(row[key]) for key in keys)
+            values = [f"{cell(row[name]):>{width}}" for name, width in zip(columns, widths)]
+            output.append("   " + " │ ".join([f"{label:30}"] + values))
+
+        output.append(f"\n{len(report_data['rows'])} de {report_data['total_groups']} grupos")
+        return '\n'.join(output)
\ No newline at end of file
@@ -2,9 +2,11 @@
 Strategy for Annual Progress Report
 """
 
-from typing import List, Dict, Any
-from datetime import datetime
-from src.models import Publication, Configuration
+from typing import Iterable, List, Dict, Any, Union
+from datetime import date, datetime
+from src.models import Publication, Configuration, PublicationTable
+from src.models import vectorized
+from src.models.metrics import CurrentlyReading, FinishedBetween, evaluate
 from .report_strategy import ReportStrategy
 
 
@@ -12,37 +14,75 @@ class ProgressReportStrategy(ReportStrategy):
     """
     Strategy for generating annual reading progress report.
     
-    Tracks progress towards annual reading goal.
+    Tracks progress towards annual reading goal. Every reading finished in the
+    year counts, so a re-read publication counts once per reading.
+
+    For publications being read with recorded page progress, also reports the
+    current page, the reading pace (pages/day since the reading started) and
+    the estimated finish date at that pace.
     """
     
-    def generate(self, publications: List[Publication], **kwargs) -> Dict[str, Any]:
+    def generate(self, publications: Union[List[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
         """
         Generate annual progress report.
         
         Args:
-            publications: List of publications
+            publications: Iterable of publications (scanned once), or a PublicationTable (read column-wise)
             **kwargs: Must include 'config' (Configuration object)
             
         Returns:
             Dictionary with progress data
         """
+        return self.finalize(self.partial(publications, **kwargs), **kwargs)
+    
+    def partial(self, publications: Union[Iterable[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
+        """Collect the readings finished this year and the readings in progress of one chunk."""
+        current_year = datetime.now().year
+        first_day, last_day = date(current_year, 1, 1), date(current_year, 12, 31)
+        
+        # Leituras finalizadas no ano atual, como pares (publicação, data de término)
+        finished = FinishedBetween(first_day, last_day)
+        if isinstance(publications, PublicationTable):
+            finished.finished, currently_reading, pages_read = self._select_from_table(
+                publications, first_day, last_day
+            )
+            progress_of = lambda p: publications.progress.get(p.id)
+        else:
+            progress_of = lambda p: getattr(p, 'progress', None)
+            # Uma única passagem: leituras finalizadas no ano e publicações em leitura
+            reading = CurrentlyReading()
+            evaluate(publications, {'finished': finished, 'reading': reading})
+            currently_reading = reading.result()
+            pages_read = sum(p.number_of_pages for p, _ in finished.finished if getattr(p, 'number_of_pages', None))
+        
+        # Ritmo e previsão de término das leituras em andamento
+        today = date.today()
+        return {
+            'year': current_year,
+            'finished': finished,
+            'pages_read': pages_read,
+            'reading': [self._reading_entry(p, progress_of(p), today) for p in currently_reading]
+        }
+    
+    def combine(self, left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the readings of two chunks."""
+        left['finished'].merge(right['finished'])
+        left['pages_read'] += right['pages_read']
+        left['reading'].extend(right['reading'])
+        return left
+    
+    def finalize(self, partial: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Compute the goal progress, pages and pace from the merged readings."""
         config: Configuration = kwargs.get('config')
         if not config:
             raise ValueError("Configuration required for progress report")
         
-        current_year = datetime.now().year
-        
-        # Publicações finalizadas no ano atual
-        finished_this_year = [
-            p for p in publications
-            if p.end_read_date and p.end_read_date.year == current_year
-        ]
+        current_year = partial['year']
+        finished_this_year = list(partial['finished'].finished)
+        reading_publications = partial['reading']
         
-        # Publicações em leitura
-        currently_reading = [
-            p for p in publications
-            if p.start_read_date and not p.end_read_date
-        ]
+        finished_this_year.sort(key=lambda item: (item[1], item[0].title))
+        pages_read = partial['pages_read']
         
         # Calcular progresso
         total_finished = len(finished_this_year)
@@ -51,19 +91,18 @@ class ProgressReportStrategy(ReportStrategy):
         remaining = max(0, goal - total_finished)
         
         # Calcular média de páginas
-        pages_read = sum(
-            p.number_of_pages for p in finished_this_year
-            if hasattr(p, 'number_of_pages') and p.number_of_pages
-        )
         avg_pages = pages_read / total_finished if total_finished > 0 else 0
         
+        # Ritmo atual somado das leituras em andamento
+        paces = [entry['pages_per_day'] for entry in reading_publications if entry['pages_per_day'] is not None]
+        
         return {
             'year': current_year,
             'goal': goal,
             'completed': total_finished,
             'percentage': round(percentage, 1),
             'remaining': remaining,
-            'currently_reading': len(currently_reading),
+            'currently_reading': len(reading_publications),
             'limit': config.simultaneous_reading_limit,
             'pages_read': pages_read,
             'avg_pages': round(avg_pages, 0),
@@ -71,19 +110,46 @@ class ProgressReportStrategy(ReportStrategy):
                 {
                     'title': p.title,
                     'author': p.author,
-                    'finish_date': p.end_read_date.strftime('%d/%m/%Y')
+                    'finish_date': end_date.strftime('%d/%m/%Y')
                 }
-                for p in sorted(finished_this_year, key=lambda x: x.end_read_date)
+                for p, end_date in finished_this_year
             ],
-            'reading_publications': [
-                {
-                    'title': p.title,
-                    'author': p.author,
-                    'start_date': p.start_read_date.strftime('%d/%m/%Y')
-                }
-                for p in currently_reading
-            ]
+            'reading_publications': reading_publications,
+            'pages_per_day': round(sum(paces), 1) if paces else None
+        }
+    
+    @staticmethod
+    def _reading_entry(p, log, today: date) -> Dict[str, Any]:
+        """Describe a publication being read, with pace and ETA when progress was recorded."""
+        entry = {
+            'title': p.title,
+            'author': p.author,
+            'start_date': p.start_read_date.strftime('%d/%m/%Y'),
+            'current_page': None,
+            'total_pages': p.number_of_pages,
+            'pages_per_day': None,
+            'eta': None
         }
+        if log is not None:
+            entry['current_page'] = log.current_page(since=p.start_read_date)
+            pace = log.pages_per_day(since=p.start_read_date)
+            if pace is not None:
+                entry['pages_per_day'] = round(pace, 1)
+                eta = log.eta(p.number_of_pages, p.start_read_date, today)
+                entry['eta'] = eta.strftime('%d/%m/%Y') if eta else None
+        return entry
+    
+    @staticmethod
+    def _select_from_table(table: PublicationTable, first_day: date, last_day: date):
+        """Select finished readings (archived ones included), in-progress rows and pages read over the columns."""
+        finished_rows = vectorized.rows_ended_between(table.end_ordinals, first_day, last_day)
+        pages_read = vectorized.sum_rows(table.pages, finished_rows)
+        finished = list(table.rows(finished_rows))
+        archived = table.archived_rows_between(first_day, last_day)
+        finished.extend(archived)
+        pages_read += sum(row.number_of_pages for row in archived)
+        reading = list(table.rows(vectorized.rows_in_progress(table.start_ordinals, table.end_ordinals)))
+        return [(row, row.end_read_date) for row in finished], reading, pages_read
     
     def format_output(self, report_data: Dict[str, Any]) -> str:
         """Format progress report for display."""
@@ -121,5 +187,15 @@ class ProgressReportStrategy(ReportStrategy):
             output.append("\n📖 Lendo atualmente:")
             for pub in report_data['reading_publications']:
                 output.append(f"   • {pub['title']} - {pub['author']} (desde {pub['start_date']})")
+                if pub.get('current_page') is not None:
+                    line = f"     Página {pub['current_page']}/{pub['total_pages']}"
+                    if pub['pages_per_day']:
+                        line += f" - {pub['pages_per_day']} páginas/dia"
+                    if pub['eta']:
+                        line += f" - previsão de término: {pub['eta']}"
+                    output.append(line)
+        
+        if report_data.get('pages_per_day'):
+            output.append(f"\n⏱️ Ritmo atual: {report_data['pages_per_day']} páginas/dia")
         
         return '\n'.join(output)
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+Strategy for Rating and Page Quantiles Report
+"""
+
+from typing import Iterable, List, Dict, Any, Union
+from src.models import Publication, PublicationTable
+from src.models.sketches import QuantileSketch
+from .report_strategy import ReportStrategy
+
+DEFAULT_QUANTILES = (0.1, 0.5, 0.9)
+
+
+class QuantileReportStrategy(ReportStrategy):
+    """
+    Strategy for generating a percentile report.
+
+    Calculates, with streaming quantile sketches (bounded memory, mergeable
+    across shards, see QuantileSketch):
+    - Rating percentiles (default p10/p50/p90)
+    - Rating percentiles per genre
+    - Pages-per-book percentiles
+    """
+
+    def generate(self, publications: Union[List[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
+        """
+        Generate quantile statistics.
+
+        Args:
+            publications: Iterable of publications (scanned once), or a PublicationTable (read column-wise)
+            **kwargs: Can include 'quantiles' (default: (0.1, 0.5, 0.9)) and 'compression'
+
+        Returns:
+            Dictionary with rating, per-genre and page percentiles
+        """
+        return self.finalize(self.partial(publications, **kwargs), **kwargs)
+
+    def partial(self, publications: Union[Iterable[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
+        """Sketch the ratings (overall and per genre) and book pages of one chunk."""
+        compression = kwargs.get('compression', 100)
+        ratings = QuantileSketch(compression)
+        pages = QuantileSketch(compression)
+        by_genre: Dict[str, QuantileSketch] = {}
+
+        def add(rating, genre, pub_type, number_of_pages):
+            if rating is not None:
+                ratings.add(rating)
+                sketch = by_genre.get(genre)
+                if sketch is None:
+                    sketch = by_genre[genre] = QuantileSketch(compression)
+                sketch.add(rating)
+            if pub_type == 'Book' and number_of_pages:
+                pages.add(number_of_pages)
+
+        if isinstance(publications, PublicationTable):
+            for row in range(len(publications)):
+                rating = publications.ratings[row]
+                add(None if rating != rating else rating, publications.genres[row],
+                    publications.types[row], publications.pages[row])
+        else:
+            # Uma única passagem: notas, notas por gênero e páginas dos livros
+            for p in publications:
+                add(p.rating, p.genre, p.pub_type, p.number_of_pages)
+
+        return {'ratings': ratings, 'by_genre': by_genre, 'pages': pages}
+
+    def combine(self, left: Dict[str, Any], right: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the sketches of two chunks."""
+        left['ratings'].merge(right['ratings'])
+        left['pages'].merge(right['pages'])
+        for genre, sketch in right['by_genre'].items():
+            if genre in left['by_genre']:
+                left['by_genre'][genre].merge(sketch)
+            else:
+                left['by_genre'][genre] = sketch
+        return left
+
+    def finalize(self, partial: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Read the requested quantiles from the merged sketches."""
+        quantiles = kwargs.get('quantiles', DEFAULT_QUANTILES)
+
+        def summary(sketch: QuantileSketch) -> Dict[str, Any]:
+            values = {
+                f"p{q * 100:g}": None if value is None else round(value, 2)
+                for q, value in sketch.quantiles(quantiles).items()
+            }
+            return {'count': sketch.count, **values}
+
+        return {
+            'quantiles': [f"p{q * 100:g}" for q in quantiles],
+            'total_evaluated': partial['ratings'].count,
+            'ratings': summary(partial['ratings']),
+            'by_genre': {
+                genre: summary(sketch)
+                for genre, sketch in sorted(partial['by_genre'].items(), key=lambda item: (-item[1].count, item[0]))
+            },
+            'pages': summary(partial['pages'])
+        }
+
+    def format_output(self, report_data: Dict[str, Any]) -> str:
+        """Format quantile report for display."""
+        labels = report_data['quantiles']
+
+        def line(summary: Dict[str, Any]) -> str:
+            return " │ ".join(f"{label}: {summary[label]}" for label in labels)
+
+        output = ["📐 RELATÓRIO DE PERCENTIS\n"]
+        if report_data['total_evaluated'] == 0:
+            output.append("Nenhuma publicação avaliada ainda.")
+        else:
+            output.append(f"⭐ Notas ({report_data['total_evaluated']} avaliadas)")
+            output.append(f"   {line(report_data['ratings'])}")
+            output.append("\n📚 Notas por gênero:")
+            for genre, summary in report_data['by_genre'].items():
+                output.append(f"   {genre} ({summary['count']}): {line(summary)}")
+
+        if report_data['pages']['count']:
+            output.append(f"\n📄 Páginas por livro ({report_data['pages']['count']} livros)")
+            output.append(f"   {line(report_data['pages'])}")
+
+        return '\n'.join(output)
\ No newline at end of file
@@ -3,7 +3,7 @@ Abstract Strategy for Report Generation
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Iterable, List, Dict, Any
 from src.models import Publication
 
 
@@ -13,6 +13,13 @@ class ReportStrategy(ABC):
     
     This implements the Strategy Pattern, allowing different algorithms
     for generating reports to be selected at runtime.
+
+    Strategies may also implement the optional partial/combine/finalize
+    protocol: partial aggregates one chunk of publications, combine merges two
+    partials and finalize turns the merged partial into the report dictionary.
+    Partials of disjoint chunks combined in any grouping give the same report
+    as generate over all of them, so the runner (see runner.py) can execute the
+    strategy over shards or worker processes.
     """
     
     @abstractmethod
@@ -40,4 +47,48 @@ class ReportStrategy(ABC):
         Returns:
             Formatted string ready for display
         """
-        pass
\ No newline at end of file
+        pass
+    
+    @property
+    def supports_partials(self) -> bool:
+        """Whether the strategy implements the partial/combine/finalize protocol."""
+        return type(self).partial is not ReportStrategy.partial
+    
+    def partial(self, publications: Iterable[Any], **kwargs) -> Any:
+        """
+        Aggregate one chunk of publications.
+        
+        Args:
+            publications: Chunk to aggregate (publications, or a PublicationTable)
+            **kwargs: Same parameters as generate
+            
+        Returns:
+            Partial aggregate, mergeable with combine
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support partial aggregation")
+    
+    def combine(self, left: Any, right: Any) -> Any:
+        """
+        Merge two partials built over disjoint chunks.
+        
+        Args:
+            left: Partial aggregate (may be updated in place)
+            right: Partial aggregate
+            
+        Returns:
+            Merged partial aggregate
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support partial aggregation")
+    
+    def finalize(self, partial: Any, **kwargs) -> Dict[str, Any]:
+        """
+        Build the report dictionary from a (merged) partial.
+        
+        Args:
+            partial: Partial aggregate of every chunk
+            **kwargs: Same parameters as generate
+            
+        Returns:
+            Dictionary containing the report data, as generate returns it
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support partial aggregation")
\ No newline at end of file
@@ -0,0 +1,158 @@
+"""
+Runner executing report strategies over shards of publications.
+"""
+
+import os
+from functools import partial as bind, reduce
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor
+from src.models import Collection, PublicationTable
+from .report_strategy import ReportStrategy
+
+DEFAULT_CHUNK_SIZE = 50_000
+SEQUENTIAL_THRESHOLD = 200_000
+
+
+def chunked(publications: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split publications into consecutive lists of at most `size` items.
+
+    Args:
+        publications: Publications (any iterable, consumed lazily)
+        size: Maximum chunk length
+
+    Raises:
+        ValueError: If size is not positive
+    """
+    if size <= 0:
+        raise ValueError("Chunk size must be positive")
+    iterator = iter(publications)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _build_partial(strategy: ReportStrategy, kwargs: Dict[str, Any], shard: Any) -> Any:
+    """Build the partial of one shard (module-level so process pools can pickle it)."""
+    return strategy.partial(shard, **kwargs)
+
+
+def run_partials(strategy: ReportStrategy, shards: Iterable[Any], executor: Optional[Executor] = None,
+                 **kwargs) -> Any:
+    """
+    Aggregate every shard and merge the partials, in shard order.
+
+    Args:
+        strategy: Strategy implementing partial/combine/finalize
+        shards: Chunks of publications, or PublicationTables
+        executor: Executor running the partials (None runs them in this thread)
+        **kwargs: Strategy parameters
+
+    Returns:
+        Merged partial aggregate
+    """
+    build = bind(_build_partial, strategy, kwargs)
+    partials = executor.map(build, shards) if executor is not None else map(build, shards)
+    return reduce(strategy.combine, partials, strategy.partial([], **kwargs))
+
+
+def run_strategy(strategy: ReportStrategy, shards: Iterable[Any], executor: Optional[Executor] = None,
+                 **kwargs) -> Dict[str, Any]:
+    """
+    Generate a report over shards, merging per-shard partials.
+
+    Strategies without the partial protocol get generate over the
+    concatenated shards instead (shards must then be publication iterables).
+
+    Args:
+        strategy: Report strategy
+        shards: Chunks of publications, or PublicationTables
+        executor: Executor running the partials (None runs them in this thread)
+        **kwargs: Strategy parameters (e.g. limit, config)
+
+    Returns:
+        Report dictionary, equal to strategy.generate over all the publications
+    """
+    if not strategy.supports_partials:
+        return strategy.generate(list(chain.from_iterable(shards)), **kwargs)
+    return strategy.finalize(run_partials(strategy, shards, executor, **kwargs), **kwargs)
+
+
+class ParallelRunner:
+    """
+    Runs strategy partials in worker processes over columnar chunks.
+
+    The source is converted to PublicationTable chunks (table.slice), so workers
+    receive compact arrays and dictionary-encoded columns instead of pickled
+    Publication objects, and send back small partials that are merged here.
+    Sources below the threshold, single-worker runners and strategies without
+    the partial protocol run sequentially in this process; so does everything
+    if the platform cannot start a process pool.
+
+    Attributes:
+        workers (int): Number of worker processes
+        chunk_size (int): Rows per chunk sent to a worker
+        threshold (int): Minimum number of rows for the process pool to be used
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 threshold: int = SEQUENTIAL_THRESHOLD):
+        """
+        Initialize the runner.
+
+        Args:
+            workers: Number of worker processes (default: os.cpu_count())
+            chunk_size: Rows per chunk
+            threshold: Minimum number of rows for the process pool to be used
+
+        Raises:
+            ValueError: If workers or chunk_size is not positive
+        """
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        if self.workers <= 0:
+            raise ValueError("Workers must be positive")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        self.chunk_size = chunk_size
+        self.threshold = threshold
+
+    @staticmethod
+    def _tables(source: Any) -> List[PublicationTable]:
+        """Get the source as tables: a Collection, a table, publications or a sharded store (list of tables)."""
+        if isinstance(source, Collection):
+            return [source.table()]
+        if isinstance(source, PublicationTable):
+            return [source]
+        source = list(source)
+        if all(isinstance(shard, PublicationTable) for shard in source):
+            return source
+        return [PublicationTable.from_publications(source)]
+
+    def run(self, strategy: ReportStrategy, source: Any, **kwargs) -> Dict[str, Any]:
+        """
+        Generate a report over a collection, a table, publications or a list of table shards.
+
+        Args:
+            strategy: Report strategy
+            source: Publications to analyze
+            **kwargs: Strategy parameters (e.g. limit, config)
+
+        Returns:
+            Report dictionary, equal to strategy.generate over all the publications
+        """
+        tables = self._tables(source)
+        if not strategy.supports_partials:
+            return strategy.generate(list(chain.from_iterable(table.rows() for table in tables)), **kwargs)
+        rows = sum(map(len, tables))
+        if self.workers == 1 or rows < self.threshold:
+            return run_strategy(strategy, tables, **kwargs)
+
+        chunks = [chunk for table in tables for chunk in table.chunks(self.chunk_size)]
+        try:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(chunks))) as executor:
+                return run_strategy(strategy, chunks, executor, **kwargs)
+        except (OSError, NotImplementedError):
+            return run_strategy(strategy, chunks, **kwargs)
\ No newline at end of file
@@ -2,8 +2,11 @@
 Strategy for Top Rated Publications Report
 """
 
-from typing import List, Dict, Any
-from src.models import Publication, Book, Magazine
+import heapq
+from itertools import compress
+from typing import Iterable, List, Dict, Any, Union
+from src.models import Publication, Book, Magazine, PublicationTable
+from src.models.metrics import TopRated, evaluate
 from .report_strategy import ReportStrategy
 
 
@@ -14,38 +17,49 @@ class TopRatedReportStrategy(ReportStrategy):
     Lists the highest-rated publications with details.
     """
     
-    def generate(self, publications: List[Publication], **kwargs) -> Dict[str, Any]:
+    def generate(self, publications: Union[List[Publication], PublicationTable], **kwargs) -> Dict[str, Any]:
         """
         Generate top-rated publications list.
         
         Args:
-            publications: List of publications
+            publications: Iterable of publications (scanned once), or a PublicationTable (read column-wise)
             **kwargs: Can include 'limit' (default: 5)
             
         Returns:
             Dictionary with top-rated publications
         """
+        return self.finalize(self.partial(publications, **kwargs), **kwargs)
+    
+    def partial(self, publications: Union[Iterable[Publication], PublicationTable], **kwargs) -> TopRated:
+        """Select the best candidates of one chunk (at most 'limit' survive)."""
+        selection = TopRated(kwargs.get('limit', 5))
+        if isinstance(publications, PublicationTable):
+            total_evaluated, top_rated = self._select_from_table(publications, selection.limit)
+            selection.extend(top_rated, total_evaluated)
+        else:
+            # Uma única passagem: conta as avaliadas e seleciona por nota (decrescente) e título
+            evaluate(publications, {'top': selection})
+        return selection
+    
+    def combine(self, left: TopRated, right: TopRated) -> TopRated:
+        """Merge the candidates of two chunks."""
+        return left.merge(right)
+    
+    def finalize(self, partial: TopRated, **kwargs) -> Dict[str, Any]:
+        """Rank the merged candidates."""
         limit = kwargs.get('limit', 5)
-        
-        # Filtrar publicações com avaliação
-        evaluated = [p for p in publications if p.rating is not None]
-        
-        # Ordenar por nota (decrescente) e depois por título
-        top_rated = sorted(
-            evaluated,
-            key=lambda p: (-p.rating, p.title)
-        )[:limit]
+        total_evaluated, top_rated = partial.rated, partial.result()
         
         return {
             'limit': limit,
-            'total_evaluated': len(evaluated),
+            'total_evaluated': total_evaluated,
             'top_publications': [
                 {
                     'id': p.id,
                     'title': p.title,
                     'author': p.author,
                     'rating': p.rating,
-                    'type': 'Livro' if isinstance(p, Book) else 'Revista',
+                    'type': 'Livro' if p.pub_type == 'Book' else 'Revista',
                     'year': p.year,
                     'status': p.status  # ✅ CORRIGIDO: status já é string
                 }
@@ -53,6 +67,14 @@ class TopRatedReportStrategy(ReportStrategy):
             ]
         }
     
+    @staticmethod
+    def _select_from_table(table: PublicationTable, limit: int):
+        """Rank rated rows by (-rating, title) over the columns, decoding only the winners."""
+        rated_rows = list(compress(range(len(table)), table.rated_mask()))
+        ratings, titles = table.ratings, table.titles
+        best = heapq.nsmallest(max(limit, 0), rated_rows, key=lambda row: (-ratings[row], titles[row]))
+        return len(rated_rows), list(table.rows(best))
+    
     def format_output(self, report_data: Dict[str, Any]) -> str:
         """Format top-rated report for display."""
         limit = report_data['limit']
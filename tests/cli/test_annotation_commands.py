@@ -126,6 +126,24 @@ class TestAnnotationCommands:
         assert result.exit_code == 0
         assert "não encontrada" in result.output
     
+    def test_adicionar_after_remover_does_not_reuse_id(self, setup_test_environment):
+        """Test that a new annotation never takes the ID of a removed one."""
+        runner = CliRunner()
+        
+        collection = Collection()
+        book = Book(1, "Livro Teste", "Autor", "Editora", 2025, "Ficção", 200)
+        collection.register_publication(book)
+        repository.save_collection(collection)
+        
+        runner.invoke(cli, ['adicionar-anotacao', '1', 'Primeira'])
+        runner.invoke(cli, ['adicionar-anotacao', '1', 'Segunda'])
+        runner.invoke(cli, ['remover-anotacao', '1', 'ann_1_1'])
+        result = runner.invoke(cli, ['adicionar-anotacao', '1', 'Terceira'])
+        
+        assert "ann_1_3" in result.output
+        ids = [ann.id for ann in repository.load_collection().list_publications()[0].list_annotations()]
+        assert ids == ["ann_1_2", "ann_1_3"]
+    
     def test_ver_anotacao_success(self, setup_test_environment):
         """Test viewing annotation details."""
         runner = CliRunner()
@@ -0,0 +1,49 @@
+"""
+Tests for the facet CLI command.
+"""
+
+import pytest
+from click.testing import CliRunner
+from src.cli.main import cli
+from src.models import Collection, Book, Magazine
+from src.data import repository
+
+
+@pytest.fixture
+def saved_library(setup_test_environment):
+    """Save a small library to the test data file."""
+    collection = Collection()
+    collection.register_publication(Book(1, "Livro A", "Autor", "Rocco", 1995, "Ficção", 100))
+    collection.register_publication(Book(2, "Livro B", "Autor", "Rocco", 2003, "Ficção", 100))
+    collection.register_publication(Magazine(3, "Revista", "Vários", "Abril", 2008, "Ciência", 50, issue_number=1))
+    repository.save_collection(collection)
+
+
+class TestFacetCommands:
+    """Test facetas CLI command."""
+
+    def test_facetas_default_dimensions(self, saved_library):
+        """Test showing default facet counts."""
+        result = CliRunner().invoke(cli, ['facetas'])
+
+        assert result.exit_code == 0
+        assert "Total: 3 publicações" in result.output
+        assert "Gênero" in result.output
+        assert "2000s" in result.output
+        assert "UNREAD" in result.output
+
+    def test_facetas_with_filter(self, saved_library):
+        """Test facet counts restricted by a filter."""
+        result = CliRunner().invoke(cli, ['facetas', '--tipo', 'revista', '-d', 'editora'])
+
+        assert result.exit_code == 0
+        assert "Total: 1 publicações" in result.output
+        assert "Abril" in result.output
+        assert "Rocco" not in result.output
+
+    def test_facetas_no_match(self, saved_library):
+        """Test facet command when nothing matches."""
+        result = CliRunner().invoke(cli, ['facetas', '--ano', '1900'])
+
+        assert result.exit_code == 0
+        assert "Nenhuma publicação encontrada" in result.output
@@ -0,0 +1,57 @@
+"""
+Tests for publication registration CLI commands.
+"""
+
+from click.testing import CliRunner
+from src.cli.main import cli
+from src.data import repository
+
+
+class TestPublicationCommands:
+    """Test cadastrar ID allocation."""
+
+    def test_cadastrar_after_remocao_uses_new_id(self, setup_test_environment):
+        """Test that registering after a removal does not reuse a taken ID."""
+        runner = CliRunner()
+        for title in ("Livro 1", "Livro 2", "Livro 3"):
+            runner.invoke(cli, ['cadastrar', title, 'Autor', 'Editora', '2020', 'Ficção', '100'])
+        collection = repository.load_collection()
+        collection.remove_publication(1)
+        repository.save_collection(collection)
+
+        result = runner.invoke(cli, ['cadastrar', 'Livro 4', 'Autor', 'Editora', '2020', 'Ficção', '100'])
+
+        assert "cadastrado com sucesso! (ID: 4)" in result.output
+        ids = sorted(pub.id for pub in repository.load_collection().list_publications())
+        assert ids == [2, 3, 4]
+
+    def test_cadastrar_starts_above_existing_ids(self, setup_test_environment):
+        """Test that a library without a sequence file continues after its highest ID."""
+        runner = CliRunner()
+        runner.invoke(cli, ['cadastrar', 'Livro 1', 'Autor', 'Editora', '2020', 'Ficção', '100'])
+        setup_test_environment.with_suffix(".seq").unlink()
+
+        result = runner.invoke(cli, ['cadastrar', 'Livro 2', 'Autor', 'Editora', '2020', 'Ficção', '100'])
+
+        assert "(ID: 2)" in result.output
+
+    def test_progresso_records_page(self, setup_test_environment):
+        """Test recording the current page of a publication being read."""
+        runner = CliRunner()
+        runner.invoke(cli, ['cadastrar', 'Livro 1', 'Autor', 'Editora', '2020', 'Ficção', '200'])
+        runner.invoke(cli, ['iniciar-leitura', '1'])
+
+        result = runner.invoke(cli, ['progresso', '1', '50'])
+
+        assert "página 50/200 (25.0%)" in result.output
+        assert "Previsão de término" in result.output
+        assert repository.load_collection().list_publications()[0].current_page == 50
+
+    def test_progresso_requires_reading(self, setup_test_environment):
+        """Test that progress is refused for a publication not being read."""
+        runner = CliRunner()
+        runner.invoke(cli, ['cadastrar', 'Livro 1', 'Autor', 'Editora', '2020', 'Ficção', '200'])
+
+        result = runner.invoke(cli, ['progresso', '1', '50'])
+
+        assert "Erro" in result.output
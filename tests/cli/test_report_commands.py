@@ -0,0 +1,166 @@
+"""
+Tests for the cached report CLI commands.
+"""
+
+from datetime import date
+from click.testing import CliRunner
+from src.cli.main import cli
+from src.data import repository
+from src.models.rollups import ReadingRollups
+from src.strategies import TopRatedReportStrategy
+
+
+def _library_with_rating(runner: CliRunner) -> None:
+    """Register and rate one book through the CLI."""
+    runner.invoke(cli, ['cadastrar', 'Livro 1', 'Autor', 'Editora', '2020', 'Ficção', '100'])
+    runner.invoke(cli, ['iniciar-leitura', '1'])
+    runner.invoke(cli, ['finalizar', '1'])
+    runner.invoke(cli, ['avaliar', '1', '8'])
+
+
+class TestReportCache:
+    """Test that report commands reuse outputs of an unchanged library."""
+
+    def test_repeated_report_reads_cache(self, setup_test_environment, monkeypatch):
+        """Test that an unchanged library is not recomputed."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+        first = runner.invoke(cli, ['top-rated', '--limit', '3'])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("report recomputed")
+        monkeypatch.setattr(TopRatedReportStrategy, 'generate', fail)
+        second = runner.invoke(cli, ['top-rated', '--limit', '3'])
+
+        assert second.exception is None
+        assert "Livro 1" in second.output
+        assert second.output.split("\n")[-2] == first.output.split("\n")[-2]
+        assert setup_test_environment.with_suffix(".reports").exists()
+
+    def test_mutation_invalidates_cache(self, setup_test_environment):
+        """Test that a saved change produces a fresh report."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+        before = runner.invoke(cli, ['relatorio-avaliacoes'])
+
+        runner.invoke(cli, ['avaliar', '1', '6'])
+        after = runner.invoke(cli, ['relatorio-avaliacoes'])
+
+        assert "Média geral: 8.0/10" in before.output
+        assert "Média geral: 6.0/10" in after.output
+
+    def test_parameters_are_part_of_the_key(self, setup_test_environment):
+        """Test that different parameters are cached separately."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+        runner.invoke(cli, ['top-rated', '--limit', '1'])
+        runner.invoke(cli, ['top-rated', '--limit', '2'])
+
+        assert len(repository.load_report_cache()) == 2
+
+    def test_relatorio_is_cached(self, setup_test_environment):
+        """Test that the full report output is replayed from the cache."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+
+        first = runner.invoke(cli, ['relatorio'])
+        second = runner.invoke(cli, ['relatorio'])
+
+        assert "RELATÓRIO COMPLETO" in first.output
+        assert first.output.split("RELATÓRIO COMPLETO")[1] == second.output.split("RELATÓRIO COMPLETO")[1]
+
+    def test_quantile_report(self, setup_test_environment):
+        """Test the percentile report command."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+
+        result = runner.invoke(cli, ['relatorio-quantis'])
+
+        assert result.exception is None
+        assert "RELATÓRIO DE PERCENTIS" in result.output
+        assert "p50: 8.0" in result.output
+
+
+class TestReadingHistory:
+    """Test the historical progress command."""
+
+    def test_history_by_year_and_month(self, setup_test_environment):
+        """Test the per-year and per-month totals of the history."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+        today = date.today()
+
+        result = runner.invoke(cli, ['progresso-historico', '--de', str(today.year - 1), '--mensal'])
+
+        assert result.exception is None
+        lines = result.output.split("\n")
+        assert any(line.split() == [str(today.year - 1), "0", "0", "-"] for line in lines)
+        assert any(line.split() == [str(today.year), "1", "100", "8.0"] for line in lines)
+        assert any(line.split() == [f"{today.month:02d}/{today.year % 100:02d}", "1", "100", "8.0"] for line in lines)
+
+    def test_rollups_persisted_and_reused(self, setup_test_environment, monkeypatch):
+        """Test that the history saves its rollups and later commands keep and reuse them."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+        runner.invoke(cli, ['progresso-historico'])
+        assert setup_test_environment.with_suffix(".rollups").exists()
+
+        runner.invoke(cli, ['cadastrar', 'Livro 2', 'Autor', 'Editora', '2021', 'História', '300'])
+        runner.invoke(cli, ['iniciar-leitura', '2'])
+        runner.invoke(cli, ['finalizar', '2'])
+
+        def fail(*args, **kwargs):
+            raise AssertionError("rollups rebuilt")
+        monkeypatch.setattr(ReadingRollups, 'build', fail)
+        result = runner.invoke(cli, ['progresso-historico'])
+
+        assert result.exception is None
+        assert any(line.split() == [str(date.today().year), "2", "400", "8.0"] for line in result.output.split("\n"))
+
+    def test_invalid_range(self, setup_test_environment):
+        """Test that an inverted range is rejected."""
+        result = CliRunner().invoke(cli, ['progresso-historico', '--de', '2025', '--ate', '2020'])
+
+        assert "ano inicial" in result.output
+
+
+class TestGroupedReport:
+    """Test the grouped report command."""
+
+    def test_grouped_report(self, setup_test_environment):
+        """Test grouping with filters, aggregates and a condition."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+        runner.invoke(cli, ['cadastrar', 'Livro 2', 'Autor', 'Editora', '2021', 'História', '300'])
+
+        result = runner.invoke(cli, ['relatorio-agrupado', '--por', 'autor', '-a', 'contagem', '-a', 'soma:paginas',
+                                     '-a', 'media:nota', '--condicao', 'contagem>=2'])
+
+        assert result.exception is None
+        assert "RELATÓRIO AGRUPADO POR AUTOR" in result.output
+        rows = [[part.strip() for part in line.split("│")] for line in result.output.split("\n") if "│" in line]
+        assert rows[0] == ["Autor", "contagem", "soma:paginas", "media:nota"]
+        assert rows[1:] == [["Autor", "2", "400", "8.00"]]
+
+    def test_condition_on_count_not_shown(self, setup_test_environment):
+        """Test that the help's 'contagem>=2' example works without requesting the count."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+        runner.invoke(cli, ['cadastrar', 'Livro 2', 'Autor', 'Editora', '2021', 'História', '300'])
+        runner.invoke(cli, ['cadastrar', 'Livro 3', 'Outro', 'Editora', '2021', 'História', '50'])
+
+        result = runner.invoke(cli, ['relatorio-agrupado', '-p', 'autor', '-a', 'media:nota', '-c', 'contagem>=2',
+                                     '--ordenar', 'soma:paginas'])
+
+        assert result.exception is None
+        rows = [[part.strip() for part in line.split("│")] for line in result.output.split("\n") if "│" in line]
+        assert rows == [["Autor", "media:nota"], ["Autor", "8.00"]]
+
+    def test_invalid_aggregate(self, setup_test_environment):
+        """Test that an unknown aggregate is reported as an error."""
+        runner = CliRunner()
+        _library_with_rating(runner)
+
+        result = runner.invoke(cli, ['relatorio-agrupado', '--por', 'genero', '-a', 'mediana:nota'])
+
+        assert "Erro:" in result.output
\ No newline at end of file
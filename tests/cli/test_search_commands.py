@@ -0,0 +1,57 @@
+"""
+Tests for listing and search CLI commands.
+"""
+
+import pytest
+from click.testing import CliRunner
+from src.cli.main import cli
+from src.models import Collection, Book
+from src.data import repository
+
+
+@pytest.fixture
+def saved_library(setup_test_environment):
+    """Save a library with rated and unrated books."""
+    collection = Collection()
+    for pub_id, (title, rating) in enumerate([("Duna", 9.0), ("Fundação", 6.5), ("Neuromancer", None)], start=1):
+        book = Book(pub_id, title, "Autor", "Editora", 1965, "Ficção", 300)
+        if rating is not None:
+            book.start_reading()
+            book.finish_reading()
+            book.rate_publication(rating)
+        collection.register_publication(book)
+    repository.save_collection(collection)
+
+
+class TestSearchCommands:
+    """Test listar and buscar rating filters."""
+
+    def test_listar_without_filters(self, saved_library):
+        """Test listing every publication."""
+        result = CliRunner().invoke(cli, ['listar'])
+
+        assert result.exit_code == 0
+        assert "Total: 3 publicações" in result.output
+
+    def test_listar_with_rating_range(self, saved_library):
+        """Test listing publications within a rating range."""
+        result = CliRunner().invoke(cli, ['listar', '--nota-min', '7', '--nota-max', '10'])
+
+        assert result.exit_code == 0
+        assert "Total: 1 publicações" in result.output
+        assert "Duna" in result.output
+
+    def test_buscar_with_min_rating(self, saved_library):
+        """Test searching with a minimum rating."""
+        result = CliRunner().invoke(cli, ['buscar', 'autor', '--por', 'autor', '--nota-min', '6'])
+
+        assert result.exit_code == 0
+        assert "Encontradas 2 publicações" in result.output
+        assert "Neuromancer" not in result.output
+
+    def test_buscar_without_match(self, saved_library):
+        """Test searching with a range that matches nothing."""
+        result = CliRunner().invoke(cli, ['buscar', 'Duna', '--nota-max', '5'])
+
+        assert result.exit_code == 0
+        assert "Nenhuma publicação encontrada" in result.output
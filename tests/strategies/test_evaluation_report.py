@@ -5,6 +5,7 @@ Unit tests for EvaluationReport strategy.
 import pytest
 from src.models import Collection, Book
 from src.strategies import EvaluationReportStrategy as EvaluationReport
+from src.data import repository
 
 
 class TestEvaluationReport:
@@ -265,4 +266,47 @@ class TestEvaluationReportEdgeCases:
         distribution_keys = list(report_data['distribution'].keys())
         
         assert distribution_keys == sorted(distribution_keys)
-        assert distribution_keys == [6.0, 7.0, 8.0, 9.0, 10.0]
\ No newline at end of file
+        assert distribution_keys == [6.0, 7.0, 8.0, 9.0, 10.0]
+    
+    def test_output_shows_exact_off_grid_ratings(self):
+        """Test that ratings off the half-point scale are listed and counted as given."""
+        collection = Collection()
+        for i, rating in enumerate([9.5, 9.7, 9.8, 9.2, 9.0, 9.7], start=1):
+            book = Book(i, f"Livro {i}", "Autor", "Editora", 2020, "Ficção", 100)
+            book.start_reading()
+            book.finish_reading()
+            book.rate_publication(rating)
+            collection.register_publication(book)
+
+        strategy = EvaluationReport()
+        output = strategy.format_output(strategy.generate(collection.list_publications()))
+
+        assert "Nota mais comum: 9.7/10 (2 publicações)" in output
+        assert "9.2/10: █ (1)" in output
+        assert "9.5/10: █ (1)" in output
+
+    def test_output_keeps_integer_ratings_and_first_seen_tie(self):
+        """Test that integer ratings print as given and a tie goes to the rating seen first."""
+        collection = Collection()
+        for i, rating in enumerate([8, 9.5, 9.5, 8], start=1):
+            book = Book(i, f"Livro {i}", "Autor", "Editora", 2020, "Ficção", 100)
+            book.start_reading()
+            book.finish_reading()
+            book.rate_publication(rating)
+            collection.register_publication(book)
+
+        strategy = EvaluationReport()
+        output = strategy.format_output(strategy.generate(collection.list_publications()))
+
+        assert "Nota mais comum: 8/10 (2 publicações)" in output
+        assert " 8/10: ██ (2)" in output
+    
+    def test_generate_from_repository_generator(self, setup_test_environment, collection_with_ratings):
+        """Test streaming publications straight from the snapshot."""
+        repository.save_collection(collection_with_ratings)
+        strategy = EvaluationReport()
+        
+        streamed = strategy.generate(repository.iter_publications())
+        
+        assert streamed == strategy.generate(collection_with_ratings.list_publications())
+        assert streamed['total_publications'] == 5
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Unit tests for GroupByReport strategy.
+"""
+
+import pytest
+from src.strategies import GroupByReportStrategy, chunked, run_strategy
+
+
+class TestGroupByReport:
+    """Test cases for GroupByReport strategy."""
+
+    def test_generate_top_authors(self, populated_collection):
+        """Test a leaderboard of authors by books read."""
+        report_data = GroupByReportStrategy().generate(
+            populated_collection, group_by="author", aggregates=["count", "avg:rating"],
+            where={"status": "READ"}, order_by="avg:rating", limit=1
+        )
+
+        assert report_data['keys'] == ['author']
+        assert report_data['columns'] == ['count', 'avg:rating']
+        assert report_data['total_groups'] == 2
+        assert report_data['rows'] == [{'author': "Autor E", 'count': 1, 'avg:rating': 9.0}]
+
+    def test_table_and_shards_match(self, populated_collection):
+        """Test the columnar path and merged shards against the collection."""
+        strategy = GroupByReportStrategy()
+        kwargs = {'group_by': ["status"], 'aggregates': ["count", "sum:number_of_pages"], 'order_by': "count"}
+        expected = strategy.generate(populated_collection, **kwargs)
+
+        assert strategy.generate(populated_collection.table(), **kwargs) == expected
+        assert run_strategy(strategy, chunked(populated_collection.list_publications(), 2), **kwargs) == expected
+
+    def test_group_by_required(self, populated_collection):
+        """Test that a grouping field is required."""
+        with pytest.raises(ValueError, match="Grouping field required"):
+            GroupByReportStrategy().generate(populated_collection)
+
+    def test_format_output(self, populated_collection):
+        """Test formatting with and without groups."""
+        strategy = GroupByReportStrategy()
+
+        output = strategy.format_output(strategy.generate(populated_collection, group_by="genre",
+                                                          aggregates=["avg:rating"]))
+        empty = strategy.format_output(strategy.generate([], group_by="genre"))
+
+        assert "RELATÓRIO AGRUPADO POR GÊNERO" in output
+        assert "Fantasia" in output and "9.00" in output
+        assert "5 de 5 grupos" in output
+        assert "Nenhum grupo encontrado." in empty
\ No newline at end of file
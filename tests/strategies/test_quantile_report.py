@@ -0,0 +1,65 @@
+"""
+Unit tests for QuantileReport strategy.
+"""
+
+from src.models import Book, Magazine, PublicationTable
+from src.strategies import QuantileReportStrategy, chunked, run_strategy
+
+
+def _publications() -> list:
+    """Create rated books of two genres plus a magazine."""
+    publications = []
+    for i, (genre, rating, pages) in enumerate([
+        ("Ficção", 6.0, 100), ("Ficção", 8.0, 200), ("Ficção", 9.0, 300),
+        ("História", 5.0, 400), ("História", 7.0, 500),
+    ]):
+        book = Book(i + 1, f"Livro {i}", "Autor", "Editora", 2020, genre, pages)
+        book.start_reading()
+        book.finish_reading()
+        book.rate_publication(rating)
+        publications.append(book)
+    publications.append(Magazine(10, "Revista", "Vários", "Abril", 2020, "Ciência", 80, issue_number=1))
+    return publications
+
+
+class TestQuantileReport:
+    """Test cases for QuantileReport strategy."""
+
+    def test_rating_and_page_percentiles(self):
+        """Test the overall rating, per-genre and pages-per-book percentiles."""
+        report_data = QuantileReportStrategy().generate(_publications())
+
+        assert report_data['quantiles'] == ['p10', 'p50', 'p90']
+        assert report_data['total_evaluated'] == 5
+        assert report_data['ratings']['p50'] == 7.0
+        assert report_data['by_genre']['Ficção'] == {'count': 3, 'p10': 6.0, 'p50': 8.0, 'p90': 9.0}
+        assert list(report_data['by_genre']) == ['Ficção', 'História']
+        assert report_data['pages']['count'] == 5
+        assert report_data['pages']['p50'] == 300
+
+    def test_custom_quantiles(self):
+        """Test requesting other percentiles."""
+        report_data = QuantileReportStrategy().generate(_publications(), quantiles=(0.25, 0.999))
+
+        assert report_data['quantiles'] == ['p25', 'p99.9']
+        assert report_data['ratings']['p99.9'] == 9.0
+
+    def test_table_and_shards_match(self):
+        """Test the columnar path and merged shards against the single pass."""
+        strategy = QuantileReportStrategy()
+        publications = _publications()
+        expected = strategy.generate(publications)
+
+        assert strategy.generate(PublicationTable.from_publications(publications)) == expected
+        assert run_strategy(strategy, chunked(publications, 2)) == expected
+
+    def test_format_output(self):
+        """Test formatting with and without ratings."""
+        strategy = QuantileReportStrategy()
+
+        output = strategy.format_output(strategy.generate(_publications()))
+        empty = strategy.format_output(strategy.generate([]))
+
+        assert "p50: 7.0" in output
+        assert "Ficção (3)" in output
+        assert "Nenhuma publicação avaliada ainda." in empty
\ No newline at end of file
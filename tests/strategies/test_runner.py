@@ -0,0 +1,133 @@
+"""
+Unit tests for the sharded strategy runner.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.models import Book, Configuration, PublicationTable
+from src.strategies import (
+    EvaluationReportStrategy, ProgressReportStrategy, ReportStrategy, TopRatedReportStrategy,
+    ParallelRunner, chunked, run_strategy
+)
+
+
+def _library(count: int = 40) -> list:
+    """Create books in mixed states: read and rated, being read, unread."""
+    books = []
+    for i in range(count):
+        book = Book(i + 1, f"Livro {i:03d}", f"Autor {i % 4}", "Editora", 2000, "Ficção", 100 + i)
+        if i % 3 != 2:
+            book.start_reading()
+        if i % 3 == 0:
+            book.finish_reading()
+            book.rate_publication((i * 7) % 11)
+        books.append(book)
+    return books
+
+
+STRATEGIES = [
+    (EvaluationReportStrategy(), {}),
+    (TopRatedReportStrategy(), {'limit': 7}),
+    (ProgressReportStrategy(), {'config': Configuration(annual_goal=10, simultaneous_reading_limit=3)}),
+]
+
+
+class TestRunner:
+    """Test cases for partial/combine/finalize and run_strategy."""
+
+    @pytest.mark.parametrize("strategy, kwargs", STRATEGIES)
+    @pytest.mark.parametrize("size", [1, 6, 100])
+    def test_sharded_matches_generate(self, strategy, kwargs, size):
+        """Test that merging shard partials gives the single-pass report."""
+        books = _library()
+
+        assert run_strategy(strategy, chunked(books, size), **kwargs) == strategy.generate(books, **kwargs)
+
+    @pytest.mark.parametrize("strategy, kwargs", STRATEGIES)
+    def test_table_shards_and_executor(self, strategy, kwargs):
+        """Test columnar shards run on an executor."""
+        books = _library()
+        shards = [PublicationTable.from_publications(chunk) for chunk in chunked(books, 9)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = run_strategy(strategy, shards, executor, **kwargs)
+
+        expected = strategy.generate(PublicationTable.from_publications(books), **kwargs)
+        assert result == expected
+
+    def test_empty_input(self):
+        """Test that no shards produce the empty report."""
+        strategy = EvaluationReportStrategy()
+
+        assert run_strategy(strategy, []) == strategy.generate([])
+
+    def test_strategy_without_protocol_falls_back(self):
+        """Test that strategies without partials still run over shards."""
+        class CountStrategy(ReportStrategy):
+            def generate(self, publications, **kwargs):
+                return {'count': len(publications)}
+
+            def format_output(self, report_data):
+                return str(report_data['count'])
+
+        strategy = CountStrategy()
+
+        assert not strategy.supports_partials
+        assert run_strategy(strategy, chunked(_library(), 7)) == {'count': 40}
+
+    def test_chunked_rejects_invalid_size(self):
+        """Test that the chunk size must be positive."""
+        with pytest.raises(ValueError):
+            list(chunked([], 0))
+
+
+class TestParallelRunner:
+    """Test cases for the process-pool runner."""
+
+    @pytest.mark.parametrize("strategy, kwargs", STRATEGIES)
+    def test_process_pool_matches_sequential(self, strategy, kwargs):
+        """Test that worker processes over columnar chunks give the sequential report."""
+        books = _library(120)
+        runner = ParallelRunner(workers=2, chunk_size=25, threshold=0)
+
+        assert runner.run(strategy, books, **kwargs) == strategy.generate(
+            PublicationTable.from_publications(books), **kwargs
+        )
+
+    def test_small_sources_run_sequentially(self, monkeypatch, populated_collection):
+        """Test that sources below the threshold never start a pool."""
+        def fail(*args, **kwargs):
+            raise AssertionError("process pool started")
+        monkeypatch.setattr("src.strategies.runner.ProcessPoolExecutor", fail)
+        strategy = EvaluationReportStrategy()
+
+        result = ParallelRunner(workers=4, threshold=1000).run(strategy, populated_collection)
+
+        assert result == strategy.generate(populated_collection.list_publications())
+
+    def test_pool_failure_falls_back(self, monkeypatch):
+        """Test that a platform without process pools still gets the report."""
+        def unavailable(*args, **kwargs):
+            raise OSError("no semaphores")
+        monkeypatch.setattr("src.strategies.runner.ProcessPoolExecutor", unavailable)
+        strategy = TopRatedReportStrategy()
+        books = _library()
+
+        result = ParallelRunner(workers=2, chunk_size=10, threshold=0).run(strategy, books, limit=3)
+
+        assert result == strategy.generate(books, limit=3)
+
+    def test_sharded_store(self):
+        """Test a list of table shards as the source."""
+        books = _library()
+        shards = [PublicationTable.from_publications(books[:15]), PublicationTable.from_publications(books[15:])]
+        strategy = EvaluationReportStrategy()
+
+        assert ParallelRunner(workers=1).run(strategy, shards) == strategy.generate(books)
+
+    def test_invalid_settings(self):
+        """Test that workers and chunk size must be positive."""
+        with pytest.raises(ValueError):
+            ParallelRunner(workers=0)
+        with pytest.raises(ValueError):
+            ParallelRunner(chunk_size=0)
\ No newline at end of file
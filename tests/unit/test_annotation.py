@@ -59,4 +59,8 @@ class TestAnnotation:
     def test_empty_text_raises_error(self):
         """Test that empty text raises ValueError"""
         with pytest.raises(ValueError, match="Text cannot be empty"):
-            Annotation("ann_005", "")
\ No newline at end of file
+            Annotation("ann_005", "")
+
+    def test_annotation_uses_slots(self, sample_annotation):
+        """Test that annotations have no per-instance __dict__."""
+        assert not hasattr(sample_annotation, "__dict__")
@@ -3,7 +3,7 @@ Unit tests for Book class.
 """
 
 import pytest
-from src.models import Book
+from src.models import Book, DigitalAsset
 
 class TestBook:
     """Test cases specific to Book class."""
@@ -99,4 +99,25 @@ class TestBook:
         """Test that string representation includes ISBN."""
         str_repr = str(sample_book)
 
-        assert "ISBN: 978-0452284234" in str_repr
\ No newline at end of file
+        assert "ISBN: 978-0452284234" in str_repr
+
+    def test_book_uses_slots(self, sample_book):
+        """Test that books have no per-instance __dict__ but keep the mixin behavior."""
+        assert not hasattr(sample_book, "__dict__")
+        assert isinstance(sample_book, DigitalAsset)
+        assert sample_book.has_digital_file() is False
+
+        with pytest.raises(AttributeError):
+            sample_book.unknown_attribute = 1
+
+    def test_from_dict_trusted_matches_strict(self, read_book, sample_annotation):
+        """Test that trusted loading rebuilds the same state as strict loading."""
+        read_book.add_annotation(sample_annotation)
+        data = read_book.to_dict()
+
+        trusted = Book.from_dict(data, trusted=True)
+        strict = Book.from_dict(data)
+
+        assert trusted.to_dict() == strict.to_dict() == data
+        assert trusted.status == "READ"
+        assert trusted.annotations[0].text == sample_annotation.text
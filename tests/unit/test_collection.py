@@ -2,9 +2,11 @@
 Unit tests for Collection class.
 """
 
+import json
 import pytest
 from datetime import date, timedelta
 from src.models import Collection, Book, Configuration
+from src.data import repository
 
 
 class TestCollection:
@@ -139,4 +141,136 @@ class TestCollection:
     def test_start_reading_nonexistent_publication_raises_error(self, sample_collection, sample_configuration):
         """Test starting reading of non-existent publication raises ValueError."""
         with pytest.raises(ValueError, match="not found"):
-            sample_collection.start_publication_reading(999, sample_configuration)
\ No newline at end of file
+            sample_collection.start_publication_reading(999, sample_configuration)
+
+    def test_from_dict_trusted(self, populated_collection):
+        """Test rebuilding a collection from snapshot data in trusted mode."""
+        data = populated_collection.to_dict()
+
+        collection = Collection.from_dict(data, trusted=True)
+
+        assert collection.to_dict() == data
+        assert len(collection.search_by_status("READ")) == 2
+
+    def test_load_collection_strict_rejects_duplicates(self, setup_test_environment, sample_book):
+        """Test that strict (import) loading keeps the duplicate check."""
+        repository.save_publication([sample_book, sample_book])
+
+        with pytest.raises(ValueError, match="already exists"):
+            repository.load_collection(trusted=False)
+
+    def test_trusted_load_accepts_incomplete_records(self, setup_test_environment):
+        """Test that a hand-edited record missing snapshot keys still loads, with defaults."""
+        record = {'type': "Book", 'pub_id': 1, 'title': "Livro", 'author': "Autor", 'year': 2020, 'number_of_pages': 100}
+        setup_test_environment.write_text(json.dumps([record]), encoding="utf-8")
+
+        collection = repository.load_collection()
+
+        book = collection.list_publications()[0]
+        assert (book.publisher, book.genre, book.status, book.start_read_date) == ("", "", "UNREAD", None)
+
+    def test_trusted_load_keeps_one_row_per_id(self, sample_book):
+        """Test that a snapshot repeating an ID leaves no orphan row behind."""
+        data = sample_book.to_dict()
+        renamed = dict(data, title="Outro título")
+
+        collection = Collection.from_dict({'publications': [data, renamed]}, trusted=True)
+
+        assert len(collection) == 1
+        assert [pub.title for pub in collection.search_by_status("UNREAD")] == ["Outro título"]
+        assert collection.facets(["status"]) == {"status": {"UNREAD": 1}}
+
+        collection.remove_publication(sample_book.id)
+
+        assert len(collection) == 0
+        assert collection.search_by_status("UNREAD") == []
+        assert collection.facets(["status"]) == {"status": {}}
+
+    def test_register_duplicate_ignores_case(self, sample_collection):
+        """Test that the duplicate check uses the normalized identity."""
+        duplicate = Book(99, "  1984 ", "george orwell", "Outra", 1950, "Ficção", 300)
+
+        with pytest.raises(ValueError, match="already exists"):
+            sample_collection.register_publication(duplicate)
+
+    def test_duplicate_check_follows_title_change(self, sample_collection):
+        """Test that renaming frees the old identity and takes the new one."""
+        sample_collection.register_publication(Book(3, "Outro", "Autor", "Editora", 2000, "Ficção", 100))
+        book = sample_collection.search_by_title("1984")[0]
+
+        book.title = "Nineteen Eighty-Four"
+
+        sample_collection.register_publication(Book(4, "1984", "George Orwell", "Editora", 1949, "Ficção", 328))
+        with pytest.raises(ValueError, match="already exists"):
+            sample_collection.register_publication(
+                Book(5, "nineteen eighty-four", "George Orwell", "Editora", 1949, "Ficção", 328)
+            )
+
+    def test_set_operations(self, sample_collection):
+        """Test union, difference and intersection by identity."""
+        other = Collection()
+        other.register_publication(Book(10, "1984", "George Orwell", "Outra", 1949, "Ficção", 328))
+        other.register_publication(Book(11, "Dom Casmurro", "Machado de Assis", "Garnier", 1899, "Romance", 256))
+
+        union = sample_collection.union(other)
+        difference = sample_collection.difference(other)
+        intersection = sample_collection.intersection(other)
+
+        assert sorted(pub.id for pub in union.list_publications()) == [1, 2, 11]
+        assert [pub.title for pub in difference.list_publications()] == ["National Geographic"]
+        assert [pub.id for pub in intersection.list_publications()] == [1]
+        assert len(sample_collection.list_publications()) == 2
+
+    def test_set_operations_leave_publications_untouched(self, sample_collection):
+        """Test that set operation results never connect to the shared publications."""
+        other = Collection()
+        other.register_publication(Book(11, "Dom Casmurro", "Machado de Assis", "Garnier", 1899, "Romance", 256))
+        publications = sample_collection.list_publications() + other.list_publications()
+        buses = {pub.id: pub._buses for pub in publications}
+
+        for _ in range(3):
+            union = sample_collection.union(other)
+            union.search_by_status("UNREAD")
+            assert {pub.id: pub._buses for pub in publications} == buses
+            sample_collection.difference(other).facets(["genre"])
+            assert {pub.id: pub._buses for pub in publications} == buses
+            sample_collection.intersection(union)
+            assert {pub.id: pub._buses for pub in publications} == buses
+
+    def test_set_operation_queries_follow_later_changes(self, populated_collection):
+        """Test that a set operation result answers from the publications' current state."""
+        other = Collection()
+        view = populated_collection.union(other)
+        assert [pub.id for pub in view.search_by_status("READING")] == [3]
+        assert view.stats.status_counts["READ"] == 2
+
+        book = next(pub for pub in populated_collection.list_publications() if pub.id == 1)
+        book.start_reading()
+        book.finish_reading()
+        book.rate_publication(7.0)
+
+        assert [pub.id for pub in view.search_by_status("READ")] == [1, 4, 5]
+        assert view.facets(["status"]) == populated_collection.facets(["status"])
+        assert view.stats.average_rating == populated_collection.stats.average_rating
+        assert view.top_rated(1, status="READ")[0].id == populated_collection.top_rated(1, status="READ")[0].id
+        assert view.query().filter(status="READ").count() == 3
+
+    def test_union_rejects_conflicting_ids(self, sample_collection):
+        """Test that union refuses two different publications with the same ID."""
+        other = Collection()
+        other.register_publication(Book(1, "Outro Livro", "Outro Autor", "Editora", 2000, "Ficção", 100))
+
+        with pytest.raises(ValueError, match="already exists"):
+            sample_collection.union(other)
+
+    def test_deduplicate(self, sample_book):
+        """Test removing equal publications left by a trusted load."""
+        copy = Book.from_dict(dict(sample_book.to_dict(), pub_id=7, title="1984 "))
+        collection = Collection.from_dict(
+            {"publications": [sample_book.to_dict(), copy.to_dict()]}, trusted=True
+        )
+
+        removed = collection.deduplicate()
+
+        assert [pub.id for pub in removed] == [7]
+        assert [pub.id for pub in collection.list_publications()] == [1]
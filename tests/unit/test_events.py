@@ -0,0 +1,114 @@
+"""
+Unit tests for model change events and EventBus.
+"""
+
+from src.models import Annotation, Book, Collection, EventBus
+from src.models.events import (
+    AnnotationAdded, AnnotationRemoved, FieldChanged, PublicationAdded,
+    PublicationRemoved, RatingChanged, StatusChanged
+)
+
+
+class TestEventBus:
+    """Test cases for EventBus and publication events."""
+
+    def test_publication_without_bus_emits_nothing(self, sample_book):
+        """Test that state changes work with no bus connected."""
+        sample_book.start_reading()
+        sample_book.finish_reading()
+
+        assert sample_book._buses == ()
+
+    def test_reading_lifecycle_events(self, sample_book):
+        """Test the typed events emitted by start, finish and rate."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append)
+        sample_book.connect(bus)
+
+        sample_book.start_reading()
+        sample_book.finish_reading()
+        sample_book.rate_publication(9.0)
+
+        assert [type(event) for event in received] == [StatusChanged, StatusChanged, RatingChanged]
+        assert (received[0].old_value, received[0].new_value) == ("UNREAD", "READING")
+        assert (received[2].field, received[2].new_value) == ("rating", 9.0)
+        assert received[2].publication is sample_book
+
+    def test_reread_clears_rating_event(self, read_book):
+        """Test that restarting a rated book reports the cleared rating."""
+        read_book.rate_publication(7.0)
+        bus = EventBus()
+        ratings = []
+        bus.subscribe(ratings.append, RatingChanged)
+        read_book.connect(bus)
+
+        read_book.start_reading()
+
+        assert (ratings[0].old_value, ratings[0].new_value) == (7.0, None)
+
+    def test_annotation_events(self, sample_book):
+        """Test events for adding and removing annotations."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append, AnnotationAdded, AnnotationRemoved)
+        sample_book.connect(bus)
+        annotation = Annotation("ann_1_1", "Trecho")
+
+        sample_book.add_annotation(annotation)
+        sample_book.remove_annotation("ann_1_1")
+
+        assert [type(event) for event in received] == [AnnotationAdded, AnnotationRemoved]
+        assert received[1].annotation is annotation
+
+    def test_subscription_by_base_class_and_unsubscribe(self, sample_book):
+        """Test that base-class subscriptions receive subclasses until removed."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append, FieldChanged)
+        sample_book.connect(bus)
+
+        sample_book.title = "Animal Farm"
+        bus.unsubscribe(received.append)
+        sample_book.year = 1945
+
+        assert len(received) == 1
+        assert received[0].field == "title"
+        assert not bus.has_subscribers(FieldChanged)
+
+    def test_disconnect_stops_events(self, sample_book):
+        """Test that a disconnected bus no longer receives events."""
+        bus = EventBus()
+        received = []
+        bus.subscribe(received.append)
+        sample_book.connect(bus)
+        sample_book.disconnect(bus)
+
+        sample_book.start_reading()
+
+        assert received == []
+
+    def test_collection_events(self, sample_book):
+        """Test collection-level events and forwarding of publication changes."""
+        collection = Collection()
+        received = []
+        collection.events.subscribe(received.append)
+
+        collection.register_publication(sample_book)
+        sample_book.start_reading()
+        collection.remove_publication(sample_book.id)
+        sample_book.finish_reading()
+
+        assert [type(event) for event in received] == [PublicationAdded, StatusChanged, PublicationRemoved]
+
+    def test_collection_indexes_updated_before_subscribers(self, sample_collection):
+        """Test that collection indexes already reflect a change when handlers run."""
+        seen = []
+        sample_collection.events.subscribe(
+            lambda event: seen.append(len(sample_collection.search_by_status("READING"))),
+            StatusChanged,
+        )
+
+        sample_collection.list_publications()[0].start_reading()
+
+        assert seen == [1]
@@ -0,0 +1,101 @@
+"""
+Unit tests for the GroupBy hash-aggregation engine.
+"""
+
+import pytest
+from src.models import Book, Collection, Magazine
+from src.models.groupby import AggregateSpec, Condition, GroupBy, parse_aggregate, parse_condition
+
+
+@pytest.fixture
+def library():
+    """Create a collection with several books per author and one magazine."""
+    collection = Collection()
+    entries = [
+        ("Autor A", "Alfa", "Ficção", 100, 8.0),
+        ("Autor A", "Alfa", "Ficção", 200, 6.0),
+        ("Autor A", "Beta", "História", 300, None),
+        ("Autor B", "Beta", "Ficção", 400, 9.0),
+        ("Autor C", "Alfa", "História", 500, None),
+    ]
+    for pub_id, (author, publisher, genre, pages, rating) in enumerate(entries, start=1):
+        book = Book(pub_id, f"Livro {pub_id}", author, publisher, 2020, genre, pages)
+        if rating is not None:
+            book.start_reading()
+            book.finish_reading()
+            book.rate_publication(rating)
+        collection.register_publication(book)
+    collection.register_publication(Magazine(6, "Revista", "Autor B", "Beta", 2021, "Ficção", 50, issue_number=1))
+    return collection
+
+
+class TestGroupBy:
+    """Test cases for GroupBy."""
+
+    def test_count_sum_avg_min_max(self, library):
+        """Test every aggregate function over one grouping field."""
+        grouping = GroupBy("author", ["count", "sum:number_of_pages", "avg:rating", "min:rating", "max:rating"])
+
+        rows = grouping.run(library)
+
+        assert rows[0] == {'author': "Autor A", 'count': 3, 'sum:number_of_pages': 600,
+                           'avg:rating': 7.0, 'min:rating': 6.0, 'max:rating': 8.0}
+        assert rows[2] == {'author': "Autor C", 'count': 1, 'sum:number_of_pages': 500,
+                           'avg:rating': None, 'min:rating': None, 'max:rating': None}
+
+    def test_where_having_order_and_limit(self, library):
+        """Test filtering rows, filtering groups, ordering and limiting."""
+        grouping = GroupBy(["publisher"], ["count", "sum:number_of_pages"], where={"type": "Book"},
+                           having=["count>=2"], order_by="sum:number_of_pages", descending=False, limit=1)
+
+        assert grouping.run(library) == [{'publisher': "Beta", 'count': 2, 'sum:number_of_pages': 700}]
+
+    def test_ascending_order_puts_missing_values_last(self, library):
+        """Test that groups without a value sort last in both directions."""
+        ascending = GroupBy("author", ["avg:rating"], order_by="avg:rating", descending=False).run(library)
+        descending = GroupBy("author", ["avg:rating"], order_by="avg:rating").run(library)
+
+        assert [row['author'] for row in ascending] == ["Autor A", "Autor B", "Autor C"]
+        assert [row['author'] for row in descending] == ["Autor B", "Autor A", "Autor C"]
+
+    def test_having_and_order_on_aggregates_not_shown(self, library):
+        """Test that HAVING and ORDER BY can use aggregates that are not output columns."""
+        grouping = GroupBy("author", ["avg:rating"], having=["count>=2"], order_by="sum:number_of_pages")
+
+        assert grouping.run(library) == [{'author': "Autor A", 'avg:rating': 7.0},
+                                         {'author': "Autor B", 'avg:rating': 9.0}]
+        assert grouping.run(library.table()) == grouping.run(library)
+
+    def test_sources_and_shards_agree(self, library):
+        """Test the collection, table, list and merged shard paths against each other."""
+        grouping = GroupBy(["genre", "type"], ["count", "avg:rating"], where={"author": ["Autor A", "Autor B"]})
+        publications = library.list_publications()
+        expected = grouping.run(library)
+
+        assert grouping.run(library.table()) == expected
+        assert grouping.run(iter(publications)) == expected
+        shards = [grouping.partial(publications[:2]), grouping.partial(library.table().slice(2, 6))]
+        assert grouping.finalize(GroupBy.combine(*shards)) == expected
+
+    def test_parsing(self):
+        """Test the text forms of aggregates and conditions."""
+        assert parse_aggregate("avg:rating") == AggregateSpec("avg:rating", "avg", "rating")
+        assert parse_aggregate("count") == AggregateSpec("count", "count", None)
+        assert parse_condition("avg:rating >= 7.5") == Condition("avg:rating", ">=", 7.5)
+        assert parse_condition("genre=Ficção") == Condition("genre", "=", "Ficção")
+        with pytest.raises(ValueError):
+            parse_condition("count")
+
+    @pytest.mark.parametrize("arguments", [
+        {'keys': "title"},
+        {'keys': "author", 'aggregates': ["median:rating"]},
+        {'keys': "author", 'aggregates': ["sum"]},
+        {'keys': "author", 'aggregates': ["avg:title"]},
+        {'keys': "author", 'having': ["total>1"]},
+        {'keys': "author", 'order_by': "total"},
+        {'keys': "author", 'where': {"title": "X"}},
+    ])
+    def test_invalid_grouping(self, arguments):
+        """Test that unknown fields, functions and columns are rejected."""
+        with pytest.raises(ValueError):
+            GroupBy(**arguments)
\ No newline at end of file
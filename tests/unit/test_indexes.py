@@ -0,0 +1,225 @@
+"""
+Unit tests for the index structures and their use by Collection.
+"""
+
+import pytest
+from src.models import Collection, Book, Magazine
+from src.models.indexes import BitmapIndex, bits_from_rows, iter_bits, popcount, select_top_rated
+
+
+class TestBitmapHelpers:
+    """Test cases for bitset helper functions."""
+
+    def test_bits_from_rows_and_iter_bits(self):
+        """Test building a bitset and iterating its rows back."""
+        bits = bits_from_rows([0, 3, 9, 64], size=70)
+
+        assert list(iter_bits(bits)) == [0, 3, 9, 64]
+        assert popcount(bits) == 4
+
+    def test_iter_bits_empty(self):
+        """Test iterating an empty bitset."""
+        assert list(iter_bits(0)) == []
+
+
+class TestBitmapIndex:
+    """Test cases for BitmapIndex class."""
+
+    def test_build_and_lookup(self):
+        """Test bulk build, single and multi-value lookups."""
+        rows = ["a", "b", None, "a"]
+        index = BitmapIndex.build("letter", lambda value: value, rows)
+
+        assert list(iter_bits(index.lookup("a"))) == [0, 3]
+        assert list(iter_bits(index.lookup_any(["a", "b"]))) == [0, 1, 3]
+        assert index.lookup("z") == 0
+        assert index.counts() == {"a": 2, "b": 1}
+
+    def test_move_and_discard(self):
+        """Test moving a row between values and discarding it."""
+        index = BitmapIndex("letter", lambda value: value)
+        index.add(0, "a")
+        index.move(0, "a", "b")
+
+        assert index.values() == ["b"]
+        index.discard(0, "b")
+        assert index.values() == []
+
+
+@pytest.fixture
+def indexed_collection():
+    """Create a collection with varied categorical values."""
+    collection = Collection()
+    collection.register_publication(Book(1, "Livro A", "Autor", "Rocco", 2020, "Ficção", 100))
+    collection.register_publication(Book(2, "Livro B", "Autor", "Intrínseca", 2021, "Ficção", 100))
+    collection.register_publication(Book(3, "Livro C", "Autor", "Rocco", 2021, "Ciência", 100))
+    collection.register_publication(Magazine(4, "Revista", "Vários", "Abril", 2021, "Ciência", 50, issue_number=1))
+    return collection
+
+
+class TestCollectionBitmaps:
+    """Test cases for bitmap filtering on Collection."""
+
+    def test_and_or_not(self, indexed_collection):
+        """Test combining AND, OR and NOT through match_bitmap."""
+        bits = indexed_collection.match_bitmap(
+            include={"year": 2021, "genre": ["Ciência", "Ficção"]},
+            exclude={"type": "Magazine"},
+        )
+
+        assert [pub.id for pub in indexed_collection.publications_in(bits)] == [2, 3]
+
+    def test_bitmaps_follow_status_changes(self, indexed_collection):
+        """Test that status transitions move rows between bitmaps."""
+        indexed_collection.bitmap("status", "UNREAD")
+        book = indexed_collection.query().filter(id=2).first()
+        book.start_reading()
+
+        assert [pub.id for pub in indexed_collection.search_by_status("READING")] == [2]
+        assert popcount(indexed_collection.bitmap("status", "UNREAD")) == 3
+
+    def test_bitmaps_follow_registration_and_removal(self, indexed_collection):
+        """Test that added and removed publications are reflected in bitmaps."""
+        indexed_collection.bitmap("genre", "Ficção")
+        indexed_collection.remove_publication(1)
+        indexed_collection.register_publication(Book(5, "Livro D", "Autor", "Rocco", 2022, "Ficção", 100))
+
+        ids = [pub.id for pub in indexed_collection.publications_in(indexed_collection.bitmap("genre", "Ficção"))]
+        assert ids == [2, 5]
+
+    def test_unindexed_field_raises_error(self, indexed_collection):
+        """Test that asking for a bitmap on an unindexed field raises ValueError."""
+        with pytest.raises(ValueError, match="no bitmap index"):
+            indexed_collection.bitmap("title", "Livro A")
+
+    def test_query_uses_bitmaps(self, indexed_collection):
+        """Test that equality filters on categorical fields are pushed down."""
+        query = indexed_collection.query().filter(publisher="Rocco").exclude(genre="Ciência")
+
+        assert "bitmap index" in query.explain()
+        assert [pub.id for pub in query] == [1]
+        assert query.count() == 1
+
+
+class TestFacets:
+    """Test cases for facet counts."""
+
+    def test_collection_facets(self, indexed_collection):
+        """Test counts for several dimensions at once."""
+        facets = indexed_collection.facets(["publisher", "decade", "type"])
+
+        assert facets["publisher"] == {"Rocco": 2, "Abril": 1, "Intrínseca": 1}
+        assert facets["decade"] == {2020: 4}
+        assert facets["type"] == {"Book": 3, "Magazine": 1}
+
+    def test_query_facets_with_bitmap_filter(self, indexed_collection):
+        """Test facet counts restricted to a bitmap-filtered subset."""
+        facets = indexed_collection.query().filter(year=2021).facets(["genre"])
+
+        assert facets == {"genre": {"Ciência": 2, "Ficção": 1}}
+
+    def test_query_facets_with_residual_filter(self, indexed_collection):
+        """Test facet counts when a filter needs a scan."""
+        facets = indexed_collection.query().title_contains("livro").facets(["genre", "status"])
+
+        assert facets == {"genre": {"Ficção": 2, "Ciência": 1}, "status": {"UNREAD": 3}}
+
+    def test_unknown_dimension_raises_error(self, indexed_collection):
+        """Test that an unknown dimension raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown facet dimension"):
+            indexed_collection.facets(["color"])
+
+
+def _rated_book(pub_id, title, rating):
+    """Create a read book with the given rating."""
+    book = Book(pub_id, title, f"Autor {pub_id}", "Editora", 2020, "Ficção", 100)
+    book.start_reading()
+    book.finish_reading()
+    book.rate_publication(rating)
+    return book
+
+
+class TestTopRated:
+    """Test cases for top-K selection and the maintained rating index."""
+
+    def test_select_top_rated_matches_full_sort(self):
+        """Test that heap selection equals sorting and slicing."""
+        books = [_rated_book(i, f"Livro {i % 7}-{i}", (i * 37) % 11) for i in range(1, 60)]
+        expected = sorted(books, key=lambda p: (-p.rating, p.title))[:10]
+
+        assert select_top_rated(books, 10) == expected
+        assert select_top_rated(books, 0) == []
+
+    def test_top_rated_ties_by_title(self):
+        """Test that ties are broken by title."""
+        collection = Collection()
+        collection.register_publication(_rated_book(1, "Zorro", 9.0))
+        collection.register_publication(_rated_book(2, "Amor", 9.0))
+        collection.register_publication(_rated_book(3, "Meio", 7.0))
+
+        assert [pub.id for pub in collection.top_rated(2)] == [2, 1]
+
+    def test_index_follows_rating_changes(self):
+        """Test that rating and re-reads keep the index current."""
+        collection = Collection()
+        first = _rated_book(1, "Primeiro", 6.0)
+        second = _rated_book(2, "Segundo", 8.0)
+        collection.register_publication(first)
+        collection.register_publication(second)
+        assert [pub.id for pub in collection.top_rated(5)] == [2, 1]
+
+        first.rate_publication(9.5)
+        assert [pub.id for pub in collection.top_rated(5)] == [1, 2]
+
+        first.start_reading()
+        assert [pub.id for pub in collection.top_rated(5)] == [2]
+
+        collection.remove_publication(2)
+        assert collection.top_rated(5) == []
+
+
+class TestRatingRanges:
+    """Test cases for rating range queries and percentiles."""
+
+    @pytest.fixture
+    def rated_collection(self):
+        """Create a collection rated 5, 7, 8, 9 and 10 plus an unread book."""
+        collection = Collection()
+        for pub_id, rating in enumerate([8.0, 5.0, 10.0, 7.0, 9.0], start=1):
+            collection.register_publication(_rated_book(pub_id, f"Livro {pub_id}", rating))
+        collection.register_publication(Book(6, "Não lido", "Autor", "Editora", 2020, "Ficção", 100))
+        return collection
+
+    def test_rated_between(self, rated_collection):
+        """Test closed and open-ended rating ranges."""
+        assert [pub.rating for pub in rated_collection.rated_between(7, 9)] == [9.0, 8.0, 7.0]
+        assert [pub.rating for pub in rated_collection.rated_between(min_rating=9)] == [10.0, 9.0]
+        assert [pub.rating for pub in rated_collection.rated_between(max_rating=5)] == [5.0]
+        assert rated_collection.rated_between(9.5, 9.9) == []
+
+    def test_rating_percentile(self, rated_collection):
+        """Test nearest-rank percentiles."""
+        assert rated_collection.rating_percentile(50) == 8.0
+        assert rated_collection.rating_percentile(0) == 5.0
+        assert rated_collection.rating_percentile(100) == 10.0
+        assert Collection().rating_percentile(50) is None
+
+    def test_rating_percentile_out_of_range(self, rated_collection):
+        """Test that an invalid percentile raises ValueError."""
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            rated_collection.rating_percentile(101)
+
+    def test_range_follows_re_read(self, rated_collection):
+        """Test that a re-read removes the publication from rating ranges."""
+        rated_collection.rated_between(0, 10)
+        rated_collection.query().filter(id=3).first().start_reading()
+
+        assert [pub.rating for pub in rated_collection.rated_between(9, 10)] == [9.0]
+
+    def test_query_rating_range_uses_index(self, rated_collection):
+        """Test that rating ranges are pushed down and combined with bitmaps."""
+        query = rated_collection.query().filter(status="READ").rating_between(7, 9)
+
+        assert "bitmap index" in query.explain()
+        assert [pub.id for pub in query] == [1, 4, 5]
+        assert rated_collection.query().filter(id=[1, 2]).rating_between(min_rating=6).count() == 1
@@ -106,4 +106,9 @@ class TestMagazine:
     def test_magazine_str_includes_issue(self, sample_magazine):
         """Test that string representation includes issue number."""
         str_repr = str(sample_magazine)
-        assert "ISSN: 0027-9358" in str_repr
\ No newline at end of file
+        assert "ISSN: 0027-9358" in str_repr
+
+    def test_magazine_uses_slots(self, sample_magazine):
+        """Test that magazines have no per-instance __dict__."""
+        assert not hasattr(sample_magazine, "__dict__")
+        assert sample_magazine._Publication__status == "UNREAD"
@@ -0,0 +1,115 @@
+"""
+Unit tests for the single-pass metric accumulators.
+"""
+
+import pytest
+from collections import Counter
+from statistics import mean, stdev
+from src.models import Book, Report
+from src.models.indexes import select_top_rated
+from src.models.metrics import Count, Metric, RatingMean, RatingStats, StatusCounts, TopRated, evaluate
+from src.strategies import EvaluationReportStrategy
+
+
+def _rated_books(count: int) -> list:
+    """Create READ books with repeating ratings and distinct titles."""
+    books = []
+    for i in range(count):
+        book = Book(i + 1, f"Livro {i:04d}", "Autor", "Editora", 2000, "Ficção", 100)
+        book.start_reading()
+        book.finish_reading()
+        book.rate_publication((i * 7) % 21 / 2)
+        books.append(book)
+    return books
+
+
+class TestMetrics:
+    """Test cases for the accumulators and the fused evaluation."""
+
+    def test_evaluate_consumes_iterable_once(self, populated_collection):
+        """Test that every metric is computed from a single traversal of a generator."""
+        publications = populated_collection.list_publications()
+        metrics = evaluate((pub for pub in publications), {
+            "total": Count(),
+            "by_status": StatusCounts(),
+            "average": RatingMean(status="READ"),
+            "top": TopRated(1),
+        })
+
+        assert metrics["total"] == 5
+        assert metrics["by_status"]["READ"] == (2, 40.0)
+        assert metrics["average"] == 8.75
+        assert [pub.id for pub in metrics["top"]] == [5]
+
+    def test_top_rated_prunes_to_same_selection(self):
+        """Test that the bounded candidate buffer selects like a full sort."""
+        books = _rated_books(500)
+        selection = TopRated(7)
+        evaluate(books, {"top": selection})
+
+        assert selection.result() == select_top_rated(books, 7)
+        assert selection.rated == 500
+        assert len(selection._candidates) <= selection._capacity
+
+    def test_rating_stats_matches_statistics(self):
+        """Test that the online statistics agree with the statistics module."""
+        books = _rated_books(50)
+        ratings = [book.rating for book in books]
+        summary = evaluate(iter(books), {"ratings": RatingStats()})["ratings"]
+
+        assert summary["mean"] == pytest.approx(mean(ratings))
+        assert summary["std_dev"] == pytest.approx(stdev(ratings))
+        assert (summary["min"], summary["max"]) == (min(ratings), max(ratings))
+        assert sum(summary["distribution"].values()) == 50
+
+    def test_rating_stats_merge_matches_single_pass(self):
+        """Test that merged chunk statistics equal the single-pass ones."""
+        books = _rated_books(101)
+        whole = evaluate(books, {"ratings": RatingStats()})["ratings"]
+        left, right, empty = RatingStats(), RatingStats(), RatingStats()
+        evaluate(books[:37], {"ratings": left})
+        evaluate(books[37:], {"ratings": right})
+
+        merged = empty.merge(left).merge(right).result()
+
+        assert merged["mean"] == pytest.approx(whole["mean"])
+        assert merged["std_dev"] == pytest.approx(whole["std_dev"])
+        assert merged["distribution"] == whole["distribution"]
+        assert merged["most_common"] == whole["most_common"]
+
+    def test_distribution_bins_match_counter(self):
+        """Test that the tenth bins give the keys, order and tie-break of a Counter over the ratings."""
+        ratings = (9.7, 9.5, 9.8, 9.2, 8, 9.5, 9.7, 10, 0, 8.0)
+        stats = RatingStats()
+        for rating in ratings:
+            stats.add_rating(rating)
+        counts = Counter(ratings)
+
+        distribution = stats.result()["distribution"]
+        assert distribution == dict(sorted(counts.items()))
+        assert [type(key) for key in distribution] == [type(key) for key in sorted(counts)]
+        assert stats.result()["most_common"] == counts.most_common(1)[0] == (9.7, 2)
+        assert len(stats.bins) == 101
+
+    def test_summarize_list_matches_collection(self, populated_collection):
+        """Test that the fused path agrees with the maintained collection path."""
+        publications = populated_collection.list_publications()
+
+        assert Report.summarize(publications) == Report.summarize(populated_collection)
+        assert Report.summarize(publications, top=0)["top"] == []
+
+    def test_evaluation_strategy_parity_with_table(self, collection_with_ratings):
+        """Test that the strategy reports the same figures from a list and a table."""
+        strategy = EvaluationReportStrategy()
+        publications = collection_with_ratings.list_publications()
+
+        assert strategy.generate(publications) == strategy.generate(collection_with_ratings.table())
+
+    def test_incomplete_metric_cannot_be_created(self):
+        """Test that a metric missing part of the interface fails when instantiated."""
+        class AddOnly(Metric):
+            def add(self, pub) -> None:
+                pass
+
+        with pytest.raises(TypeError):
+            AddOnly()
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+Unit tests for page progress tracking.
+"""
+
+import pytest
+from datetime import date, timedelta
+from src.models import Book, Collection
+from src.models.progress import ProgressLog, dump_logs, load_logs
+from src.data import repository
+from src.strategies import ProgressReportStrategy
+
+
+def _reading_book(days_ago: int = 9) -> Book:
+    """Create a 300-page book whose reading started some days ago."""
+    book = Book(1, "Livro em Leitura", "Autor", "Editora", 2020, "Ficção", 300)
+    book.start_reading()
+    book._start_read_date = date.today() - timedelta(days=days_ago)
+    return book
+
+
+class TestProgressLog:
+    """Test cases for ProgressLog and Publication.record_progress."""
+
+    def test_one_entry_per_day(self):
+        """Test that a second update on the same day overwrites the first."""
+        log = ProgressLog()
+        log.record(10, date(2025, 1, 1))
+        log.record(25, date(2025, 1, 1))
+        log.record(40, date(2025, 1, 3))
+
+        assert list(log) == [(date(2025, 1, 1), 25), (date(2025, 1, 3), 40)]
+        assert log.days.itemsize == 4
+
+    def test_out_of_order_entry_raises_error(self):
+        """Test that the series only moves forward in time."""
+        log = ProgressLog()
+        log.record(10, date(2025, 1, 2))
+
+        with pytest.raises(ValueError, match="chronological"):
+            log.record(5, date(2025, 1, 1))
+
+    def test_page_cannot_go_back_within_a_reading(self):
+        """Test that the page cannot drop within a reading, on the same day or a later one."""
+        book = _reading_book(days_ago=9)
+        book.record_progress(120, day=date.today() - timedelta(days=2))
+        book.record_progress(150)
+        book.record_progress(160)
+
+        with pytest.raises(ValueError, match="lower than 160"):
+            book.record_progress(140)
+        with pytest.raises(ValueError, match="lower than 160"):
+            book.record_progress(100, day=date.today() + timedelta(days=1))
+        assert book.current_page == 160
+
+    def test_new_reading_restarts_from_page_zero(self, read_book):
+        """Test that a lower page is accepted once a new reading starts."""
+        read_book.start_reading()
+        read_book._start_read_date = date.today() - timedelta(days=5)
+        read_book.record_progress(200, day=date.today() - timedelta(days=3))
+        read_book.finish_reading()
+        read_book.start_reading()
+
+        read_book.record_progress(10)
+        assert read_book.current_page == 10
+
+    def test_pace_and_eta(self):
+        """Test pages per day since the reading started and the finish estimate."""
+        book = _reading_book(days_ago=9)
+        book.record_progress(100)
+
+        assert book.current_page == 100
+        assert book.progress.pages_per_day(since=book.start_read_date) == 10
+        assert book.progress.eta(300, book.start_read_date, date.today()) == date.today() + timedelta(days=20)
+
+    def test_record_progress_validation(self, sample_book):
+        """Test that progress needs a reading in progress and a valid page."""
+        with pytest.raises(ValueError, match="while reading"):
+            sample_book.record_progress(10)
+        sample_book.start_reading()
+        with pytest.raises(ValueError, match="between 0 and 328"):
+            sample_book.record_progress(329)
+        with pytest.raises(TypeError):
+            sample_book.record_progress("10")
+
+    def test_current_page_resets_on_reread(self, read_book):
+        """Test that a new reading starts without a current page but keeps the log."""
+        read_book.start_reading()
+        read_book.record_progress(50)
+        read_book.finish_reading()
+        read_book.start_reading()
+        read_book._start_read_date = date.today() + timedelta(days=1)
+
+        assert read_book.current_page is None
+        assert len(read_book.progress) == 1
+
+    def test_binary_roundtrip(self):
+        """Test encoding and decoding several logs."""
+        first, second = ProgressLog(), ProgressLog()
+        first.record(10, date(2025, 1, 1))
+        first.record(30, date(2025, 1, 2))
+        second.record(5, date(2024, 12, 31))
+
+        logs = load_logs(dump_logs({1: first, 2: second}))
+
+        assert list(logs[1]) == list(first)
+        assert list(logs[2]) == list(second)
+
+    def test_progress_saved_in_sidecar(self, setup_test_environment):
+        """Test that progress goes to the binary sidecar, not library.json."""
+        collection = Collection()
+        book = _reading_book()
+        collection.register_publication(book)
+        book.record_progress(120)
+
+        repository.save_collection(collection)
+
+        assert "progress" not in setup_test_environment.read_text(encoding="utf-8")
+        assert setup_test_environment.with_suffix(".progress").exists()
+        loaded = repository.load_collection().list_publications()[0]
+        assert loaded.current_page == 120
+        assert repository.load_table().progress[1].pages.tolist() == [120]
+
+    @pytest.mark.parametrize("cut", [2, 10, -3])
+    def test_corrupt_sidecar_is_ignored(self, setup_test_environment, cut):
+        """Test that a truncated progress sidecar loads as no progress instead of failing."""
+        collection = Collection()
+        book = _reading_book()
+        collection.register_publication(book)
+        book.record_progress(120)
+        repository.save_collection(collection)
+        progress_path = setup_test_environment.with_suffix(".progress")
+        progress_path.write_bytes(progress_path.read_bytes()[:cut])
+
+        loaded = repository.load_collection().list_publications()[0]
+
+        assert loaded.title == book.title
+        assert loaded.current_page is None
+        assert repository.load_table().progress == {}
+
+    def test_progress_report_pace(self, sample_configuration):
+        """Test pace and ETA in the progress report, from objects and from a table."""
+        collection = Collection()
+        collection.register_publication(_reading_book(days_ago=9))
+        collection.list_publications()[0].record_progress(100)
+        strategy = ProgressReportStrategy()
+
+        report = strategy.generate(collection.list_publications(), config=sample_configuration)
+
+        entry = report['reading_publications'][0]
+        assert (entry['current_page'], entry['pages_per_day']) == (100, 10.0)
+        assert entry['eta'] == (date.today() + timedelta(days=20)).strftime('%d/%m/%Y')
+        assert report['pages_per_day'] == 10.0
+        assert strategy.generate(collection.table(), config=sample_configuration) == report
+        assert "10.0 páginas/dia" in strategy.format_output(report)
@@ -106,6 +106,15 @@ class TestPublication:
         with pytest.raises(ValueError, match="The rating cannot be less than 0 or greater than 10"):
             sample_book.rate_publication(invalid_rating)
 
+    @pytest.mark.parametrize("off_grid_rating", [8.25, 1 / 3])
+    def test_rating_off_tenths_grid_raises_error(self, sample_book, off_grid_rating):
+        """Test that a rating with more than one decimal place raises ValueError."""
+        sample_book.start_reading()
+        sample_book.finish_reading()
+
+        with pytest.raises(ValueError, match="at most one decimal place"):
+            sample_book.rate_publication(off_grid_rating)
+
     def test_add_annotation(self, sample_book, sample_annotation):
         """Test adding an annotation."""
         sample_book.add_annotation(sample_annotation)
@@ -131,6 +140,51 @@ class TestPublication:
         result = sample_book.remove_annotation("id_inexistente")
         assert result is False
 
+    def test_get_annotation_by_id(self, sample_book, sample_annotation):
+        """Test looking up an annotation by ID."""
+        sample_book.add_annotation(sample_annotation)
+
+        assert sample_book.get_annotation(sample_annotation.id) is sample_annotation
+        assert sample_book.get_annotation("id_inexistente") is None
+
+    def test_add_duplicate_annotation_id_raises_error(self, sample_book, sample_annotation):
+        """Test that annotation IDs are unique within a publication."""
+        sample_book.add_annotation(sample_annotation)
+
+        with pytest.raises(ValueError, match="already exists"):
+            sample_book.add_annotation(Annotation(sample_annotation.id, "Outra"))
+
+    def test_annotation_ids_not_reused_after_removal(self, sample_book):
+        """Test that the annotation counter only moves forward."""
+        for text in ("Primeira", "Segunda"):
+            sample_book.add_annotation(Annotation(sample_book.next_annotation_id(), text))
+        sample_book.remove_annotation("ann_1_1")
+
+        assert sample_book.next_annotation_id() == "ann_1_3"
+
+    def test_annotation_counter_persisted(self, sample_book):
+        """Test that the counter survives serialization, also for old snapshots."""
+        sample_book.add_annotation(Annotation(sample_book.next_annotation_id(), "Primeira"))
+        sample_book.add_annotation(Annotation(sample_book.next_annotation_id(), "Segunda"))
+        sample_book.remove_annotation("ann_1_2")
+        data = sample_book.to_dict()
+        legacy = {key: value for key, value in data.items() if key != "annotation_seq"}
+
+        assert Book.from_dict(data).next_annotation_id() == "ann_1_3"
+        assert Book.from_dict(data, trusted=True).next_annotation_id() == "ann_1_3"
+        assert Book.from_dict(legacy, trusted=True).next_annotation_id() == "ann_1_2"
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_stale_annotation_counter_never_reuses_ids(self, sample_book, trusted):
+        """Test that a stored counter below an existing annotation is raised on both load paths."""
+        for text in ("Primeira", "Segunda", "Terceira"):
+            sample_book.add_annotation(Annotation(sample_book.next_annotation_id(), text))
+        data = dict(sample_book.to_dict(), annotation_seq=1)
+
+        loaded = Book.from_dict(data, trusted=trusted)
+
+        assert loaded.next_annotation_id() == "ann_1_4"
+
     def test_publication_equality(self):
         """Test publication equality based on title and author."""
         book1 = Book(1, "Teste", "Autor", "Editora", 2025, "Gênero", 100)
@@ -140,6 +194,26 @@ class TestPublication:
         assert book1 == book2
         assert book1 != book3
 
+    def test_publication_equality_is_normalized(self):
+        """Test that equality ignores letter case and repeated whitespace."""
+        book1 = Book(1, "O  Cortiço", "Aluísio Azevedo", "Editora", 1890, "Romance", 300)
+        book2 = Book(2, "o cortiço", "ALUÍSIO  AZEVEDO", "Outra", 1990, "Romance", 280)
+
+        assert book1 == book2
+        assert hash(book1) == hash(book2)
+        assert len({book1, book2}) == 1
+
+    def test_hash_follows_title_change(self):
+        """Test that the cached identity is refreshed when the title changes."""
+        book = Book(1, "Título", "Autor", "Editora", 2025, "Gênero", 100)
+        other = Book(2, "Novo Título", "Autor", "Editora", 2025, "Gênero", 100)
+        assert book != other
+
+        book.title = "Novo Título"
+
+        assert book == other
+        assert hash(book) == hash(other)
+
     def test_publication_comparison(self):
         """Test publication comparison by year."""
         book1 = Book(1, "Livro Antigo", "Autor", "Editora", 1900, "Gênero", 100)
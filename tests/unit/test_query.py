@@ -0,0 +1,115 @@
+"""
+Unit tests for Query class.
+"""
+
+import pytest
+from datetime import date
+from src.models import Collection, Book, Magazine, Query
+
+
+@pytest.fixture
+def library():
+    """Create a collection with read, reading and unread publications."""
+    collection = Collection()
+
+    animal_farm = Book(1, "Animal Farm", "George Orwell", "Secker", 1945, "Ficção", 112)
+    animal_farm.start_reading()
+    animal_farm.finish_reading()
+    animal_farm.rate_publication(9.0)
+
+    nineteen = Book(2, "1984", "George Orwell", "Secker", 1949, "Ficção", 328)
+    nineteen.start_reading()
+    nineteen.finish_reading()
+    nineteen.rate_publication(7.5)
+
+    homage = Book(3, "Homage to Catalonia", "George Orwell", "Secker", 1938, "História", 232)
+    homage.start_reading()
+
+    magazine = Magazine(4, "Piauí", "Vários", "Alvinegra", 2025, "Cultura", 80, issue_number=200)
+    magazine.start_reading()
+    magazine.finish_reading()
+    magazine.rate_publication(8.5)
+
+    for pub in (animal_farm, nineteen, homage, magazine):
+        collection.register_publication(pub)
+    return collection
+
+
+class TestQuery:
+    """Test cases for Query class."""
+
+    def test_query_returns_query(self, library):
+        """Test that Collection.query starts an unfiltered query."""
+        query = library.query()
+
+        assert isinstance(query, Query)
+        assert len(query.all()) == 4
+
+    def test_combined_filters(self, library):
+        """Test combining status, type, author and rating filters."""
+        today = date.today()
+        results = (
+            library.query()
+            .filter(status="read", type="Book")
+            .author_contains("orwell")
+            .rating_between(min_rating=8)
+            .finished_between(date(today.year, 1, 1), date(today.year, 12, 31))
+            .all()
+        )
+
+        assert [pub.title for pub in results] == ["Animal Farm"]
+
+    def test_filter_with_multiple_values(self, library):
+        """Test that a list value matches any of its elements."""
+        results = library.query().filter(genre=["História", "Cultura"]).all()
+
+        assert {pub.id for pub in results} == {3, 4}
+
+    def test_filter_unknown_field_raises_error(self, library):
+        """Test that filtering by an unknown field raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown field"):
+            library.query().filter(color="blue")
+
+    def test_filter_by_id_uses_lookup(self, library):
+        """Test that an id filter avoids a full scan."""
+        query = library.query().filter(id=[2, 99])
+
+        assert [pub.title for pub in query] == ["1984"]
+        assert "id lookup" in query.explain()
+
+    def test_order_by_rating_with_limit(self, library):
+        """Test descending order with limit and offset."""
+        query = library.query().order_by("rating", descending=True)
+
+        assert [pub.id for pub in query.limit(2)] == [1, 4]
+        assert [pub.id for pub in query.offset(1).limit(2)] == [4, 2]
+        assert query.all()[-1].rating is None
+
+    def test_select_projection(self, library):
+        """Test that select yields dictionaries with the chosen fields."""
+        results = library.query().filter(id=1).select("id", "title").all()
+
+        assert results == [{"id": 1, "title": "Animal Farm"}]
+
+    def test_builder_does_not_mutate_original(self, library):
+        """Test that chained calls return new queries."""
+        base = library.query()
+        base.filter(status="READING")
+
+        assert base.count() == 4
+
+    def test_limit_stops_early(self, library):
+        """Test that a limited query stops consuming candidates once satisfied."""
+        seen = []
+
+        def spy(pub):
+            seen.append(pub.id)
+            return True
+
+        assert len(library.query().where(spy).limit(1).all()) == 1
+        assert seen == [1]
+
+    def test_first_and_empty_result(self, library):
+        """Test first() on matching and non-matching queries."""
+        assert library.query().title_contains("catalonia").first().id == 3
+        assert library.query().filter(year=1500).first() is None
@@ -0,0 +1,151 @@
+"""
+Unit tests for the repository ID sequence and report cache.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from src.data import repository
+from src.models.report_cache import ReportCache
+
+
+class TestIdSequence:
+    """Test cases for allocate_ids/allocate_id."""
+
+    def test_allocate_id_is_monotonic(self, setup_test_environment):
+        """Test that consecutive allocations never repeat."""
+        assert repository.allocate_id() == 1
+        assert repository.allocate_id() == 2
+        assert setup_test_environment.with_suffix(".seq").read_text() == "2"
+
+    def test_allocate_block(self, setup_test_environment):
+        """Test reserving a block of IDs for a bulk import."""
+        block = repository.allocate_ids(100)
+
+        assert block == range(1, 101)
+        assert repository.allocate_id() == 101
+
+    def test_floor_skips_ids_in_use(self, setup_test_environment):
+        """Test that the sequence starts above IDs already in the library."""
+        assert repository.allocate_id(floor=41) == 42
+        assert repository.allocate_id(floor=10) == 43
+
+    def test_invalid_count_raises_error(self, setup_test_environment):
+        """Test that a non-positive block size is rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            repository.allocate_ids(0)
+
+    def test_concurrent_allocations_are_disjoint(self, setup_test_environment):
+        """Test that concurrent writers never receive the same ID."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(lambda _: repository.allocate_id(), range(50)))
+
+        assert sorted(ids) == list(range(1, 51))
+
+    def test_held_lock_times_out(self, setup_test_environment):
+        """Test that allocation gives up while another writer holds the lock."""
+        lock = setup_test_environment.with_suffix(".seq.lock")
+
+        with repository._file_lock(lock):
+            with pytest.raises(TimeoutError):
+                with repository._file_lock(lock, timeout=0.05):
+                    pass
+
+    def test_leftover_lock_file_is_not_stale(self, setup_test_environment):
+        """Test that a lock file left by a crashed writer does not block allocation."""
+        setup_test_environment.parent.mkdir(parents=True, exist_ok=True)
+        setup_test_environment.with_suffix(".seq.lock").touch()
+
+        assert repository.allocate_id() == 1
+
+
+class TestReportCache:
+    """Test cases for the persisted report cache."""
+
+    def test_round_trip_and_version_invalidation(self, setup_test_environment):
+        """Test that entries survive a save and are dropped for a new version."""
+        cache = repository.load_report_cache()
+        cache.put("top_rated", {"limit": 5}, "v1", "saida")
+        repository.save_report_cache(cache)
+
+        loaded = repository.load_report_cache()
+        assert loaded.get("top_rated", {"limit": 5}, "v1") == "saida"
+        assert loaded.get("top_rated", {"limit": 5}, "v2") is None
+        assert len(loaded) == 0
+
+    def test_snapshot_version_follows_content(self, setup_test_environment, sample_collection):
+        """Test that saving a changed library changes its version."""
+        empty = repository.snapshot_version()
+        repository.save_collection(sample_collection)
+        saved = repository.snapshot_version()
+
+        assert saved != empty
+        assert repository.snapshot_version() == saved
+
+    def test_snapshot_version_reuses_loaded_bytes(self, setup_test_environment, sample_collection, monkeypatch):
+        """Test that the version after a load is derived without reading the library again."""
+        repository.save_collection(sample_collection)
+        repository._file_digests.clear()
+        fresh = repository.snapshot_version()
+        repository._file_digests.clear()
+        repository.load_collection()
+
+        def fail(path):
+            raise AssertionError(f"{path} read again")
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        assert repository.snapshot_version() == fresh
+
+    def test_snapshot_version_sees_outside_edits(self, setup_test_environment, sample_collection):
+        """Test that a change made by another writer is picked up through the file signature."""
+        repository.save_collection(sample_collection)
+        saved = repository.snapshot_version()
+        setup_test_environment.write_text("[]", encoding="utf-8")
+
+        assert repository.snapshot_version() != saved
+
+    def test_oldest_entries_evicted(self):
+        """Test that the cache keeps at most max_entries reports."""
+        cache = ReportCache(max_entries=2)
+        for limit in (1, 2, 3):
+            cache.put("top_rated", {"limit": limit}, "v1", str(limit))
+
+        assert cache.get("top_rated", {"limit": 1}, "v1") is None
+        assert cache.get("top_rated", {"limit": 3}, "v1") == "3"
+
+    def test_corrupt_cache_is_ignored(self, setup_test_environment):
+        """Test that an unreadable cache file is treated as empty."""
+        setup_test_environment.with_suffix(".reports").write_text("{", encoding="utf-8")
+
+        assert len(repository.load_report_cache()) == 0
+
+
+class TestRollupsPersistence:
+    """Test cases for the reading rollups saved next to the library."""
+
+    def test_saved_with_collection_and_restored(self, setup_test_environment, populated_collection):
+        """Test that a loaded library adopts the rollups saved with it."""
+        populated_collection.rollups
+        repository.save_collection(populated_collection)
+
+        loaded = repository.load_collection()
+
+        assert setup_test_environment.with_suffix(".rollups").exists()
+        assert loaded._rollups is not None
+        assert loaded.rollups.to_dict() == populated_collection.rollups.to_dict()
+
+    def test_stale_rollups_ignored(self, setup_test_environment, populated_collection):
+        """Test that rollups of another library version are not used."""
+        populated_collection.rollups
+        repository.save_collection(populated_collection)
+        repository.save_progress(populated_collection.list_publications())
+        setup_test_environment.write_text("[]", encoding="utf-8")
+
+        assert repository.load_rollups() is None
+        assert repository.load_collection()._rollups is None
+
+    def test_save_does_not_build_rollups(self, setup_test_environment, populated_collection):
+        """Test that saving a collection whose rollups were never read skips them."""
+        repository.save_collection(populated_collection)
+
+        assert populated_collection._rollups is None
+        assert not setup_test_environment.with_suffix(".rollups").exists()
\ No newline at end of file
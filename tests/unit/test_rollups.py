@@ -0,0 +1,105 @@
+"""
+Unit tests for the ReadingRollups per-month and per-year totals.
+"""
+
+from datetime import date
+from src.models import Book, Collection, Publication
+from src.models.rollups import PeriodTotals, ReadingRollups
+
+
+def _finished_book(pub_id: int, pages: int, end: str, rating=None, history=()) -> Publication:
+    """Create a READ book finished on a given date, with optional earlier readings."""
+    return Publication.from_dict({
+        'type': 'Book', 'pub_id': pub_id, 'title': f"Livro {pub_id}", 'author': "Autor",
+        'publisher': "Editora", 'year': 2020, 'genre': "Ficção", 'number_of_pages': pages,
+        'status': "READ", 'start_read_date': end, 'end_read_date': end, 'rating': rating,
+        'rating_inclusion_date': end if rating is not None else None, 'annotations': [],
+        'reading_history': [
+            {'start_read_date': day, 'end_read_date': day, 'rating': value} for day, value in history
+        ],
+    })
+
+
+def _collection() -> Collection:
+    """Create a collection with readings finished over 2023 and 2024."""
+    collection = Collection()
+    collection.register_publication(_finished_book(1, 100, "2023-03-10", 8.0))
+    collection.register_publication(_finished_book(2, 300, "2024-03-02", 6.0, history=[("2023-03-20", 9.0)]))
+    collection.register_publication(_finished_book(3, 200, "2024-11-15"))
+    collection.register_publication(Book(4, "Não lido", "Autor", "Editora", 2020, "Ficção", 50))
+    return collection
+
+
+def _assert_matches_rebuild(collection: Collection) -> None:
+    """Check that the maintained rollups equal rollups computed from scratch."""
+    rebuilt = ReadingRollups.build(collection.list_publications())
+    assert collection.rollups.to_dict() == rebuilt.to_dict()
+
+
+class TestReadingRollups:
+    """Test cases for the rollups maintained by Collection."""
+
+    def test_month_and_year_totals(self):
+        """Test the totals built on first access, archived readings included."""
+        rollups = _collection().rollups
+
+        assert rollups.month(2023, 3) == PeriodTotals(2, 400, 17.0, 2)
+        assert rollups.month(2023, 4) == PeriodTotals()
+        assert rollups.year(2024) == PeriodTotals(2, 500, 6.0, 1)
+        assert rollups.year(2023).average_rating == 8.5
+        assert rollups.years() == [2023, 2024]
+
+    def test_history_includes_empty_years(self):
+        """Test the per-year totals of a range."""
+        history = _collection().rollups.history(2022, 2024)
+
+        assert list(history) == [2022, 2023, 2024]
+        assert history[2022].is_empty()
+        assert history[2024].pages == 500
+
+    def test_follows_changes(self):
+        """Test that finishing, rating, re-reading, page edits and removals update the rollups."""
+        collection = _collection()
+        collection.rollups
+        this_month = date.today()
+
+        book = next(pub for pub in collection.list_publications() if pub.id == 4)
+        book.start_reading()
+        book.finish_reading()
+        book.rate_publication(7.0)
+        reread = next(pub for pub in collection.list_publications() if pub.id == 1)
+        reread.start_reading()
+        collection.list_publications()[2].number_of_pages = 250
+        collection.remove_publication(2)
+
+        assert collection.rollups.month(this_month.year, this_month.month) == PeriodTotals(1, 50, 7.0, 1)
+        assert collection.rollups.month(2023, 3) == PeriodTotals(1, 100, 8.0, 1)
+        assert collection.rollups.year(2024) == PeriodTotals(1, 250, 0.0, 0)
+        _assert_matches_rebuild(collection)
+
+    def test_round_trip(self):
+        """Test that to_dict and from_dict preserve every month."""
+        rollups = _collection().rollups
+        restored = ReadingRollups.from_dict(rollups.to_dict())
+
+        assert restored.to_dict() == rollups.to_dict()
+        assert list(rollups.to_dict()) == ["2023-03", "2024-03", "2024-11"]
+
+    def test_rating_sum_does_not_drift(self):
+        """Test that many rating edits end exactly on the rollups of a rebuild, through a round trip."""
+        collection = _collection()
+        collection.rollups
+        book = next(pub for pub in collection.list_publications() if pub.id == 1)
+        ratings = [0.1, 0.2, 0.3, 7.3, 9.7, 9.8, 7.1, 3.3, 8.9, 6.6]
+        for round_ in range(300):
+            book.rate_publication(ratings[(round_ * 7) % 10])
+
+        book.rate_publication(0.1)
+        assert collection.rollups.month(2023, 3) == PeriodTotals(2, 400, 9.1, 2)
+        _assert_matches_rebuild(collection)
+
+        # Notas fora da grade de 0.1 só chegam por arquivos carregados
+        collection.register_publication(_finished_book(5, 10, "2023-03-05", 1 / 3))
+        restored = ReadingRollups.from_dict(collection.rollups.to_dict())
+        assert restored.month(2023, 3).average_rating == collection.rollups.month(2023, 3).average_rating
+        _assert_matches_rebuild(collection)
\ No newline at end of file
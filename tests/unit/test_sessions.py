@@ -0,0 +1,102 @@
+"""
+Unit tests for reading sessions and re-read history.
+"""
+
+from datetime import date
+from src.models import Book, Collection, Report
+from src.models.sessions import ReadingSession, count_by_year, finished_between
+from src.strategies import ProgressReportStrategy
+
+
+def _reread_book(pub_id: int = 1, title: str = "Livro Relido") -> Book:
+    """Create a book read last year (rated 7) and read again this year (rated 9)."""
+    book = Book(pub_id, title, "Autor", "Editora", 2000, "Ficção", 200)
+    book.start_reading()
+    book.finish_reading()
+    book.rate_publication(7.0)
+    book._start_read_date = date(date.today().year - 1, 3, 1)
+    book._end_read_date = date(date.today().year - 1, 3, 20)
+    book.start_reading()
+    book.finish_reading()
+    book.rate_publication(9.0)
+    return book
+
+
+class TestReadingSessions:
+    """Test cases for reading history."""
+
+    def test_reread_archives_previous_reading(self):
+        """Test that starting a READ publication again keeps the past reading."""
+        book = _reread_book()
+        last_year = date.today().year - 1
+
+        assert book.past_sessions == (ReadingSession(date(last_year, 3, 1), date(last_year, 3, 20), 7.0),)
+        assert book.rating == 9.0
+        assert book.times_read == 2
+        assert [session.rating for session in book.reading_sessions()] == [7.0, 9.0]
+
+    def test_reading_in_progress_is_last_session(self, read_book):
+        """Test that a reading in progress appears without end date."""
+        read_book.start_reading()
+
+        assert read_book.reading_sessions()[-1].end_read_date is None
+        assert read_book.times_read == 1
+
+    def test_history_survives_serialization(self):
+        """Test that the history round-trips in strict and trusted modes."""
+        book = _reread_book()
+        data = book.to_dict()
+
+        assert Book.from_dict(data).past_sessions == book.past_sessions
+        assert Book.from_dict(data, trusted=True).past_sessions == book.past_sessions
+
+    def test_aggregation_helpers(self):
+        """Test counting readings per year and per period."""
+        books = [_reread_book(1, "Relido"), Book(2, "Nunca lido", "Autor", "Editora", 2000, "Ficção", 100)]
+        this_year = date.today().year
+
+        assert count_by_year(books) == {this_year - 1: 1, this_year: 1}
+        assert len(finished_between(books, date(this_year - 1, 1, 1), date(this_year, 12, 31))) == 2
+
+    def test_collection_session_index(self, populated_collection):
+        """Test that the session index counts re-reads and follows new readings."""
+        today = date.today()
+        assert populated_collection.count_finished_between(today, today) == 2
+
+        populated_collection.register_publication(_reread_book(6))
+        populated_collection.search_by_title("Livro em Leitura")[0].finish_reading()
+
+        assert populated_collection.count_finished_between(today, today) == 4
+        assert populated_collection.finished_counts_by_year() == {today.year - 1: 1, today.year: 4}
+        populated_collection.remove_publication(6)
+        assert populated_collection.finished_counts_by_year() == {today.year: 3}
+
+    def test_filter_by_reading_period_includes_archived_reading(self):
+        """Test that a publication being re-read still counts for its earlier reading."""
+        collection = Collection()
+        book = _reread_book()
+        book.start_reading()
+        collection.register_publication(book)
+        last_year = date.today().year - 1
+
+        results = collection.filter_by_reading_period(date(last_year, 1, 1), date(last_year, 12, 31))
+
+        assert results == [book]
+
+    def test_annual_goal_counts_rereads(self, sample_configuration):
+        """Test that yearly reports count every reading finished in the year."""
+        collection = Collection()
+        book = _reread_book()
+        book._start_read_date = date(date.today().year, 1, 1)
+        book._end_read_date = date(date.today().year, 1, 2)
+        book.start_reading()
+        book.finish_reading()
+        collection.register_publication(book)
+
+        assert Report.check_annual_goal_progress(collection, sample_configuration)["completed"] == 2
+        assert Report.check_annual_goal_progress(collection.table(), sample_configuration)["completed"] == 2
+        progress = ProgressReportStrategy()
+        report = progress.generate(collection.list_publications(), config=sample_configuration)
+        assert report["completed"] == 2
+        assert report["pages_read"] == 400
+        assert progress.generate(collection.table(), config=sample_configuration) == report
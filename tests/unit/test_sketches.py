@@ -0,0 +1,62 @@
+"""
+Unit tests for the QuantileSketch streaming quantile estimator.
+"""
+
+import random
+import pytest
+from src.models.sketches import QuantileSketch
+
+
+def _values(count: int = 20_000) -> list:
+    """Create reproducible normally distributed values."""
+    generator = random.Random(7)
+    return [generator.gauss(7, 1.5) for _ in range(count)]
+
+
+class TestQuantileSketch:
+    """Test cases for QuantileSketch."""
+
+    def test_exact_below_compression(self):
+        """Test that small inputs give exact interpolated quantiles."""
+        sketch = QuantileSketch()
+        sketch.extend([4, 1, 3, 2])
+
+        assert sketch.quantile(0.5) == 2.5
+        assert sketch.quantile(0) == 1
+        assert sketch.quantile(1) == 4
+
+    def test_accuracy_and_bounded_size(self):
+        """Test that estimates stay close to the exact quantiles in bounded memory."""
+        values = _values()
+        ordered = sorted(values)
+        sketch = QuantileSketch(compression=100)
+        sketch.extend(values)
+
+        for q in (0.01, 0.1, 0.5, 0.9, 0.99):
+            assert sketch.quantile(q) == pytest.approx(ordered[int(q * len(ordered))], abs=0.05)
+        assert len(sketch.centroids()) <= 200
+        assert sum(weight for _, weight in sketch.centroids()) == len(values)
+
+    def test_merge_matches_single_sketch(self):
+        """Test that sketches built per shard merge into an equivalent summary."""
+        values = _values()
+        whole = QuantileSketch()
+        whole.extend(values)
+        merged = QuantileSketch()
+        for start in range(0, len(values), 3000):
+            shard = QuantileSketch()
+            shard.extend(values[start:start + 3000])
+            merged.merge(shard)
+
+        assert merged.count == whole.count
+        assert (merged.minimum, merged.maximum) == (whole.minimum, whole.maximum)
+        for q in (0.1, 0.5, 0.9):
+            assert merged.quantile(q) == pytest.approx(whole.quantile(q), abs=0.05)
+
+    def test_empty_and_invalid(self):
+        """Test an empty sketch and out-of-range arguments."""
+        assert QuantileSketch().quantile(0.5) is None
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(1.5)
+        with pytest.raises(ValueError):
+            QuantileSketch(compression=0)
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+Unit tests for the CollectionStats running totals.
+"""
+
+from datetime import date
+from src.models import Book, Collection, Publication, Report
+from src.models.stats import CollectionStats
+
+
+def _publication(collection: Collection, pub_id: int):
+    """Get a publication of the collection by ID."""
+    return next(pub for pub in collection.list_publications() if pub.id == pub_id)
+
+
+def _assert_matches_rebuild(collection: Collection) -> None:
+    """Check that the maintained totals equal totals computed from scratch."""
+    maintained = collection.stats
+    rebuilt = CollectionStats.build(collection.list_publications())
+    assert maintained.total == rebuilt.total == len(collection)
+    assert maintained.status_counts == rebuilt.status_counts
+    assert maintained.rating_count == rebuilt.rating_count
+    assert maintained.rating_sum == rebuilt.rating_sum
+    assert maintained.completions_by_year == rebuilt.completions_by_year
+
+
+class TestCollectionStats:
+    """Test cases for the aggregates maintained by Collection."""
+
+    def test_initial_totals(self, populated_collection):
+        """Test the totals computed on first access."""
+        stats = populated_collection.stats
+
+        assert stats.total == 5
+        assert stats.status_counts == {"UNREAD": 2, "READING": 1, "READ": 2}
+        assert stats.average_rating == 8.75
+        assert stats.completions_in(date.today().year) == 2
+
+    def test_follows_registration_and_removal(self, populated_collection):
+        """Test that registering and removing publications update the totals."""
+        populated_collection.stats
+        populated_collection.register_publication(Book(10, "Novo", "Autor", "Editora", 2020, "Ficção", 100))
+        populated_collection.remove_publication(5)
+
+        assert populated_collection.stats.status_counts == {"UNREAD": 3, "READING": 1, "READ": 1}
+        assert populated_collection.stats.average_rating == 8.5
+        _assert_matches_rebuild(populated_collection)
+
+    def test_follows_reading_and_rating(self, populated_collection):
+        """Test that status and rating changes update the totals, re-reads included."""
+        populated_collection.stats
+        book = _publication(populated_collection, 1)
+        book.start_reading()
+        book.finish_reading()
+        book.rate_publication(6.0)
+        reread = _publication(populated_collection, 4)
+        reread.start_reading()
+
+        stats = populated_collection.stats
+        assert stats.status_counts == {"UNREAD": 1, "READING": 2, "READ": 2}
+        assert stats.average_rating == 7.5
+        assert stats.completions_in(date.today().year) == 3
+        _assert_matches_rebuild(populated_collection)
+
+    def test_empty_collection(self):
+        """Test the totals of an empty collection."""
+        stats = Collection().stats
+
+        assert stats.total == 0
+        assert stats.average_rating is None
+        assert stats.status_breakdown()["READ"] == (0, 0.0)
+
+    def test_report_reads_maintained_totals(self, populated_collection):
+        """Test that Report answers from the totals and agrees with the table path."""
+        _publication(populated_collection, 2).start_reading()
+        table = populated_collection.table()
+
+        assert Report.check_total_publications(populated_collection) == 5
+        assert Report.check_publications_by_status(populated_collection) == Report.check_publications_by_status(table)
+        assert Report.calculate_average_rating(populated_collection) == Report.calculate_average_rating(table)
+        assert populated_collection._stats is not None
+
+    def test_rating_sum_does_not_drift(self, populated_collection):
+        """Test that many rating edits end exactly on the figures of a rebuild."""
+        populated_collection.stats
+        ratings = [0.1, 0.2, 0.3, 7.3, 9.7, 9.8, 7.1, 3.3, 8.9, 6.6]
+        for round_ in range(300):
+            for pub_id, rating in ((4, ratings[round_ % 10]), (5, ratings[(round_ * 7) % 10])):
+                _publication(populated_collection, pub_id).rate_publication(rating)
+
+        _publication(populated_collection, 4).rate_publication(9.7)
+        _publication(populated_collection, 5).rate_publication(0.1)
+        stats = populated_collection.stats
+        rebuilt = CollectionStats.build(populated_collection.list_publications())
+        assert stats.average_rating == rebuilt.average_rating == 4.9
+        _assert_matches_rebuild(populated_collection)
+
+        # Notas fora da grade de 0.1 só chegam por arquivos carregados
+        loaded = _publication(populated_collection, 4).to_dict()
+        loaded.update(pub_id=20, title="Carregado", rating=1 / 3)
+        populated_collection.register_publication(Publication.from_dict(loaded))
+        _assert_matches_rebuild(populated_collection)
+        populated_collection.remove_publication(20)
+        assert populated_collection.stats.average_rating == 4.9
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+Unit tests for SymbolTable and the dictionary-encoded snapshot format.
+"""
+
+import json
+import pytest
+from src.models import Book, Collection
+from src.models.symbols import SymbolTable, decode_records, encode_records
+from src.data import repository
+
+
+def _fresh(text: str) -> str:
+    """Build a str equal to text but stored in a new object."""
+    return "".join(list(text))
+
+
+class TestSymbolTable:
+    """Test cases for SymbolTable class."""
+
+    def test_intern_returns_shared_instance(self):
+        """Test that equal values come back as the same object."""
+        symbols = SymbolTable()
+        first = symbols.intern(_fresh("George Orwell"))
+        second = symbols.intern(_fresh("George Orwell"))
+
+        assert first is second
+        assert len(symbols) == 1
+
+    def test_codes_are_stable(self):
+        """Test that codes follow insertion order and decode back."""
+        symbols = SymbolTable(["Ficção", "Ciência"])
+
+        assert symbols.code("Ciência") == 1
+        assert symbols.code("História") == 2
+        assert symbols.value(2) == "História"
+        assert symbols.values() == ["Ficção", "Ciência", "História"]
+
+    def test_lower_is_cached(self):
+        """Test the cached lowercase form."""
+        symbols = SymbolTable()
+
+        assert symbols.lower("Autor A") == "autor a"
+        assert symbols.lower("Autor A") is symbols.lower("Autor A")
+
+    def test_collection_interns_publication_fields(self):
+        """Test that registering publications shares their repeated strings."""
+        collection = Collection()
+        book1 = Book(1, "Livro 1", _fresh("Autor"), _fresh("Editora"), 2020, _fresh("Ficção"), 100)
+        book2 = Book(2, "Livro 2", _fresh("Autor"), _fresh("Editora"), 2021, _fresh("Ficção"), 100)
+
+        collection.register_publication(book1)
+        collection.register_publication(book2)
+
+        assert book1.author is book2.author
+        assert book1.publisher is book2.publisher
+        assert book1.genre is book2.genre
+        assert len(collection.symbols) == 3
+
+    def test_encode_decode_roundtrip(self, populated_collection):
+        """Test that the encoded format decodes back to the same records."""
+        records = populated_collection.to_dict()["publications"]
+
+        encoded = encode_records(records)
+
+        assert encoded["symbols"].count("Editora") == 1
+        assert encoded["publications"][0]["publisher"] == encoded["symbols"].index("Editora")
+        assert decode_records(json.loads(json.dumps(encoded))) == records
+
+    def test_decode_unknown_format_raises_error(self):
+        """Test that an unknown snapshot format is rejected."""
+        with pytest.raises(ValueError, match="Unknown snapshot format"):
+            decode_records({"format": "columns", "publications": []})
+
+    def test_save_encoded_collection_loads_back(self, setup_test_environment, populated_collection):
+        """Test saving dictionary-encoded and loading through every loader."""
+        repository.save_collection(populated_collection, encoded=True)
+
+        with open(setup_test_environment, encoding="utf-8") as f:
+            assert json.load(f)["format"] == "dictionary"
+        loaded = repository.load_collection()
+        strict = repository.load_collection(trusted=False)
+
+        assert loaded.to_dict() == populated_collection.to_dict()
+        assert strict.to_dict() == populated_collection.to_dict()
+        assert len(repository.load_publications()) == 5
+        assert len(repository.load_table()) == 5
+        publishers = {id(pub.publisher) for pub in loaded.list_publications()}
+        assert len(publishers) == 1
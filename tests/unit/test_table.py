@@ -0,0 +1,128 @@
+"""
+Unit tests for PublicationTable class.
+"""
+
+import math
+from datetime import date
+from src.models import Book, Collection, Configuration, PublicationTable, Report
+from src.data import repository
+from src.strategies import EvaluationReportStrategy, ProgressReportStrategy, TopRatedReportStrategy
+
+
+class TestPublicationTable:
+    """Test cases for PublicationTable class."""
+
+    def test_from_publications_builds_columns(self, populated_collection):
+        """Test copying publications into columns."""
+        table = PublicationTable.from_publications(populated_collection.list_publications())
+
+        assert len(table) == 5
+        assert 4 in table
+        assert sorted(table.ids) == [1, 2, 3, 4, 5]
+        assert sum(table.pages) == 1800
+        assert table.status.counts() == {"UNREAD": 2, "READING": 1, "READ": 2}
+        assert math.isnan(table.ratings[0])
+
+    def test_dictionary_column_stores_each_value_once(self, populated_collection):
+        """Test that repeated strings share a single dictionary entry."""
+        table = PublicationTable.from_publications(populated_collection.list_publications())
+
+        assert table.publishers.values == ["Editora"]
+        assert list(table.publishers.codes) == [0] * 5
+
+    def test_row_decodes_publication_fields(self, read_book):
+        """Test decoding a row back into field values."""
+        read_book.rate_publication(8.0)
+        table = PublicationTable.from_publications([read_book])
+
+        row = table.row(0)
+
+        assert row.title == read_book.title
+        assert row.rating == 8.0
+        assert row.pub_type == "Book"
+        assert row.end_read_date == read_book.end_read_date
+
+    def test_collection_table_follows_changes(self, populated_collection):
+        """Test that Collection.table() is kept in sync incrementally."""
+        table = populated_collection.table()
+        populated_collection.search_by_title("Livro em Leitura")[0].finish_reading()
+        populated_collection.register_publication(Book(6, "Novo", "Autor F", "Outra", 2020, "Ficção", 100))
+        populated_collection.remove_publication(1)
+
+        assert populated_collection.table() is table
+        assert len(table) == 5
+        assert 1 not in table
+        assert table.status.counts() == {"UNREAD": 2, "READ": 3}
+        assert sorted(table.ids) == [2, 3, 4, 5, 6]
+
+    def test_remove_keeps_rows_aligned(self, populated_collection):
+        """Test that moving the last row into a freed slot keeps columns aligned."""
+        table = PublicationTable.from_publications(populated_collection.list_publications())
+
+        table.remove(2)
+
+        rows = {row.id: row for row in table.rows()}
+        assert rows[5].title == "Livro Lido 2"
+        assert rows[5].rating == 9.0
+        assert rows[5].genre == "Fantasia"
+
+    def test_rated_values_with_selector(self, populated_collection):
+        """Test reading ratings restricted to a status."""
+        table = populated_collection.table()
+
+        assert sorted(table.rated_values(table.status.mask("READ"))) == [8.5, 9.0]
+        assert list(table.rated_values(table.status.mask("UNREAD"))) == []
+
+    def test_load_table_from_snapshot(self, setup_test_environment, populated_collection):
+        """Test building a table straight from the saved records."""
+        repository.save_publication(populated_collection.list_publications())
+
+        table = repository.load_table()
+
+        assert len(table) == 5
+        assert sorted(table.rated_values()) == [8.5, 9.0]
+        assert table.row(table._row_of[4]).end_read_date == date.today()
+
+    def test_load_table_missing_file(self, setup_test_environment):
+        """Test that a missing file gives an empty table."""
+        assert len(repository.load_table()) == 0
+
+    def test_report_matches_on_table(self, collection_for_annual_goal, sample_configuration):
+        """Test that Report gives the same answers from a table and a collection."""
+        collection = collection_for_annual_goal
+        collection.search_by_title("Livro 1")[0].rate_publication(7.0)
+        table = collection.table()
+
+        assert Report.check_total_publications(table) == Report.check_total_publications(collection)
+        assert Report.check_publications_by_status(table) == Report.check_publications_by_status(collection)
+        assert Report.calculate_average_rating(table) == Report.calculate_average_rating(collection)
+        assert Report.check_annual_goal_progress(table, sample_configuration) == \
+            Report.check_annual_goal_progress(collection, sample_configuration)
+        assert [row.id for row in Report.check_top_5_publications(table)] == \
+            [pub.id for pub in Report.check_top_5_publications(collection)]
+
+    def test_strategies_match_on_table(self, collection_with_ratings, sample_configuration):
+        """Test that the report strategies give the same data from a table."""
+        collection = collection_with_ratings
+        collection.register_publication(Book(9, "Em leitura", "Autor", "Editora", 2020, "Ficção", 90))
+        collection.start_publication_reading(9, sample_configuration)
+        publications = collection.list_publications()
+        table = collection.table()
+
+        for strategy in (EvaluationReportStrategy(), TopRatedReportStrategy()):
+            assert strategy.generate(table, limit=3) == strategy.generate(publications, limit=3)
+        progress = ProgressReportStrategy()
+        assert progress.generate(table, config=sample_configuration) == \
+            progress.generate(publications, config=sample_configuration)
+
+
+    def test_chunks_are_standalone_tables(self, populated_collection):
+        """Test that slicing copies rows with compact dictionaries and sparse data."""
+        table = PublicationTable.from_publications(populated_collection.list_publications())
+
+        chunks = list(table.chunks(2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert [row for chunk in chunks for row in chunk.rows()] == list(table.rows())
+        assert chunks[1].authors.values == [table.authors[2], table.authors[3]]
+        assert 3 in chunks[1] and 1 not in chunks[1]
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Unit tests for the column kernels and their optional NumPy backend.
+"""
+
+import pytest
+from datetime import date, timedelta
+from src.models import Book, Collection, Configuration, PublicationTable, vectorized
+from src.strategies import EvaluationReportStrategy, ProgressReportStrategy, TopRatedReportStrategy
+
+
+def _library(count: int = 60) -> Collection:
+    """Create a collection with readings finished over several years, some re-read."""
+    collection = Collection()
+    today = date.today()
+    for i in range(count):
+        book = Book(i + 1, f"Livro {i:03d}", "Autor", "Editora", 2000, "Ficção", 100 + 7 * i)
+        if i % 4 != 3:
+            book.start_reading()
+        if i % 4 in (0, 1):
+            book.finish_reading()
+            book.rate_publication((i * 3) % 21 / 2)
+            book._end_read_date = today - timedelta(days=97 * i)
+        if i % 8 == 0:
+            book.start_reading()
+            book.finish_reading()
+        collection.register_publication(book)
+    return collection
+
+
+class TestStdlibKernels:
+    """Test the standard library kernels, always available."""
+
+    def test_kernels_match_row_scans(self):
+        """Test each kernel against a plain scan of the rows."""
+        table = _library().table()
+        rows = list(table.rows())
+        first, last = date(date.today().year, 1, 1), date(date.today().year, 12, 31)
+
+        with vectorized.use_numpy(False):
+            ended = vectorized.rows_ended_between(table.end_ordinals, first, last)
+            reading = vectorized.rows_in_progress(table.start_ordinals, table.end_ordinals)
+            stats = vectorized.rating_stats(table.ratings).result()
+
+            assert ended == [i for i, row in enumerate(rows) if row.end_read_date and first <= row.end_read_date <= last]
+            assert reading == [i for i, row in enumerate(rows) if row.start_read_date and not row.end_read_date]
+            assert vectorized.sum_rows(table.pages, ended) == sum(rows[i].number_of_pages for i in ended)
+            assert stats["count"] == sum(1 for row in rows if row.rating is not None)
+
+    def test_table_counts_by_year_match_collection(self):
+        """Test that the table counts finished readings per year like the collection."""
+        collection = _library()
+
+        with vectorized.use_numpy(False):
+            assert collection.table().finished_counts_by_year() == collection.finished_counts_by_year()
+
+    def test_use_numpy_restores_previous_backend(self):
+        """Test that the backend switch is scoped to the block."""
+        before = vectorized.enabled()
+        with vectorized.use_numpy(False):
+            assert not vectorized.enabled()
+        assert vectorized.enabled() == before
+
+
+class TestNumpyParity:
+    """Test that the NumPy kernels give the stdlib output (skipped without NumPy)."""
+
+    @pytest.fixture(autouse=True)
+    def require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def test_kernels_identical(self):
+        """Test every kernel under both backends."""
+        table = _library(200).table()
+        first, last = date(date.today().year - 3, 1, 1), date(date.today().year, 12, 31)
+
+        def run():
+            ended = vectorized.rows_ended_between(table.end_ordinals, first, last)
+            ratings = vectorized.rating_stats(table.ratings)
+            return (
+                ended,
+                vectorized.rows_in_progress(table.start_ordinals, table.end_ordinals),
+                vectorized.sum_rows(table.pages, ended),
+                vectorized.counts_by_year(table.end_ordinals),
+                (ratings.bins, ratings.labels, ratings.order),
+            )
+
+        with vectorized.use_numpy(True):
+            fast = run()
+        with vectorized.use_numpy(False):
+            slow = run()
+        assert fast == slow
+
+    @pytest.mark.parametrize("strategy, kwargs", [
+        (EvaluationReportStrategy(), {}),
+        (TopRatedReportStrategy(), {'limit': 10}),
+        (ProgressReportStrategy(), {'config': Configuration(annual_goal=12, simultaneous_reading_limit=3)}),
+    ])
+    def test_strategies_identical(self, strategy, kwargs):
+        """Test that strategies produce the same report on both backends."""
+        table = _library(200).table()
+
+        with vectorized.use_numpy(True):
+            fast = strategy.generate(table, **kwargs)
+        with vectorized.use_numpy(False):
+            slow = strategy.generate(table, **kwargs)
+        assert fast == slow
\ No newline at end of file